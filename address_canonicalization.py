@@ -0,0 +1,143 @@
+from __future__ import annotations
+import json
+import unicodedata
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from models.validation.address_validation import AddressValidator
+from models.validation.chain import detach, unroll_chain
+
+EXCLUDED_FIELDS: FrozenSet[str] = frozenset({"isPrimary", "_id", "id"})
+
+
+def canonical_value(value: Any) -> Any:
+    """
+    Returns string in canonical form: NFKC-normalized, with whitespace runs collapsed to single space and stripped.
+    Other values are returned as is.
+
+    :param value: Field value.
+    """
+
+    return " ".join(unicodedata.normalize("NFKC", value).split()) if isinstance(value, str) else value
+
+
+def canonicalize(address: Dict) -> Dict:
+    """
+    Returns copy of address which string fields are in canonical form.
+
+    :param address: Address fields presented in form of dictionary.
+    """
+
+    return {field: canonical_value(value) for field, value in address.items()}
+
+
+def canonical_key(address: Dict) -> str:
+    """
+    Returns key which is the same for addresses that differ only in whitespace, case or order of fields. Whether
+    address is primary and its id do not affect the key. Length of every canonical string is part of the key, so
+    addresses with the same key get the same verdict from length validators.
+
+    :param address: Address fields presented in form of dictionary.
+    """
+
+    fields: List[Tuple[str, Any, Optional[int]]] = []
+    for field in sorted(address):
+        if field in EXCLUDED_FIELDS:
+            continue
+        value: Any = canonical_value(address[field])
+        fields.append((field, value.casefold(), len(value)) if isinstance(value, str) else (field, value, None))
+    return blake2b(json.dumps(fields, separators=(",", ":"), default=str).encode("utf-8"),
+                   digest_size=16).hexdigest()
+
+
+class ValidatedAddressCache:
+    """
+    Bounded set of canonical keys of addresses which passed per-address validators. The least recently used keys are
+    evicted once cache is full.
+    """
+
+    def __init__(self, max_size: int = 100000):
+        self.max_size: int = max_size
+        self._keys: OrderedDict[str, None] = OrderedDict()
+        self.addresses: int = 0
+        self.hits: int = 0
+        self.evicted: int = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        self.addresses += 1
+        if key not in self._keys:
+            return False
+        self._keys.move_to_end(key)
+        self.hits += 1
+        return True
+
+    def add(self, key: str) -> None:
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+            self.evicted += 1
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns number of checked addresses, addresses which skipped re-validation and their share, size of cache and
+        number of evicted keys.
+        """
+
+        return {"addresses": self.addresses, "hits": self.hits,
+                "dedup_ratio": self.hits / self.addresses if self.addresses else 0.0, "size": len(self._keys),
+                "evicted": self.evicted}
+
+
+class CanonicalAddressValidator(AddressValidator):
+    """
+    Runs given address chain on canonical form of addresses and skips per-address validators for addresses which
+    canonical key is already in cache. Validators of the whole list, e.g. NoPrimaryValidator, always get the whole
+    list. Once chain passes, string fields of given addresses are replaced by their canonical form, so stored
+    addresses are exactly the values which were validated. Validator is stateful for ValidationMemo: wrapped chain is
+    not part of its chain fingerprint and replayed outcome would not rewrite addresses.
+    """
+
+    IS_STATEFUL: bool = True
+
+    def __init__(self, validator: AddressValidator, cache: Optional[ValidatedAddressCache] = None):
+        super().__init__()
+        self.validators: List[AddressValidator] = [detach(chain_validator) for chain_validator in unroll_chain(
+            validator)]
+        self.cache: ValidatedAddressCache = cache if cache is not None else ValidatedAddressCache()
+
+    def validate(self, addresses_to_validate: List[Dict]) -> None:
+
+        """
+            Raises exception of the first failed validator of chain. Otherwise adds canonical keys of addresses to
+                cache and replaces string fields of addresses by canonical form.
+
+            :type addresses_to_validate: List[Dict]
+            :param addresses_to_validate: List of address fields presented in form of dictionary.
+
+            :return: None
+        """
+
+        canonical_addresses: List[Dict] = [canonicalize(address_to_validate)
+                                           for address_to_validate in addresses_to_validate]
+        keys: Dict[str, Dict] = {}
+        for canonical_address in canonical_addresses:
+            key: str = canonical_key(canonical_address)
+            if key not in self.cache and key not in keys:
+                keys[key] = canonical_address
+        new_addresses: List[Dict] = list(keys.values())
+
+        for validator in self.validators:
+            if not validator.PER_ADDRESS:
+                validator.validate(canonical_addresses)
+            elif new_addresses:
+                validator.validate(new_addresses)
+
+        for key in keys:
+            self.cache.add(key)
+        for address_to_validate, canonical_address in zip(addresses_to_validate, canonical_addresses):
+            address_to_validate.update(canonical_address)
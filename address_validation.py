@@ -1,8 +1,13 @@
 from __future__ import annotations
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, FrozenSet
 
+from models.validation.chain import BatchValidationMixin
+
+
+class AddressValidator(BatchValidationMixin):
+    INPUT_FIELDS: Optional[FrozenSet[str]] = None
+    PER_ADDRESS: bool = False
 
-class AddressValidator:
     def __init__(self, next_validator: Optional[AddressValidator] = None):
         self.next_validator: Optional[AddressValidator] = next_validator
 
@@ -23,6 +28,8 @@ class AddressValidator:
 
 
 class NoPrimaryValidator(AddressValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"isPrimary"})
+
     def validate(self, addresses_to_validate: List[Dict]) -> None:
 
         """
@@ -42,6 +49,9 @@ class NoPrimaryValidator(AddressValidator):
 
 
 class InvalidAddressLine1LengthValidator(AddressValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"address1"})
+    PER_ADDRESS: bool = True
+
     def validate(self, addresses_to_validate: List[Dict]) -> None:
 
         """
@@ -69,6 +79,9 @@ class InvalidAddressLine1LengthValidator(AddressValidator):
 
 
 class InvalidAddressLine2LengthValidator(AddressValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"address2"})
+    PER_ADDRESS: bool = True
+
     def validate(self, addresses_to_validate: List[Dict]) -> None:
 
         """
@@ -0,0 +1,84 @@
+"""
+Benchmarks bcrypt on the current host and recommends cost for target login latency.
+
+Usage: python -m models.validation.bcrypt_calibration [--target-ms 250] [--minimum-cost 10] [--maximum-cost 16]
+"""
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from bcrypt import checkpw, gensalt, hashpw
+
+CALIBRATION_PASSWORD: bytes = b"Calibration1234"
+
+
+def benchmark_cost(cost: int, rounds: int = 3) -> Dict[str, float]:
+    """
+    Returns median seconds hashpw and checkpw take with given cost.
+
+    :param cost: Bcrypt cost.
+    :param rounds: Number of measurements of each operation.
+    """
+
+    hash_times: List[float] = []
+    check_times: List[float] = []
+    hashed_password: bytes = b""
+    for _ in range(rounds):
+        started: float = perf_counter()
+        hashed_password = hashpw(CALIBRATION_PASSWORD, gensalt(rounds=cost))
+        hash_times.append(perf_counter() - started)
+    for _ in range(rounds):
+        started = perf_counter()
+        checkpw(CALIBRATION_PASSWORD, hashed_password)
+        check_times.append(perf_counter() - started)
+    return {"cost": cost, "hashpw": median(hash_times), "checkpw": median(check_times)}
+
+
+def calibrate(target_latency: float, minimum_cost: int = 10, maximum_cost: int = 16,
+              rounds: int = 3) -> Dict[str, object]:
+    """
+    Benchmarks costs from minimum one upward and recommends the highest cost which checkpw takes no longer than target
+    latency with. Stops at the first cost which exceeds target latency, as every next cost takes twice as long.
+
+    :param target_latency: Seconds single password check is allowed to take.
+    :param minimum_cost: The lowest cost to recommend.
+    :param maximum_cost: The highest cost to benchmark.
+    :param rounds: Number of measurements of each operation per cost.
+    """
+
+    measurements: List[Dict[str, float]] = []
+    recommended_cost: Optional[int] = None
+    for cost in range(minimum_cost, maximum_cost + 1):
+        measurement: Dict[str, float] = benchmark_cost(cost=cost, rounds=rounds)
+        measurements.append(measurement)
+        if measurement["checkpw"] > target_latency:
+            break
+        recommended_cost = cost
+    return {"target_latency": target_latency,
+            "recommended_cost": minimum_cost if recommended_cost is None else recommended_cost,
+            "within_target": recommended_cost is not None,
+            "measurements": measurements}
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--target-ms", type=float, default=250, help="Target checkpw latency in milliseconds.")
+    parser.add_argument("--minimum-cost", type=int, default=10)
+    parser.add_argument("--maximum-cost", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=3)
+    arguments = parser.parse_args()
+
+    result: Dict[str, object] = calibrate(target_latency=arguments.target_ms / 1000,
+                                          minimum_cost=arguments.minimum_cost, maximum_cost=arguments.maximum_cost,
+                                          rounds=arguments.rounds)
+    print("{:>6}{:>16}{:>16}".format("cost", "hashpw, ms", "checkpw, ms"))
+    for measurement in result["measurements"]:
+        print("{:>6}{:>16.1f}{:>16.1f}".format(measurement["cost"], measurement["hashpw"] * 1000,
+                                               measurement["checkpw"] * 1000))
+    print("Recommended cost: {}{}".format(result["recommended_cost"], "" if result["within_target"] else
+                                          " (minimum cost already exceeds target latency)"))
+
+
+if __name__ == "__main__":
+    main()
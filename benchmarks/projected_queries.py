@@ -0,0 +1,68 @@
+"""
+Compares full documents fetched by objects.get with existence-only and projected documents fetched by DB-backed
+validators now. For every validator reports BSON size of the reply and time to decode it, which is what client pays per
+lookup on top of the round trip.
+
+Documents are taken from JSON file with one sample document per collection ({"users": {...}, "items": {...},
+"sc_elements": {...}}), e.g. exported from production, or generated if no file is given.
+
+Usage: python -m models.validation.benchmarks.projected_queries [--samples samples.json] [--number N]
+"""
+import json
+from argparse import ArgumentParser
+from timeit import timeit
+from typing import Any, Dict, List, Tuple
+
+from bson import BSON
+
+VALIDATOR_QUERIES: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ("LoginValidator", "users", ("_id",)),
+    ("EmailValidator", "users", ("_id",)),
+    ("BuyerCompanyNameValidator", "users", ("_id",)),
+    ("ProductCodeAlreadyExistsValidator", "items", ("_id",)),
+    ("DeliveryMethodIsNotAvailableValidator", "sc_elements", ("_id", "item_id")),
+    ("DeliveryMethodIsNotAvailableValidator", "items", ("_id", "deliveryOffered", "marketPickOffered")),
+]
+
+
+def generated_samples() -> Dict[str, Dict[str, Any]]:
+    return {
+        "users": {"_id": "57d90e96095c7605435dca70", "login": "test1", "email": "example@example.com",
+                  "title": "Test Test", "password": "$2b$12$" + "a" * 53, "email_conform": True, "is_enable": True,
+                  "addresses": [{"isPrimary": True, "address1": "Main street {}".format(number), "address2": ""}
+                                for number in range(3)]},
+        "items": {"_id": "59fae88e095c7628122c55c8", "productNo": "OR0507162206", "is_parent": True,
+                  "is_enable": True, "draft": False, "deliveryOffered": True, "marketPickOffered": False,
+                  "description": "Product description. " * 400, "images": ["image_{}.jpg".format(number)
+                                                                           for number in range(20)],
+                  "variants": [{"size": size, "price": 100 + size} for size in range(30)]},
+        "sc_elements": {"_id": "5a0b0e5b095c7611e0f6bb10", "item_id": "59fae88e095c7628122c55c8", "quantity": 2,
+                        "delivery": {"method": "US Delivery"}},
+    }
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", help="JSON file with sample document of every collection.")
+    parser.add_argument("--number", type=int, default=10000, help="Number of decodes per measurement.")
+    arguments = parser.parse_args()
+
+    samples: Dict[str, Dict[str, Any]] = generated_samples()
+    if arguments.samples:
+        with open(arguments.samples) as samples_file:
+            samples.update(json.load(samples_file))
+
+    print("{:<40}{:<13}{:>12}{:>12}{:>14}{:>14}".format("validator", "collection", "full, B", "now, B",
+                                                          "full, us", "now, us"))
+    for validator, collection, fields in VALIDATOR_QUERIES:
+        full: bytes = BSON.encode(samples[collection])
+        projected: bytes = BSON.encode({field: samples[collection][field] for field in fields
+                                        if field in samples[collection]})
+        full_time: float = timeit(lambda: BSON(full).decode(), number=arguments.number) / arguments.number
+        projected_time: float = timeit(lambda: BSON(projected).decode(), number=arguments.number) / arguments.number
+        print("{:<40}{:<13}{:>12}{:>12}{:>14.2f}{:>14.2f}".format(validator, collection, len(full), len(projected),
+                                                                  full_time * 1e6, projected_time * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Compares validation of model objects built from mappings with validation of the same mappings through
+validate_mapping methods.
+
+Usage: python -m models.validation.benchmarks.record_validation [--number N]
+"""
+from argparse import ArgumentParser
+from timeit import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+from models.items import Item
+from models.users import User
+from models.shopping_list_entry import ShoppingListElement
+from models.sc_element import SCElement
+from models.validation.product_validation import BlockValidator, DraftValidator, ExpireValidator
+from models.validation.user_validation import EmailValidator, BlockedUserValidator
+from models.validation.shopping_list_element_validation import NameValidator
+from models.validation.shopping_cart_element_validation import DeliveryMethodIsNotAvailableValidator
+
+
+def cases() -> List[Tuple[str, Callable, Any, Dict]]:
+    return [
+        ("product", Item, BlockValidator(DraftValidator(ExpireValidator())),
+         {"is_enable": True, "draft": False, "validTill": 4102444800}),
+        ("user", User, EmailValidator(BlockedUserValidator()), {"is_enable": True, "email_conform": True}),
+        ("shopping list element", ShoppingListElement, NameValidator(),
+         {"is_custom": True, "name": "Milk", "subcategory_entry_id": "", "is_active": True}),
+        ("shopping cart element", SCElement, DeliveryMethodIsNotAvailableValidator(), {"item_id": "test_item_id"}),
+    ]
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10000, help="Number of validations per case.")
+    number: int = parser.parse_args().number
+
+    print("{:<24}{:>16}{:>16}{:>10}".format("entity", "model, us/op", "mapping, us/op", "speedup"))
+    for name, model, validator, mapping in cases():
+        model_time: float = timeit(lambda: validator.validate(model(**mapping)), number=number) / number
+        mapping_time: float = timeit(lambda: validator.validate_mapping(mapping), number=number) / number
+        print("{:<24}{:>16.2f}{:>16.2f}{:>9.1f}x".format(name, model_time * 1e6, mapping_time * 1e6,
+                                                      model_time / mapping_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares SimHash fingerprinting of review bodies by per-bit accumulation of shingle hashes, as it was done before, with
+bit-sliced counting done by simhash now, and measures lookup of near duplicates in index filled with fingerprints of
+the same reviews. Both ways are checked to return the same fingerprints.
+
+Usage: python -m models.validation.benchmarks.review_similarity [--reviews N] [--words N] [--number N]
+"""
+from argparse import ArgumentParser
+from hashlib import blake2b
+from random import Random
+from timeit import timeit
+from typing import List, Set
+
+from models.validation.review_similarity import _WORD_PATTERN, SimHashIndex, simhash
+
+VOCABULARY: List[str] = ["good", "bad", "quality", "price", "delivery", "fast", "slow", "product", "would", "buy",
+                         "again", "not", "very", "size", "fits", "color", "broken", "works", "great", "seller"]
+
+
+def per_bit_simhash(text: str, shingle_size: int = 3) -> int:
+    words: List[str] = _WORD_PATTERN.findall(text.lower())
+    shingles: Set[str] = {" ".join(words[position:position + shingle_size])
+                          for position in range(max(len(words) - shingle_size + 1, 1))}
+    counts: List[int] = [0] * 64
+    for shingle in shingles:
+        shingle_hash: int = int.from_bytes(blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            counts[bit] += 1 if shingle_hash >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if counts[bit] > 0)
+
+
+def generated_reviews(count: int, words: int, seed: int = 0) -> List[str]:
+    random: Random = Random(seed)
+    return [" ".join(random.choice(VOCABULARY) for _ in range(words)) for _ in range(count)]
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--reviews", type=int, default=1000, help="Number of generated reviews.")
+    parser.add_argument("--words", type=int, default=60, help="Number of words per review.")
+    parser.add_argument("--number", type=int, default=5, help="Number of passes over reviews per measurement.")
+    arguments = parser.parse_args()
+
+    reviews: List[str] = generated_reviews(arguments.reviews, arguments.words)
+    if [per_bit_simhash(review) for review in reviews] != [simhash(review) for review in reviews]:
+        raise SystemExit("Fingerprints differ.")
+
+    index: SimHashIndex = SimHashIndex()
+    fingerprints: List[int] = [simhash(review) for review in reviews]
+    for fingerprint in fingerprints:
+        index.add("item:benchmark", fingerprint)
+
+    per_review: int = arguments.reviews * arguments.number
+    per_bit_time: float = timeit(lambda: [per_bit_simhash(review) for review in reviews],
+                                 number=arguments.number) / per_review
+    simhash_time: float = timeit(lambda: [simhash(review) for review in reviews], number=arguments.number) / per_review
+    lookup_time: float = timeit(lambda: [index.contains_near_duplicate("item:benchmark", fingerprint)
+                                         for fingerprint in fingerprints], number=arguments.number) / per_review
+
+    print("{:<28}{:>14}".format("step", "us/review"))
+    print("{:<28}{:>14.2f}".format("per-bit simhash", per_bit_time * 1e6))
+    print("{:<28}{:>14.2f}".format("simhash", simhash_time * 1e6))
+    print("{:<28}{:>14.2f}".format("near duplicate lookup", lookup_time * 1e6))
+    print("{:<28}{:>14.2f}".format("speedup of simhash", per_bit_time / simhash_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import json
+import os
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from models.items import Item
+from models.validation.exceptions import InvalidPayloadException
+from models.validation.product_validation import ProductValidator, BlockValidator, DraftValidator, ExpireValidator
+from models.validation.product_availability import ProductAvailabilityIndex
+from models.validation.records import ProductRecord
+
+
+class CatalogSweep:
+    """
+    Re-validates every product of catalog and writes changes of availability status back. Products are read by single
+    server-side cursor ordered by id in fixed-size batches with only the fields product chain needs, so memory usage
+    does not depend on size of catalog. Id of the last processed product is saved to checkpoint file after every batch,
+    so interrupted sweep continues where it stopped. Checkpoint is removed once sweep reaches the end of catalog, so the
+    next sweep starts from the beginning.
+    """
+
+    STATUS_FIELD: str = "is_available"
+    FIELDS: List[str] = ["is_enable", "draft", "validTill"]
+
+    def __init__(self, collection: Optional[Any] = None, batch_size: int = 500, checkpoint_path: Optional[str] = None,
+                 validator: Optional[ProductValidator] = None,
+                 availability_index: Optional[ProductAvailabilityIndex] = None):
+        self.collection: Optional[Any] = collection
+        self.batch_size: int = batch_size
+        self.checkpoint_path: Optional[str] = checkpoint_path
+        self.validator: ProductValidator = validator if validator is not None else BlockValidator(
+            DraftValidator(ExpireValidator()))
+        self.availability_index: Optional[ProductAvailabilityIndex] = availability_index
+        self.processed: int = 0
+        self.changed: int = 0
+        self.elapsed: float = 0.0
+
+    def load_checkpoint(self) -> Optional[Any]:
+        """
+        Restores counters from checkpoint file and returns id of the last processed product or None if there is no
+        checkpoint.
+        """
+
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as checkpoint:
+            state: Dict[str, Any] = json.load(checkpoint)
+        self.processed, self.changed, self.elapsed = state["processed"], state["changed"], state["elapsed"]
+        return ObjectId(state["last_id"]) if ObjectId.is_valid(state["last_id"]) else state["last_id"]
+
+    def save_checkpoint(self, last_id: Any) -> None:
+        if self.checkpoint_path is None:
+            return
+        temporary_path: str = self.checkpoint_path + ".tmp"
+        with open(temporary_path, "w") as checkpoint:
+            json.dump({"last_id": str(last_id), "processed": self.processed, "changed": self.changed,
+                       "elapsed": self.elapsed}, checkpoint)
+        os.replace(temporary_path, self.checkpoint_path)
+
+    def clear_checkpoint(self) -> None:
+        if self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def is_available(self, product: Dict[str, Any]) -> bool:
+        """
+        Returns True if product passes product chain. Product which misses any of FIELDS is treated as unavailable.
+
+        :param product: Projected product document.
+        """
+
+        from controller.ErrorHandler import InactiveProductException
+
+        try:
+            self.validator.validate(ProductRecord.from_mapping(product))
+        except (InactiveProductException, InvalidPayloadException):
+            return False
+        return True
+
+    async def process_batch(self, products: List[Dict[str, Any]]) -> None:
+        """
+        Validates batch of products and writes changed statuses by single bulk write.
+
+        :param products: Projected product documents.
+        """
+
+        updates: List[UpdateOne] = []
+        for product in products:
+            is_available: bool = self.is_available(product)
+            if product.get(self.STATUS_FIELD) != is_available:
+                updates.append(UpdateOne({"_id": product["_id"]}, {"$set": {self.STATUS_FIELD: is_available}}))
+            if self.availability_index is not None:
+                try:
+                    record: ProductRecord = ProductRecord.from_mapping(product)
+                except InvalidPayloadException:
+                    self.availability_index.remove(product["_id"])
+                else:
+                    self.availability_index.update_state(item_id=product["_id"], is_enable=record.is_enable,
+                                                         draft=record.draft, valid_till=record.validTill)
+        if updates:
+            await self.collection.bulk_write(updates, ordered=False)
+        self.processed += len(products)
+        self.changed += len(updates)
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Sweeps catalog from the last checkpoint, or from the beginning if there is none, to the end and returns number
+        of processed and changed products and processing rate of the whole sweep, including its interrupted runs.
+        """
+
+        if self.collection is None:
+            self.collection = Item.objects.coll()
+        self.processed, self.changed, self.elapsed = 0, 0, 0.0
+        last_id: Optional[Any] = self.load_checkpoint()
+        started: float = perf_counter()
+        elapsed_before: float = self.elapsed
+        cursor: Any = self.collection.find({"_id": {"$gt": last_id}} if last_id is not None else {},
+                                           {field: 1 for field in self.FIELDS + [self.STATUS_FIELD]}).sort(
+            "_id", 1).batch_size(self.batch_size)
+        batch: List[Dict[str, Any]] = []
+        async for product in cursor:
+            batch.append(product)
+            if len(batch) == self.batch_size:
+                await self.process_batch(batch)
+                self.elapsed = elapsed_before + perf_counter() - started
+                self.save_checkpoint(batch[-1]["_id"])
+                batch = []
+        if batch:
+            await self.process_batch(batch)
+            self.elapsed = elapsed_before + perf_counter() - started
+            self.save_checkpoint(batch[-1]["_id"])
+        self.clear_checkpoint()
+        return self.statistics()
+
+    def statistics(self) -> Dict[str, Any]:
+        return {"processed": self.processed, "changed": self.changed, "elapsed": self.elapsed,
+                "items_per_second": self.processed / self.elapsed if self.elapsed else 0.0}
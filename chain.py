@@ -0,0 +1,139 @@
+from copy import copy
+from typing import Any, Callable, Dict, List, Optional
+
+
+def unroll_chain(validator: Any) -> List[Any]:
+    """
+    Returns validators of chain which starts with given validator in the order they are called.
+
+    :param validator: The first validator of chain.
+    """
+
+    validators: List[Any] = []
+    while validator is not None:
+        validators.append(validator)
+        validator = validator.next_validator
+    return validators
+
+
+def detach(validator: Any) -> Any:
+    """
+    Returns shallow copy of given validator which has no next validator, so it runs only its own check. Given
+    validator is not changed.
+
+    :param validator: Validator to detach.
+    """
+
+    detached_validator: Any = copy(validator)
+    detached_validator.next_validator = None
+    return detached_validator
+
+
+def collect_outcomes(validate: Callable[[Any], None], entities: List[Any]) -> List[Optional[Exception]]:
+    """
+    Calls given validate function on every entity and returns exception raised for every entity or None if entity is
+    valid.
+
+    :param validate: Validate function, e.g. validate method of detached validator.
+    :param entities: Entities to validate.
+    """
+
+    outcomes: List[Optional[Exception]] = []
+    for entity in entities:
+        try:
+            validate(entity)
+        except Exception as exception:
+            outcomes.append(exception)
+        else:
+            outcomes.append(None)
+    return outcomes
+
+
+def passed_positions(outcomes: List[Optional[Exception]]) -> List[int]:
+    """
+    Returns positions of entities which have no exception in outcomes.
+
+    :param outcomes: Outcomes of validator, one per entity.
+    """
+
+    return [position for position, outcome in enumerate(outcomes) if outcome is None]
+
+
+class BatchValidationMixin:
+    """
+    Batch API of validator chains. Every validator runs its own check on the whole batch and passes entities which
+    passed to the next validator at once, so validators which check the whole batch by single query, e.g. unique
+    field validators, get all entities that reached them. Such validators override validate_many or
+    validate_dictionary_many and pass entities which passed to validate_next_many or validate_next_dictionary_many.
+    """
+
+    next_validator: Optional[Any]
+
+    def validate_many(self, entities: List[Any]) -> List[Optional[Exception]]:
+        """
+        Validates every given entity by the chain which starts with this validator. Exception of failed entity is
+        returned in its place instead of being raised.
+
+        :param entities: Entities to validate.
+        """
+
+        return self.validate_next_many(entities, collect_outcomes(detach(self).validate, entities))
+
+    def validate_next_many(self, entities: List[Any], outcomes: List[Optional[Exception]]) -> List[Optional[Exception]]:
+        """
+        Passes entities which have no exception in outcomes to validate many method of the next validator if exists
+        and fills outcomes with its results.
+
+        :param entities: Entities to validate.
+        :param outcomes: Outcomes of this validator, one per entity.
+        """
+
+        if self.next_validator is not None:
+            passed: List[int] = passed_positions(outcomes)
+            for position, outcome in zip(passed, self.next_validator.validate_many(
+                    [entities[position] for position in passed])):
+                outcomes[position] = outcome
+        return outcomes
+
+
+class DictionaryBatchValidationMixin(BatchValidationMixin):
+    """
+    Batch API of validator chains which validate entities presented in form of dictionary by async validate
+    dictionary method.
+    """
+
+    async def validate_dictionary_many(self, entities: List[Dict]) -> List[Optional[Exception]]:
+        """
+        Validates every given entity presented in form of dictionary by the chain which starts with this validator.
+        Exception of failed entity is returned in its place instead of being raised.
+
+        :param entities: Entities presented in form of dictionary.
+        """
+
+        detached_validator: Any = detach(self)
+        outcomes: List[Optional[Exception]] = []
+        for entity in entities:
+            try:
+                await detached_validator.validate_dictionary(entity)
+            except Exception as exception:
+                outcomes.append(exception)
+            else:
+                outcomes.append(None)
+        return await self.validate_next_dictionary_many(entities, outcomes)
+
+    async def validate_next_dictionary_many(self, entities: List[Dict],
+                                            outcomes: List[Optional[Exception]]) -> List[Optional[Exception]]:
+        """
+        Passes entities which have no exception in outcomes to validate dictionary many method of the next validator
+        if exists and fills outcomes with its results.
+
+        :param entities: Entities presented in form of dictionary.
+        :param outcomes: Outcomes of this validator, one per entity.
+        """
+
+        if self.next_validator is not None:
+            passed: List[int] = passed_positions(outcomes)
+            for position, outcome in zip(passed, await self.next_validator.validate_dictionary_many(
+                    [entities[position] for position in passed])):
+                outcomes[position] = outcome
+        return outcomes
@@ -0,0 +1,51 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
+from models.validation.chain import unroll_chain, detach
+
+
+async def validate_dictionary_concurrently(validator: Any, dictionary_to_validate: Any) -> None:
+    """
+    Runs validate dictionary methods of all validators of chain which starts with given validator concurrently
+    instead of one after another. Validators of chain must be independent of each other, e.g. DB lookups of
+    LoginValidator, EmailValidator and BuyerCompanyNameValidator.
+
+    As soon as some validator fails, validators which come after it in the chain are cancelled, while validators which
+    come before it are awaited. If several validators fail, exception of the first of them in the chain is raised,
+    i.e. the same exception that sequential chain would raise.
+
+    :param validator: The first validator of chain. Works with UserValidator, ProductValidator and
+        ShoppingCartElementValidator chains.
+    :param dictionary_to_validate: Object presented in form of dictionary.
+    """
+
+    tasks: List[asyncio.Future] = [asyncio.ensure_future(detach(chain_validator).validate_dictionary(
+        dictionary_to_validate)) for chain_validator in unroll_chain(validator)]
+    positions: Dict[asyncio.Future, int] = {task: position for position, task in enumerate(tasks)}
+    for task in tasks:
+        task.add_done_callback(_retrieve_exception)
+
+    failed_position: Optional[int] = None
+    pending: Set[asyncio.Future] = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None and (failed_position is None or positions[task] < failed_position):
+                    failed_position = positions[task]
+            if failed_position is not None:
+                for task in pending:
+                    if positions[task] > failed_position:
+                        task.cancel()
+                pending = {task for task in pending if positions[task] < failed_position}
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if failed_position is not None:
+        raise tasks[failed_position].exception()
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,215 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any, Callable, Dict, Iterator, Optional
+from weakref import WeakKeyDictionary
+
+from models.validation.exceptions import ValidationTimeoutException, ValidationOverloadedException
+
+_deadline: ContextVar[Optional[float]] = ContextVar("validation_deadline", default=None)
+
+
+@contextmanager
+def validation_deadline(timeout: float) -> Iterator[None]:
+    """
+    Sets deadline for all DB-backed validators run inside the context. Nested deadline can not extend outer one.
+
+    :param timeout: Seconds validation is allowed to take.
+    """
+
+    deadline: float = monotonic() + timeout
+    current_deadline: Optional[float] = _deadline.get()
+    token = _deadline.set(deadline if current_deadline is None else min(deadline, current_deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """
+    Returns seconds left till deadline of current validation or None if validation has no deadline.
+    """
+
+    deadline: Optional[float] = _deadline.get()
+    return None if deadline is None else deadline - monotonic()
+
+
+async def run_without_deadline(query: Callable, *args: Any, **kwargs: Any) -> Any:
+    """
+    Awaits given coroutine function outside of deadline of current validation. Has to run as separate task, so
+    deadline of the caller is not changed.
+
+    :param query: Coroutine function to await.
+    """
+
+    _deadline.set(None)
+    return await query(*args, **kwargs)
+
+
+class CollectionLimiter:
+    """
+    Limits number of concurrent lookups of single collection. Lookups which can not start immediately wait in bounded
+    queue; lookups which do not fit into the queue are shed. Semaphore and wait queue are kept per event loop, since
+    asyncio semaphore is bound to the loop it is first used in and limiter is shared by the whole process, e.g. by
+    consecutive asyncio.run calls or IOLoops of tests.
+    """
+
+    def __init__(self, collection: str, max_concurrency: int, max_waiting: int):
+        self.collection: str = collection
+        self.max_concurrency: int = max_concurrency
+        self.max_waiting: int = max_waiting
+        self._semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+        self._waiting: "WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = WeakKeyDictionary()
+        self.in_flight: int = 0
+        self.max_waiting_seen: int = 0
+        self.completed: int = 0
+        self.waits: int = 0
+        self.wait_time: float = 0.0
+        self.max_wait_time: float = 0.0
+        self.shed: int = 0
+        self.timed_out: int = 0
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        Returns semaphore of running event loop.
+        """
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        semaphore: Optional[asyncio.Semaphore] = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    @property
+    def waiting(self) -> int:
+        """
+        Returns number of lookups waiting for free slot in all event loops.
+        """
+
+        return sum(self._waiting.values())
+
+    async def run(self, query: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls given query once there is free slot and returns its result. Raises ValidationOverloadedException if wait
+        queue is full and ValidationTimeoutException if deadline of current validation passes before the query
+        finishes.
+
+        :param query: Coroutine function which queries the collection, e.g. User.objects.get.
+        """
+
+        timeout: Optional[float] = remaining_time()
+        if timeout is not None and timeout <= 0:
+            self.timed_out += 1
+            raise ValidationTimeoutException(self.collection)
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        semaphore: asyncio.Semaphore = self.semaphore
+        waiting: int = self._waiting.get(loop, 0)
+        if semaphore.locked() and waiting >= self.max_waiting:
+            self.shed += 1
+            raise ValidationOverloadedException(self.collection)
+
+        self._waiting[loop] = waiting + 1
+        self.max_waiting_seen = max(self.max_waiting_seen, waiting + 1)
+        wait_started: float = monotonic()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise ValidationTimeoutException(self.collection) from None
+        finally:
+            self._waiting[loop] -= 1
+            wait_time: float = monotonic() - wait_started
+            self.waits += 1
+            self.wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+        self.in_flight += 1
+        try:
+            return await asyncio.wait_for(query(*args, **kwargs), remaining_time())
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise ValidationTimeoutException(self.collection) from None
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns queue depth, wait time and shed counts of the collection.
+        """
+
+        return {
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_waiting_seen": self.max_waiting_seen,
+            "completed": self.completed,
+            "average_wait_time": self.wait_time / self.waits if self.waits else 0.0,
+            "max_wait_time": self.max_wait_time,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+        }
+
+
+class DatabaseLimiter:
+    """
+    Concurrency limiter shared by all DB-backed validators. Keeps separate CollectionLimiter per collection.
+    """
+
+    DEFAULT_MAX_CONCURRENCY: int = 50
+    DEFAULT_MAX_WAITING: int = 200
+
+    def __init__(self):
+        self._limiters: Dict[str, CollectionLimiter] = {}
+
+    def configure(self, collection: str, max_concurrency: int, max_waiting: int) -> None:
+        """
+        Sets limits of given collection. Statistics of the collection are reset.
+
+        :param collection: Collection name.
+        :param max_concurrency: Maximum number of concurrent lookups.
+        :param max_waiting: Maximum number of lookups waiting for free slot.
+        """
+
+        self._limiters[collection] = CollectionLimiter(collection=collection, max_concurrency=max_concurrency,
+                                                       max_waiting=max_waiting)
+
+    def reset(self) -> None:
+        """
+        Resets state and statistics of all collections, keeping their limits. Has to be called when no lookup is in
+        progress, e.g. between runs of benchmark or profiler.
+        """
+
+        for collection, limiter in list(self._limiters.items()):
+            self.configure(collection=collection, max_concurrency=limiter.max_concurrency,
+                           max_waiting=limiter.max_waiting)
+
+    def limiter(self, collection: str) -> CollectionLimiter:
+        if collection not in self._limiters:
+            self.configure(collection=collection, max_concurrency=self.DEFAULT_MAX_CONCURRENCY,
+                           max_waiting=self.DEFAULT_MAX_WAITING)
+        return self._limiters[collection]
+
+    async def run(self, collection: str, query: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls given query of given collection within limits of the collection and returns its result.
+
+        :param collection: Collection name.
+        :param query: Coroutine function which queries the collection, e.g. User.objects.get.
+        """
+
+        return await self.limiter(collection).run(query, *args, **kwargs)
+
+    def statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns statistics of all collections.
+        """
+
+        return {collection: limiter.statistics() for collection, limiter in self._limiters.items()}
+
+
+database_limiter: DatabaseLimiter = DatabaseLimiter()
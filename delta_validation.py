@@ -0,0 +1,52 @@
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set
+
+from models.validation.chain import unroll_chain, detach
+
+
+class DeltaValidationReport:
+    """
+    Result of validation of partial update: fields changed by the patch and names of validators which were run and
+    skipped.
+    """
+
+    def __init__(self, changed_fields: Set[str], run: List[str], skipped: List[str]):
+        self.changed_fields: Set[str] = changed_fields
+        self.run: List[str] = run
+        self.skipped: List[str] = skipped
+
+
+def changed_fields(old_document: Mapping, patch: Mapping) -> Set[str]:
+    """
+    Returns fields which values are changed by given patch.
+
+    :param old_document: Document before update.
+    :param patch: Fields to update.
+    """
+
+    return {field for field, value in patch.items() if field not in old_document or old_document[field] != value}
+
+
+async def validate_patch(validator: Any, old_document: Mapping, patch: Mapping) -> DeltaValidationReport:
+    """
+    Validates document updated with given patch by validate dictionary methods of chain which starts with given
+    validator. Validators are run in chain order, but only if INPUT_FIELDS they declare were changed by the patch;
+    validators which do not declare INPUT_FIELDS are always run. Raises the same exception as the first failed
+    validator.
+
+    :param validator: The first validator of chain, e.g. ProductValidator or UserValidator chain.
+    :param old_document: Document before update.
+    :param patch: Fields to update.
+    """
+
+    fields: Set[str] = changed_fields(old_document, patch)
+    document: Dict = {**old_document, **patch}
+    run: List[str] = []
+    skipped: List[str] = []
+    for chain_validator in unroll_chain(validator):
+        input_fields: Optional[FrozenSet[str]] = chain_validator.INPUT_FIELDS
+        if input_fields is not None and input_fields.isdisjoint(fields):
+            skipped.append(type(chain_validator).__name__)
+        else:
+            await detach(chain_validator).validate_dictionary(document)
+            run.append(type(chain_validator).__name__)
+    return DeltaValidationReport(changed_fields=fields, run=run, skipped=skipped)
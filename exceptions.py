@@ -0,0 +1,63 @@
+"""
+Exceptions raised by validators and helpers of the validation package itself. controller.ErrorHandler, where
+exceptions of validator checks live, belongs to the application and not to this package, so these exceptions are
+tornado HTTPError subclasses with their own status codes: tornado renders them with the status code instead of 500
+even where the application handler does not map them.
+"""
+from tornado.web import HTTPError
+
+
+class ValidationException(HTTPError):
+    STATUS_CODE: int = 400
+
+    def __init__(self, message: str):
+        super().__init__(self.STATUS_CODE, "%s", message)
+        self.message: str = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+class ValidationTimeoutException(ValidationException):
+    """
+    Raised when DB-backed validator can not finish its lookup before the deadline of validation.
+    """
+
+    STATUS_CODE: int = 503
+
+    def __init__(self, collection: str):
+        super().__init__("Validation deadline exceeded while querying {}.".format(collection))
+        self.collection: str = collection
+
+
+class ValidationOverloadedException(ValidationException):
+    """
+    Raised when DB-backed validator is shed because wait queue of the collection it queries is full.
+    """
+
+    STATUS_CODE: int = 503
+
+    def __init__(self, collection: str):
+        super().__init__("Too many pending validation lookups of {}.".format(collection))
+        self.collection: str = collection
+
+
+class DuplicateReviewBodyException(ValidationException):
+    """
+    Raised when review body is the same as or nearly the same as body of another review of the same product or author.
+    """
+
+    STATUS_CODE: int = 409
+
+    def __init__(self):
+        super().__init__("Review with the same text already exists.")
+
+
+class InvalidPayloadException(ValidationException):
+    """
+    Raised when raw request body is too large, is not valid JSON or does not have expected structure.
+    """
+
+    def __init__(self, detail: str):
+        super().__init__("Invalid payload: {}".format(detail))
+        self.detail: str = detail
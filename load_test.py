@@ -0,0 +1,223 @@
+"""
+Open-loop load test of validate dictionary chains against in-memory stand-in backend. Requests arrive by Poisson
+process regardless of how fast previous ones finish, and latency is measured from scheduled arrival, so slow chains
+and event loop stalls show up in percentiles instead of lowering the load.
+
+Usage: python -m models.validation.load_test [--rate 5000] [--duration 10] [--mix signup=5,product=3,checkout=2]
+    [--latency 0.002] [--jitter 0.002] [--output results.json] [--baseline previous_results.json]
+"""
+import asyncio
+import json
+from argparse import ArgumentParser
+from random import Random
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from models.users import User
+from models.items import Item
+from models.sc_element import SCElement
+from models.enums.delivery_method import DeliveryMethod
+from models.validation.memory_backend import InMemoryBackend
+from models.validation.database_limiter import database_limiter, validation_deadline
+from models.validation.lookup_coalescing import lookup_coalescer
+from models.validation.exceptions import ValidationTimeoutException, ValidationOverloadedException
+from models.validation.user_validation import LoginValidator, EmailValidator, BuyerCompanyNameValidator
+from models.validation.product_validation import ProductCodeAlreadyExistsValidator, \
+    TooShortPriceValidPeriodValidator, TooShortSalePeriodValidator
+from models.validation.shopping_cart_element_validation import DeliveryMethodIsNotAvailableValidator
+
+PERCENTILES: Tuple[Tuple[str, float], ...] = (("p50", 50), ("p95", 95), ("p99", 99), ("p999", 99.9))
+
+
+def percentile(sorted_values: List[float], rank: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, int(round(rank / 100 * len(sorted_values))) - 1))]
+
+
+def seed_backend(backend: InMemoryBackend, size: int) -> None:
+    for number in range(size):
+        backend.add(User(login="user{}".format(number), email="user{}@example.com".format(number),
+                         title="Company {}".format(number)))
+        product: Item = Item(productNo="PN{:08d}".format(number), is_parent=True, deliveryOffered=number % 2 == 0,
+                             marketPickOffered=number % 3 == 0)
+        product._id = "item_{}".format(number)
+        shopping_cart_element: SCElement = SCElement(item_id=product._id)
+        shopping_cart_element._id = "sc_element_{}".format(number)
+        backend.add(product, shopping_cart_element)
+
+
+def scenarios(size: int, conflict_rate: float) -> Dict[str, Tuple[Any, Callable[[Random, int], Dict]]]:
+    """
+    Returns validator chain and payload generator of every scenario. Share of conflict rate of payloads refers to
+    existing users and products.
+    """
+
+    def existing(random: Random) -> Optional[int]:
+        return random.randrange(size) if random.random() < conflict_rate else None
+
+    def signup(random: Random, number: int) -> Dict:
+        user_number = existing(random)
+        name: str = "user{}".format(user_number) if user_number is not None else "new_user{}".format(number)
+        return {"login": name, "email": "{}@example.com".format(name), "title": "Company {}".format(name)}
+
+    def product(random: Random, number: int) -> Dict:
+        product_number = existing(random)
+        return {"productNo": "PN{:08d}".format(product_number) if product_number is not None else "NEW{}".format(
+            number), "valitFrom": 1612432399, "validTill": 1612432399 + random.choice((1800, 86400)),
+                "saleIsOn": False}
+
+    def checkout(random: Random, number: int) -> Dict:
+        return {"ID": "sc_element_{}".format(random.randrange(size)),
+                "delivery": {"method": random.choice((DeliveryMethod.US_DELIVERY.value,
+                                                      DeliveryMethod.PICK_UP.value))}}
+
+    return {
+        "signup": (LoginValidator(EmailValidator(BuyerCompanyNameValidator())), signup),
+        "product": (ProductCodeAlreadyExistsValidator(TooShortPriceValidPeriodValidator(
+            TooShortSalePeriodValidator())), product),
+        "checkout": (DeliveryMethodIsNotAvailableValidator(), checkout),
+    }
+
+
+async def monitor_event_loop_lag(lags: List[float], interval: float, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started: float = perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, perf_counter() - started - interval))
+
+
+async def run_request(validator: Any, payload: Dict, arrival: float, deadline: float,
+                      results: List[Tuple[float, str]]) -> None:
+    outcome: str = "passed"
+    with validation_deadline(deadline):
+        try:
+            await validator.validate_dictionary(payload)
+        except (ValidationTimeoutException, ValidationOverloadedException) as exception:
+            outcome = type(exception).__name__
+        except Exception:
+            outcome = "rejected"
+    results.append((perf_counter() - arrival, outcome))
+
+
+async def run_load(rate: float, duration: float, mix: Dict[str, float], size: int, conflict_rate: float,
+                   deadline: float, seed: int) -> Dict[str, Any]:
+    """
+    Drives requests of given mix at given rate for given duration and returns throughput, latency percentiles and
+    event loop lag.
+    """
+
+    random: Random = Random(seed)
+    chains: Dict[str, Tuple[Any, Callable[[Random, int], Dict]]] = scenarios(size=size, conflict_rate=conflict_rate)
+    names: List[str] = list(mix)
+    weights: List[float] = [mix[name] for name in names]
+    results: Dict[str, List[Tuple[float, str]]] = {name: [] for name in names}
+    lags: List[float] = []
+    stop: asyncio.Event = asyncio.Event()
+    lag_monitor: asyncio.Future = asyncio.ensure_future(monitor_event_loop_lag(lags, 0.01, stop))
+    requests: List[asyncio.Future] = []
+
+    started: float = perf_counter()
+    arrival: float = started
+    number: int = 0
+    while arrival - started < duration:
+        now: float = perf_counter()
+        while arrival <= now and arrival - started < duration:
+            name: str = random.choices(names, weights)[0]
+            validator, payload = chains[name]
+            requests.append(asyncio.ensure_future(run_request(validator, payload(random, number), arrival, deadline,
+                                                              results[name])))
+            number += 1
+            arrival += random.expovariate(rate)
+        await asyncio.sleep(max(0.0, arrival - perf_counter()))
+    await asyncio.gather(*requests)
+    elapsed: float = perf_counter() - started
+    stop.set()
+    await lag_monitor
+
+    report: Dict[str, Any] = {"scenarios": {}}
+    all_latencies: List[float] = []
+    for name, scenario_results in results.items():
+        latencies: List[float] = sorted(latency for latency, _ in scenario_results)
+        all_latencies.extend(latencies)
+        outcomes: Dict[str, int] = {}
+        for _, outcome in scenario_results:
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        report["scenarios"][name] = {"requests": len(latencies), "outcomes": outcomes,
+                                     **{label: percentile(latencies, rank) for label, rank in PERCENTILES}}
+    all_latencies.sort()
+    sorted_lags: List[float] = sorted(lags)
+    report.update({
+        "requests": number,
+        "elapsed": elapsed,
+        "throughput": number / elapsed,
+        **{label: percentile(all_latencies, rank) for label, rank in PERCENTILES},
+        "event_loop_lag": {"max": sorted_lags[-1] if sorted_lags else 0.0,
+                           **{label: percentile(sorted_lags, rank) for label, rank in PERCENTILES}},
+    })
+    return report
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    return {name: float(weight) for name, weight in (part.split("=") for part in mix.split(","))}
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    print("Requests: {requests}, throughput: {throughput:.0f} rps".format(**report))
+    print("{:<10}{:>10}".format("scenario", "requests") + "".join(
+        "{:>12}".format(label + ", ms") for label, _ in PERCENTILES))
+    rows: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]] = [
+        (name, stats, baseline["scenarios"].get(name) if baseline else None)
+        for name, stats in report["scenarios"].items()]
+    rows.append(("total", report, baseline))
+    for name, stats, baseline_stats in rows:
+        print("{:<10}{:>10}".format(name, stats["requests"]) + "".join(
+            "{:>12.2f}".format(stats[label] * 1000) for label, _ in PERCENTILES))
+        if baseline_stats:
+            print("{:<10}{:>10}".format("  change", "") + "".join(
+                "{:>+11.1f}%".format((stats[label] / baseline_stats[label] - 1) * 100 if baseline_stats[label] else 0)
+                for label, _ in PERCENTILES))
+    print("Event loop lag, ms: " + ", ".join("{} {:.2f}".format(label, value * 1000)
+                                              for label, value in report["event_loop_lag"].items()))
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=float, default=5000, help="Requests per second.")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to generate load for.")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("signup=5,product=3,checkout=2"))
+    parser.add_argument("--size", type=int, default=10000, help="Number of users, products and cart elements.")
+    parser.add_argument("--conflict-rate", type=float, default=0.1)
+    parser.add_argument("--latency", type=float, default=0.002, help="Latency of stand-in backend in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.002, help="Jitter of stand-in backend in seconds.")
+    parser.add_argument("--deadline", type=float, default=1.0, help="Deadline of single validation in seconds.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="File to save results to.")
+    parser.add_argument("--baseline", help="File with results of previous run to compare with.")
+    arguments = parser.parse_args()
+
+    backend: InMemoryBackend = InMemoryBackend(latency=arguments.latency, jitter=arguments.jitter,
+                                               seed=arguments.seed)
+    seed_backend(backend, arguments.size)
+    with backend.patch():
+        report: Dict[str, Any] = asyncio.run(run_load(
+            rate=arguments.rate, duration=arguments.duration, mix=arguments.mix, size=arguments.size,
+            conflict_rate=arguments.conflict_rate, deadline=arguments.deadline, seed=arguments.seed))
+    report["configuration"] = {key: value for key, value in vars(arguments).items()
+                               if key not in ("output", "baseline")}
+    report["database_limiter"] = database_limiter.statistics()
+    report["lookup_coalescer"] = lookup_coalescer.statistics()
+    report["backend"] = backend.statistics()
+
+    baseline: Optional[Dict[str, Any]] = None
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    print_report(report, baseline)
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import asyncio
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from models.validation.database_limiter import DatabaseLimiter, database_limiter, remaining_time, \
+    run_without_deadline
+from models.validation.exceptions import ValidationTimeoutException
+
+
+def _normalize(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _normalize(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+class LookupCoalescer:
+    """
+    Shares single in-flight lookup between concurrent identical lookups of validators. Lookups are identical if they
+    query the same collection with the same query and the same normalized filter. Unlike cache, result of lookup is
+    shared only with callers which asked for it while it was in flight.
+
+    Shared lookup runs within the limits of the collection, but without deadline of the caller which started it:
+    every caller waits for it only till its own deadline and fails with ValidationTimeoutException once the deadline
+    passes. Shared lookup is cancelled once all its callers gave up.
+    """
+
+    def __init__(self, limiter: DatabaseLimiter = database_limiter):
+        self._limiter: DatabaseLimiter = limiter
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self.lookups: int = 0
+        self.executed: int = 0
+        self.coalesced: int = 0
+
+    async def run(self, collection: str, query: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Returns result of given query of given collection, joining identical lookup if one is in flight.
+
+        :param collection: Collection name.
+        :param query: Coroutine function which queries the collection, e.g. User.objects.get.
+        """
+
+        key: Hashable = (collection, getattr(query, "__qualname__", repr(query)), _normalize(args), _normalize(kwargs))
+        self.lookups += 1
+        lookup: Optional[asyncio.Future] = self._in_flight.get(key)
+        if lookup is None or lookup.done():
+            lookup = asyncio.ensure_future(run_without_deadline(self._limiter.run, collection, query, *args,
+                                                                **kwargs))
+            self._in_flight[key] = lookup
+            lookup.add_done_callback(lambda finished_lookup: self._forget(key, finished_lookup))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+
+        self._waiters[lookup] = self._waiters.get(lookup, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(lookup), remaining_time())
+        except asyncio.TimeoutError:
+            raise ValidationTimeoutException(collection) from None
+        finally:
+            self._waiters[lookup] -= 1
+            if not self._waiters[lookup]:
+                del self._waiters[lookup]
+                if not lookup.done():
+                    lookup.cancel()
+
+    def _forget(self, key: Hashable, lookup: asyncio.Future) -> None:
+        if self._in_flight.get(key) is lookup:
+            del self._in_flight[key]
+        if not lookup.cancelled():
+            lookup.exception()
+
+    def reset(self) -> None:
+        """
+        Forgets finished lookups and resets statistics. Has to be called when no lookup is in progress, e.g. between
+        runs of benchmark or profiler.
+        """
+
+        self._in_flight.clear()
+        self._waiters.clear()
+        self.lookups = 0
+        self.executed = 0
+        self.coalesced = 0
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns number of lookups, number of executed queries and coalescing ratio.
+        """
+
+        return {
+            "lookups": self.lookups,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+            "coalescing_ratio": self.coalesced / self.lookups if self.lookups else 0.0,
+        }
+
+
+lookup_coalescer: LookupCoalescer = LookupCoalescer()
@@ -0,0 +1,292 @@
+import asyncio
+from contextlib import contextmanager
+import itertools
+from random import Random
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+from unittest.mock import patch
+
+from models.users import User
+from models.items import Item
+from models.sc_element import SCElement
+
+
+def to_dictionary(document: Any) -> Dict[str, Any]:
+    """
+    Returns document as dictionary the way it is stored in the database.
+
+    :param document: Model object.
+    """
+
+    son: Dict[str, Any] = document.to_son() if hasattr(document, "to_son") else {
+        field: value for field, value in vars(document).items() if not field.startswith("_")}
+    son["_id"] = document._id
+    return son
+
+
+def _condition_values(condition: Any) -> List[Any]:
+    return list(condition["$in"]) if isinstance(condition, dict) and "$in" in condition else [condition]
+
+
+def _project(son: Dict[str, Any], projection: Optional[Dict[str, int]]) -> Dict[str, Any]:
+    if projection is None:
+        return son
+    return {field: value for field, value in son.items()
+            if projection.get(field) or (field == "_id" and projection.get(field, 1))}
+
+
+class InMemoryCursor:
+    """
+    Imitates cursor of Motor collection returned by InMemoryCollection.find method.
+    """
+
+    def __init__(self, collection: "InMemoryCollection", query: Dict[str, Any],
+                 projection: Optional[Dict[str, int]] = None):
+        self._collection: InMemoryCollection = collection
+        self._query: Dict[str, Any] = query
+        self._projection: Optional[Dict[str, int]] = projection
+        self._sort: Optional[Tuple[str, int]] = None
+        self._documents: Optional[List[Dict[str, Any]]] = None
+
+    def sort(self, field: str, direction: int = 1) -> "InMemoryCursor":
+        self._sort = (field, direction)
+        return self
+
+    def batch_size(self, size: int) -> "InMemoryCursor":
+        return self
+
+    async def _fetch(self) -> List[Dict[str, Any]]:
+        if self._documents is None:
+            await self._collection._delay()
+            self._documents = [_project(to_dictionary(document), self._projection)
+                               for document in self._collection.match(self._query)]
+            if self._sort is not None:
+                field, direction = self._sort
+                self._documents.sort(key=lambda document: document.get(field), reverse=direction < 0)
+        return self._documents
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        documents: List[Dict[str, Any]] = await self._fetch()
+        return list(documents if length is None else documents[:length])
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Dict[str, Any]]:
+        for document in await self._fetch():
+            yield document
+
+
+class InMemoryCollection:
+    """
+    In-memory stand-in for single collection. Keeps documents by id and hash indexes on given field combinations, so
+    lookups by id and by indexed fields do not scan the collection. Every lookup can be delayed by injected latency
+    with jitter to imitate round trip to the database.
+    """
+
+    def __init__(self, name: str, indexes: Iterable[Iterable[str]], latency: float = 0.0, jitter: float = 0.0,
+                 random: Optional[Random] = None):
+        self.name: str = name
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self._random: Random = random if random is not None else Random(0)
+        self.documents: Dict[str, Any] = {}
+        self._indexes: Dict[Tuple[str, ...], Dict[Tuple, List[str]]] = {tuple(sorted(fields)): {}
+                                                                       for fields in indexes}
+        self._index_keys: Dict[str, List[Tuple]] = {}
+        self._next_id: int = 0
+        self.queries: Dict[str, int] = {"id": 0, "index": 0, "scan": 0}
+        self.awaited: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def insert(self, document: Any) -> str:
+        """
+        Adds document to the collection and to its indexes. Document without id gets generated one.
+
+        :param document: Model object.
+
+        :return: Id of document.
+        """
+
+        if getattr(document, "_id", None) is None:
+            self._next_id += 1
+            document._id = "{}_{}".format(self.name, self._next_id)
+        document_id: str = str(document._id)
+        self.remove(document_id)
+        self.documents[document_id] = document
+        self._index_keys[document_id] = [tuple(getattr(document, field, None) for field in fields)
+                                         for fields in self._indexes]
+        for index, key in zip(self._indexes.values(), self._index_keys[document_id]):
+            index.setdefault(key, []).append(document_id)
+        return document_id
+
+    def update(self, document: Any) -> None:
+        """
+        Reindexes document which fields were changed.
+
+        :param document: Model object which was inserted before.
+        """
+
+        self.insert(document)
+
+    def remove(self, document_id: str) -> None:
+        """
+        Removes document with given id from the collection and its indexes. Does nothing if there is no such document.
+
+        :param document_id: Id of document.
+        """
+
+        document_id = str(document_id)
+        if self.documents.pop(document_id, None) is None:
+            return
+        for index, key in zip(self._indexes.values(), self._index_keys.pop(document_id)):
+            index[key].remove(document_id)
+            if not index[key]:
+                del index[key]
+
+    async def _delay(self) -> float:
+        delay: float = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+            self.awaited += delay
+        return delay
+
+    def lookup(self, *args: Any, **kwargs: Any) -> Optional[Any]:
+        """
+        Returns the first document which id is given as positional argument or which fields are equal to given keyword
+        arguments. Returns None if there is no such document.
+        """
+
+        if args:
+            self.queries["id"] += 1
+            return self.documents.get(str(args[0]))
+        fields: Tuple[str, ...] = tuple(sorted(kwargs))
+        index: Optional[Dict[Tuple, List[str]]] = self._indexes.get(fields)
+        if index is not None:
+            self.queries["index"] += 1
+            document_ids: List[str] = index.get(tuple(kwargs[field] for field in fields), [])
+            return self.documents[document_ids[0]] if document_ids else None
+        self.queries["scan"] += 1
+        for document in self.documents.values():
+            if all(getattr(document, field, None) == value for field, value in kwargs.items()):
+                return document
+        return None
+
+    async def get(self, *args: Any, **kwargs: Any) -> Optional[Any]:
+        """
+        Imitates QuerySet.get: waits for injected latency and returns result of lookup method.
+        """
+
+        await self._delay()
+        return self.lookup(*args, **kwargs)
+
+    async def find_one(self, query: Dict[str, Any], projection: Optional[Dict[str, int]] = None) -> Optional[Dict]:
+        """
+        Imitates find_one of Motor collection: waits for injected latency and returns matching document as dictionary
+        with only projected fields, if projection is given.
+
+        :param query: Field values to match; "_id" is looked up by id.
+        :param projection: Fields to return.
+        """
+
+        await self._delay()
+        query = dict(query)
+        document: Optional[Any] = self.lookup(query.pop("_id")) if "_id" in query else self.lookup(**query)
+        return None if document is None else _project(to_dictionary(document), projection)
+
+    def match(self, query: Dict[str, Any]) -> List[Any]:
+        """
+        Returns all documents matching given query. Condition of every field is either value or {"$in": values}.
+        Query by "_id" or by indexed fields does not scan the collection.
+
+        :param query: Field conditions to match.
+        """
+
+        conditions: Dict[str, List[Any]] = {field: _condition_values(condition) for field, condition in query.items()}
+        if "_id" in conditions:
+            self.queries["id"] += 1
+            candidates: List[Any] = [self.documents[str(document_id)] for document_id in conditions.pop("_id")
+                                     if str(document_id) in self.documents]
+        else:
+            fields: Tuple[str, ...] = tuple(sorted(conditions))
+            index: Optional[Dict[Tuple, List[str]]] = self._indexes.get(fields)
+            if index is not None:
+                self.queries["index"] += 1
+                document_ids: Dict[str, None] = {}
+                for key in itertools.product(*(conditions[field] for field in fields)):
+                    document_ids.update(dict.fromkeys(index.get(key, [])))
+                return [self.documents[document_id] for document_id in document_ids]
+            self.queries["scan"] += 1
+            candidates = list(self.documents.values())
+        return [document for document in candidates
+                if all(getattr(document, field, None) in values for field, values in conditions.items())]
+
+    def find(self, query: Dict[str, Any], projection: Optional[Dict[str, int]] = None) -> "InMemoryCursor":
+        """
+        Imitates find of Motor collection: returns cursor over matching documents as dictionaries with only projected
+        fields, if projection is given. Injected latency is awaited once the cursor is read.
+
+        :param query: Field conditions to match, see match method.
+        :param projection: Fields to return.
+        """
+
+        return InMemoryCursor(collection=self, query=query, projection=projection)
+
+    def statistics(self) -> Dict[str, Any]:
+        return {"documents": len(self.documents), "queries": dict(self.queries), "awaited": self.awaited}
+
+
+class InMemoryBackend:
+    """
+    In-memory stand-in for User, Item and SCElement collections with indexes on fields queried by validators.
+    Replaces motorengine.queryset.QuerySet.get and QuerySet.coll while patch context is active.
+    """
+
+    INDEXES: Dict[type, Tuple[str, List[Tuple[str, ...]]]] = {
+        User: ("users", [("login",), ("email",), ("title",)]),
+        Item: ("items", [("productNo", "is_parent")]),
+        SCElement: ("sc_elements", []),
+    }
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        random: Random = Random(seed)
+        self.collections: Dict[type, InMemoryCollection] = {
+            model: InMemoryCollection(name=name, indexes=indexes, latency=latency, jitter=jitter, random=random)
+            for model, (name, indexes) in self.INDEXES.items()}
+
+    def collection(self, model: type) -> InMemoryCollection:
+        return self.collections[model]
+
+    def add(self, *documents: Any) -> None:
+        """
+        Inserts given model objects into collections of their models.
+        """
+
+        for document in documents:
+            self.collection(type(document)).insert(document)
+
+    @contextmanager
+    def patch(self) -> Iterator["InMemoryBackend"]:
+        """
+        Routes QuerySet.get and QuerySet.coll of User, Item and SCElement to the backend while context is active.
+        """
+
+        backend: InMemoryBackend = self
+
+        async def get(queryset: Any, *args: Any, **kwargs: Any) -> Optional[Any]:
+            return await backend.collection(queryset.__klass__).get(*args, **kwargs)
+
+        def coll(queryset: Any, alias: Optional[str] = None) -> InMemoryCollection:
+            return backend.collection(queryset.__klass__)
+
+        with patch(target="motorengine.queryset.QuerySet.get", new=get), \
+                patch(target="motorengine.queryset.QuerySet.coll", new=coll):
+            yield self
+
+    def statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns number of documents, queries by kind and awaited latency of every collection.
+        """
+
+        return {collection.name: collection.statistics() for collection in self.collections.values()}
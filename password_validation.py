@@ -2,8 +2,36 @@ from typing import Optional
 
 from bcrypt import checkpw
 
+from models.validation.chain import BatchValidationMixin
 
-class PasswordValidator:
+
+def hash_cost(hashed_password: bytes) -> int:
+    """
+    Returns cost (log2 of rounds) of given bcrypt hash, e.g. 12 for b"$2b$12$...".
+
+    :param hashed_password: Bcrypt hash.
+    """
+
+    return int(hashed_password.split(b"$")[2])
+
+
+class BcryptCostPolicy:
+    def __init__(self, minimum_cost: int, maximum_cost: Optional[int] = None):
+        self.minimum_cost: int = minimum_cost
+        self.maximum_cost: Optional[int] = maximum_cost
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """
+        Returns True if cost of given hash is out of policy, so password has to be rehashed once it is verified.
+
+        :param hashed_password: Bcrypt hash.
+        """
+
+        cost: int = hash_cost(hashed_password)
+        return cost < self.minimum_cost or (self.maximum_cost is not None and cost > self.maximum_cost)
+
+
+class PasswordValidator(BatchValidationMixin):
     def __init__(self, next_validator: Optional["PasswordValidator"] = None):
         self.next_validator: Optional[PasswordValidator] = next_validator
 
@@ -119,18 +147,25 @@ class NewPasswordIsTheSameAsCurrentOneValidator:
 
 class OldPasswordIsNotTheSameAsCurrentOneValidator:
     @staticmethod
-    def validate(old_password: str, current_hashed_password: bytes) -> None:
+    def validate(old_password: str, current_hashed_password: bytes,
+                 cost_policy: Optional[BcryptCostPolicy] = None) -> bool:
         """
         Raises exception if old password is the same as current one.
 
         :param old_password: Password to validate.
         :param current_hashed_password: Hashed password to validate the first one regarding to another one.
+        :param cost_policy: Policy to check cost of current hashed password against.
+
+        :return: True if password was verified, but cost of current hashed password is out of given policy, so it has
+            to be rehashed now. Otherwise False.
         """
 
         from controller.ErrorHandler import OldPasswordIsNotTheSameAsCurrentOneException
 
         if not checkpw(password=old_password.encode("utf-8"), hashed_password=current_hashed_password):
             raise OldPasswordIsNotTheSameAsCurrentOneException
+        else:
+            return cost_policy is not None and cost_policy.needs_rehash(current_hashed_password)
 
 
 class PasswordIsNotTheSameAsRepeatPasswordValidator:
@@ -151,15 +186,22 @@ class PasswordIsNotTheSameAsRepeatPasswordValidator:
 
 class GivenPasswordIsNotTheSameAsCurrentOneValidator:
     @staticmethod
-    def validate(password: str, current_hashed_password: bytes) -> None:
+    def validate(password: str, current_hashed_password: bytes,
+                 cost_policy: Optional[BcryptCostPolicy] = None) -> bool:
         """
         Raises exception if given password is the same as current one.
 
         :param password: Password to validate.
         :param current_hashed_password: Hashed password to validate the first one regarding to another one.
+        :param cost_policy: Policy to check cost of current hashed password against.
+
+        :return: True if password was verified, but cost of current hashed password is out of given policy, so it has
+            to be rehashed now. Otherwise False.
         """
 
         from controller.ErrorHandler import GivenPasswordIsNotTheSameAsCurrentOneException
 
         if not checkpw(password=password.encode("utf-8"), hashed_password=current_hashed_password):
             raise GivenPasswordIsNotTheSameAsCurrentOneException
+        else:
+            return cost_policy is not None and cost_policy.needs_rehash(current_hashed_password)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+from array import array
+from time import time
+from typing import Optional, Dict, List, Iterable
+
+from models.items import Item
+
+
+class ProductAvailabilityIndex:
+    """
+    Compact availability state of products. Every indexed product owns a slot in an array of bytes which holds
+    bitmask of its enabled and draft flags and a slot in parallel array of doubles which holds end of its price valid
+    period, so thousands of products can be filtered without loading them and without raising exception per product.
+    Expiration is checked against current time on every read, so product expires without another update.
+
+    Index has to be kept up to date by calling update method whenever product is changed and remove method whenever
+    product is deleted.
+    """
+
+    ENABLED: int = 1
+    DRAFT: int = 2
+
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self._states: array = array("B")
+        self._valid_till: array = array("d")
+        self._free_slots: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, item_id: str) -> bool:
+        return str(item_id) in self._slots
+
+    def update(self, product: Item) -> None:
+        """
+        Stores current availability state of product.
+
+        :param product: Product object.
+        """
+
+        self.update_state(item_id=product._id, is_enable=product.is_enable, draft=product.draft,
+                          valid_till=getattr(product, "validTill", None))
+
+    def update_state(self, item_id: str, is_enable: bool, draft: bool, valid_till: Optional[float]) -> None:
+        """
+        Stores availability state of product with given id.
+
+        :param item_id: Product id.
+        :param is_enable: Whether product is enabled.
+        :param draft: Whether product is draft.
+        :param valid_till: End of price valid period as timestamp or None if product does not expire.
+        """
+
+        state: int = (self.ENABLED if is_enable else 0) | (self.DRAFT if draft else 0)
+        valid_till_value: float = float("inf") if valid_till is None else float(valid_till)
+        item_id = str(item_id)
+        slot: Optional[int] = self._slots.get(item_id)
+        if slot is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                self._states[slot] = state
+                self._valid_till[slot] = valid_till_value
+            else:
+                slot = len(self._states)
+                self._states.append(state)
+                self._valid_till.append(valid_till_value)
+            self._slots[item_id] = slot
+        else:
+            self._states[slot] = state
+            self._valid_till[slot] = valid_till_value
+
+    def remove(self, item_id: str) -> None:
+        """
+        Removes product with given id from the index. Does nothing if product is not indexed.
+
+        :param item_id: Product id.
+        """
+
+        slot: Optional[int] = self._slots.pop(str(item_id), None)
+        if slot is not None:
+            self._states[slot] = 0
+            self._free_slots.append(slot)
+
+    def state(self, item_id: str) -> Optional[int]:
+        """
+        Returns bitmask of enabled and draft flags of product with given id or None if product is not indexed.
+
+        :param item_id: Product id.
+        """
+
+        slot: Optional[int] = self._slots.get(str(item_id))
+        return None if slot is None else self._states[slot]
+
+    def is_expired(self, item_id: str) -> Optional[bool]:
+        """
+        Returns True if price valid period of product with given id is over at the moment, the same way
+        Item.is_expired does, or None if product is not indexed.
+
+        :param item_id: Product id.
+        """
+
+        slot: Optional[int] = self._slots.get(str(item_id))
+        return None if slot is None else self._valid_till[slot] < time()
+
+    def is_available(self, item_id: str) -> bool:
+        """
+        Returns True if product with given id is indexed, enabled, not draft and not expired.
+
+        :param item_id: Product id.
+        """
+
+        slot: Optional[int] = self._slots.get(str(item_id))
+        return slot is not None and self._states[slot] == self.ENABLED and self._valid_till[slot] >= time()
+
+    def filter_available(self, item_ids: Iterable[str]) -> List[str]:
+        """
+        Returns ids of products which are available, preserving given order. Products which are not indexed are
+        treated as unavailable.
+
+        :param item_ids: Product ids to filter.
+        """
+
+        slots: Dict[str, int] = self._slots
+        states: array = self._states
+        valid_till: array = self._valid_till
+        enabled: int = self.ENABLED
+        now: float = time()
+        available_item_ids: List[str] = []
+        for item_id in item_ids:
+            slot: Optional[int] = slots.get(str(item_id))
+            if slot is not None and states[slot] == enabled and valid_till[slot] >= now:
+                available_item_ids.append(item_id)
+        return available_item_ids
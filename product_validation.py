@@ -1,13 +1,38 @@
 from __future__ import annotations
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Mapping, FrozenSet, Any, Set
 from datetime import timedelta
 
 from models.items import Item
+from models.validation.chain import DictionaryBatchValidationMixin
+from models.validation.product_availability import ProductAvailabilityIndex
+from models.validation.database_limiter import database_limiter
+from models.validation.lookup_coalescing import lookup_coalescer
+from models.validation.queries import document_exists, existing_values
+from models.validation.records import ProductRecord
 
 
-class ProductValidator:
-    def __init__(self, next_validator: Optional[ProductValidator] = None):
+class ProductValidator(DictionaryBatchValidationMixin):
+    INPUT_FIELDS: Optional[FrozenSet[str]] = None
+    IS_DB_BACKED: bool = False
+    IS_TIME_DEPENDENT: bool = False
+
+    def __init__(self, next_validator: Optional[ProductValidator] = None,
+                 availability_index: Optional[ProductAvailabilityIndex] = None):
         self.next_validator: Optional[ProductValidator] = next_validator
+        self.availability_index: Optional[ProductAvailabilityIndex] = availability_index
+
+    def availability_state(self, product_to_validate: Item) -> Optional[int]:
+        """
+        Returns availability bitmask of product from availability index if validator has one and product is indexed.
+        Otherwise returns None.
+
+        :type product_to_validate: Item
+        :param product_to_validate: Product object.
+        """
+
+        if self.availability_index is None:
+            return None
+        return self.availability_index.state(product_to_validate._id)
 
     def validate(self, product_to_validate: Item) -> None:
 
@@ -24,6 +49,20 @@ class ProductValidator:
         if self.next_validator is not None:
             self.next_validator.validate(product_to_validate)
 
+    def validate_mapping(self, product_to_validate: Mapping) -> None:
+
+        """
+            Runs the same checks as validate method on product presented in form of mapping, e.g. request JSON or
+                projected DB document, without building Item object.
+
+            :type product_to_validate: Mapping
+            :param product_to_validate: Product presented in form of mapping.
+
+            :return: None
+        """
+
+        self.validate(ProductRecord.from_mapping(product_to_validate))
+
     async def validate_dictionary(self, product_to_validate: Dict) -> None:
         """
         Base implementation of validate dictionary method. Passes validation to the next validator if exists. Otherwise
@@ -37,6 +76,8 @@ class ProductValidator:
 
 
 class BlockValidator(ProductValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset()
+
     def validate(self, product_to_validate: Item) -> None:
 
         """
@@ -49,7 +90,10 @@ class BlockValidator(ProductValidator):
         """
 
         from controller.ErrorHandler import InactiveProductException
-        if not product_to_validate.is_enable:
+        state: Optional[int] = self.availability_state(product_to_validate)
+        is_enable: bool = product_to_validate.is_enable if state is None else bool(
+            state & ProductAvailabilityIndex.ENABLED)
+        if not is_enable:
             raise InactiveProductException
         else:
             super().validate(product_to_validate)
@@ -59,6 +103,8 @@ class BlockValidator(ProductValidator):
 
 
 class DraftValidator(ProductValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset()
+
     def validate(self, product_to_validate: Item) -> None:
 
         """
@@ -71,7 +117,9 @@ class DraftValidator(ProductValidator):
         """
 
         from controller.ErrorHandler import InactiveProductException
-        if product_to_validate.draft:
+        state: Optional[int] = self.availability_state(product_to_validate)
+        draft: bool = product_to_validate.draft if state is None else bool(state & ProductAvailabilityIndex.DRAFT)
+        if draft:
             raise InactiveProductException
         else:
             super().validate(product_to_validate)
@@ -81,6 +129,9 @@ class DraftValidator(ProductValidator):
 
 
 class ExpireValidator(ProductValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset()
+    IS_TIME_DEPENDENT: bool = True
+
     def validate(self, product_to_validate: Item) -> None:
 
         """
@@ -93,7 +144,11 @@ class ExpireValidator(ProductValidator):
         """
 
         from controller.ErrorHandler import InactiveProductException
-        if product_to_validate.is_expired():
+        is_expired: Optional[bool] = None if self.availability_index is None else \
+            self.availability_index.is_expired(product_to_validate._id)
+        if is_expired is None:
+            is_expired = product_to_validate.is_expired()
+        if is_expired:
             raise InactiveProductException
         else:
             super().validate(product_to_validate)
@@ -103,6 +158,9 @@ class ExpireValidator(ProductValidator):
 
 
 class ProductCodeAlreadyExistsValidator(ProductValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"productNo"})
+    IS_DB_BACKED: bool = True
+
     def validate(self, product_to_validate: Item) -> None:
         super().validate(product_to_validate)
 
@@ -115,14 +173,41 @@ class ProductCodeAlreadyExistsValidator(ProductValidator):
 
         from controller.ErrorHandler import ProductCodeAlreadyExistsException
 
-        if product_to_validate.get("productNo") and await Item.objects.get(
-                productNo=product_to_validate["productNo"].strip(), is_parent=True) is not None:
+        if product_to_validate.get("productNo") and await lookup_coalescer.run(
+                "items", document_exists, Item, productNo=product_to_validate["productNo"].strip(), is_parent=True):
             raise ProductCodeAlreadyExistsException
         else:
             await super().validate_dictionary(product_to_validate)
 
+    async def validate_dictionary_many(self, products_to_validate: List[Dict]) -> List[Optional[Exception]]:
+        """
+        Batched implementation of validate dictionary method. Codes of all products are looked up by single query;
+        products which passed are passed to the next validator.
+
+        :param products_to_validate: Products presented in form of dictionary.
+        """
+
+        from controller.ErrorHandler import ProductCodeAlreadyExistsException
+
+        outcomes: List[Optional[Exception]] = [None] * len(products_to_validate)
+        codes: Dict[int, str] = {}
+        for position, product_to_validate in enumerate(products_to_validate):
+            try:
+                if product_to_validate.get("productNo"):
+                    codes[position] = product_to_validate["productNo"].strip()
+            except Exception as exception:
+                outcomes[position] = exception
+        existing_codes: Set[Any] = await database_limiter.run(
+            "items", existing_values, Item, "productNo", set(codes.values()), is_parent=True) if codes else set()
+        for position, code in codes.items():
+            if code in existing_codes:
+                outcomes[position] = ProductCodeAlreadyExistsException()
+        return await self.validate_next_dictionary_many(products_to_validate, outcomes)
+
 
 class TooShortPriceValidPeriodValidator(ProductValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"valitFrom", "validTill"})
+
     def validate(self, product_to_validate: Item) -> None:
         super().validate(product_to_validate)
 
@@ -142,6 +227,8 @@ class TooShortPriceValidPeriodValidator(ProductValidator):
 
 
 class TooShortSalePeriodValidator(ProductValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"saleIsOn", "saleDateFrom", "saleDateTill"})
+
     def validate(self, product_to_validate: Item) -> None:
         super().validate(product_to_validate)
 
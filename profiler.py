@@ -0,0 +1,321 @@
+"""
+Profiles validator chain over generated or file-supplied inputs. Writes cProfile stats, which can be opened by pstats
+or snakeviz, and folded stacks, which can be turned into flame graph by flamegraph.pl or speedscope. C functions, e.g.
+bcrypt checkpw, are kept as separate frames of folded stacks, and time awaited on stand-in DB is added to them as
+"[db await <collection>]" frames under the validator which awaited it. cProfile and folded stacks are collected by
+separate runs over the same inputs, since both use the same interpreter hook. Every run starts with reset database
+limiter and lookup coalescer and keeps fewer payloads in flight than database limiter lets run at once. Exceptions
+which are not verdicts of validators, e.g. shed or timed out lookups, are counted as failures and reported, since
+profile of such run measures error paths instead of validation.
+
+Usage: python -m models.validation.profiler {password,address,product,signup} [--count 1000] [--input inputs.json]
+    [--stats chain.prof] [--folded chain.folded] [--latency 0.0005] [--bcrypt-cost 10] [--in-flight 50]
+"""
+import asyncio
+import cProfile
+import json
+import pstats
+import sys
+from argparse import ArgumentParser
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from random import Random
+from string import ascii_letters, digits
+from time import perf_counter
+from types import FrameType
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Optional, Tuple
+from unittest.mock import patch
+
+from bcrypt import gensalt, hashpw
+
+from models.validation.address_validation import NoPrimaryValidator, InvalidAddressLine1LengthValidator, \
+    InvalidAddressLine2LengthValidator
+from models.validation.database_limiter import DatabaseLimiter, database_limiter
+from models.validation.exceptions import ValidationException, ValidationTimeoutException, \
+    ValidationOverloadedException
+from models.validation.load_test import scenarios, seed_backend
+from models.validation.lookup_coalescing import lookup_coalescer
+from models.validation.memory_backend import InMemoryBackend, InMemoryCollection
+from models.validation.password_validation import InvalidLengthValidator, NoDigitValidator, \
+    NoLowercaseCharacterValidator, NoUppercaseCharacterValidator, WhitespaceValidator, \
+    GivenPasswordIsNotTheSameAsCurrentOneValidator
+
+CHAINS: Tuple[str, ...] = ("password", "address", "product", "signup")
+REFERENCE_PASSWORDS: int = 8
+VERDICT_MODULE: str = "controller.ErrorHandler"
+
+
+def is_verdict(exception: Exception) -> bool:
+    """
+    Returns True if exception is verdict of validator, i.e. exception of controller.ErrorHandler or exception of this
+    package which is not caused by load. Shed or timed out lookups and any other exceptions are failures of the run.
+
+    :param exception: Exception raised by chain.
+    """
+
+    if isinstance(exception, (ValidationTimeoutException, ValidationOverloadedException)):
+        return False
+    return isinstance(exception, ValidationException) or type(exception).__module__ == VERDICT_MODULE
+
+
+class FoldedStackProfiler:
+    """
+    Collects self time of every call stack by sys.setprofile hook. Coroutine frames are left on every await and
+    entered again on resume, so stacks of async chains are attributed correctly.
+    """
+
+    def __init__(self):
+        self.stacks: DefaultDict[Tuple[str, ...], float] = defaultdict(float)
+        self._stack: List[str] = []
+        self._last: float = 0.0
+
+    @staticmethod
+    def _frame_label(frame: FrameType) -> str:
+        return "{}:{}".format(frame.f_globals.get("__name__", "?"),
+                              getattr(frame.f_code, "co_qualname", frame.f_code.co_name))
+
+    @staticmethod
+    def _function_label(function: Any) -> str:
+        return "{}.{}".format(getattr(function, "__module__", None) or "builtins",
+                              getattr(function, "__qualname__", repr(function)))
+
+    def _profile(self, frame: FrameType, event: str, argument: Any) -> None:
+        now: float = perf_counter()
+        if self._stack:
+            self.stacks[tuple(self._stack)] += now - self._last
+        if event == "call":
+            self._stack.append(self._frame_label(frame))
+        elif event == "c_call":
+            self._stack.append(self._function_label(argument))
+        elif self._stack:
+            self._stack.pop()
+        self._last = perf_counter()
+
+    def add(self, label: str, duration: float) -> None:
+        """
+        Adds synthetic frame with given duration on top of stack of the caller.
+
+        :param label: Frame label.
+        :param duration: Duration in seconds.
+        """
+
+        self.stacks[tuple(self._stack[:-1]) + (label,)] += duration
+
+    def __enter__(self) -> "FoldedStackProfiler":
+        self._last = perf_counter()
+        sys.setprofile(self._profile)
+        return self
+
+    def __exit__(self, *exception_info: Any) -> None:
+        sys.setprofile(None)
+
+    def total(self, leaf_prefix: str = "") -> float:
+        """
+        Returns time of stacks which leaf frame starts with given prefix.
+
+        :param leaf_prefix: Prefix of leaf frame label, e.g. "bcrypt".
+        """
+
+        return sum(duration for stack, duration in self.stacks.items() if stack[-1].startswith(leaf_prefix))
+
+    def write(self, path: str) -> None:
+        """
+        Writes stacks in folded format, one "frame;frame;frame microseconds" line per stack.
+
+        :param path: File to write to.
+        """
+
+        with open(path, "w") as folded:
+            for stack, duration in sorted(self.stacks.items()):
+                microseconds: int = int(duration * 1000000)
+                if microseconds:
+                    folded.write("{} {}\n".format(";".join(stack), microseconds))
+
+
+@contextmanager
+def awaited_frames(profiler: FoldedStackProfiler) -> Iterator[None]:
+    """
+    Adds latency injected by InMemoryCollection to folded stacks as "[db await <collection>]" frames while context is
+    active. Time event loop spent scheduling other tasks before resume is not included.
+
+    :param profiler: Profiler to add frames to.
+    """
+
+    delay: Callable = InMemoryCollection._delay
+
+    async def traced_delay(collection: InMemoryCollection) -> float:
+        awaited: float = await delay(collection)
+        profiler.add("[db await {}]".format(collection.name), awaited)
+        return awaited
+
+    with patch.object(InMemoryCollection, "_delay", new=traced_delay):
+        yield
+
+
+def generate_passwords(random: Random, count: int) -> List[str]:
+    alphabet: str = ascii_letters + digits + " "
+    return ["".join(random.choice(alphabet) for _ in range(random.randint(6, 16))) for _ in range(count)]
+
+
+def generate_address_lists(random: Random, count: int) -> List[List[Dict]]:
+    return [[{"address1": "{} Main Street".format(random.randint(1, 9999)) if random.random() > 0.1 else "1 St",
+              "address2": "Suite {}".format(random.randint(1, 999)), "city": "Springfield", "zip": "12345",
+              "isPrimary": position == 0 and random.random() > 0.1}
+             for position in range(random.randint(1, 3))] for _ in range(count)]
+
+
+def workload(chain: str, inputs: Optional[List[Any]], count: int, seed: int, latency: float, bcrypt_cost: int,
+             max_in_flight: int = DatabaseLimiter.DEFAULT_MAX_CONCURRENCY
+             ) -> Tuple[Callable[[], None], Optional[InMemoryBackend], Counter]:
+    """
+    Prepares inputs and returns function which validates all of them by given chain, stand-in backend, if chain is
+    DB-backed, and counter of failures by exception type which the function fills. Preparation, e.g. hashing of
+    reference passwords and seeding of backend, is not profiled.
+
+    :param chain: One of CHAINS.
+    :param inputs: Inputs read from file or None to generate them.
+    :param count: Number of inputs to generate.
+    :param max_in_flight: Maximum number of payloads validated at once by DB-backed chain.
+    """
+
+    random: Random = Random(seed)
+    failures: Counter = Counter()
+
+    def record(exception: Optional[Exception]) -> None:
+        if exception is not None and not is_verdict(exception):
+            failures[type(exception).__qualname__] += 1
+
+    if chain == "password":
+        passwords: List[str] = inputs if inputs is not None else generate_passwords(random, count)
+        hashed_passwords: List[bytes] = [hashpw(password.encode("utf-8"), gensalt(rounds=bcrypt_cost))
+                                         for password in generate_passwords(random, REFERENCE_PASSWORDS)]
+        validator: Any = InvalidLengthValidator(NoDigitValidator(NoLowercaseCharacterValidator(
+            NoUppercaseCharacterValidator(WhitespaceValidator()))))
+
+        def run_passwords() -> None:
+            for number, password in enumerate(passwords):
+                try:
+                    validator.validate(password)
+                    GivenPasswordIsNotTheSameAsCurrentOneValidator.validate(
+                        password=password, current_hashed_password=hashed_passwords[number % len(hashed_passwords)])
+                except Exception as exception:
+                    record(exception)
+
+        return run_passwords, None, failures
+
+    if chain == "address":
+        address_lists: List[List[Dict]] = inputs if inputs is not None else generate_address_lists(random, count)
+        address_validator: Any = NoPrimaryValidator(InvalidAddressLine1LengthValidator(
+            InvalidAddressLine2LengthValidator()))
+
+        def run_addresses() -> None:
+            for outcome in address_validator.validate_many(address_lists):
+                record(outcome)
+
+        return run_addresses, None, failures
+
+    backend: InMemoryBackend = InMemoryBackend(latency=latency, seed=seed)
+    seed_backend(backend, count)
+    dictionary_validator, generate = scenarios(size=count, conflict_rate=0.1)[chain]
+    payloads: List[Dict] = inputs if inputs is not None else [generate(random, number) for number in range(count)]
+
+    async def validate_all() -> None:
+        in_flight: asyncio.Semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def validate(payload: Dict) -> None:
+            async with in_flight:
+                try:
+                    await dictionary_validator.validate_dictionary(payload)
+                except Exception as exception:
+                    record(exception)
+
+        await asyncio.gather(*(validate(payload) for payload in payloads))
+
+    def run_dictionaries() -> None:
+        database_limiter.reset()
+        lookup_coalescer.reset()
+        with backend.patch():
+            asyncio.run(validate_all())
+
+    return run_dictionaries, backend, failures
+
+
+def profile(chain: str, inputs: Optional[List[Any]] = None, count: int = 1000, seed: int = 0, latency: float = 0.0005,
+            bcrypt_cost: int = 10, stats_path: Optional[str] = None, folded_path: Optional[str] = None,
+            max_in_flight: int = DatabaseLimiter.DEFAULT_MAX_CONCURRENCY) -> Dict[str, Any]:
+    """
+    Profiles given chain and returns elapsed time of both runs, time spent in bcrypt, time awaited on stand-in DB
+    by collection and number of failures of both runs by exception type.
+
+    :param chain: One of CHAINS.
+    :param inputs: Inputs read from file or None to generate them.
+    :param stats_path: File to write cProfile stats to.
+    :param folded_path: File to write folded stacks to.
+    :param max_in_flight: Maximum number of payloads validated at once by DB-backed chain.
+    """
+
+    run, backend, failures = workload(chain=chain, inputs=inputs, count=count, seed=seed, latency=latency,
+                                      bcrypt_cost=bcrypt_cost, max_in_flight=max_in_flight)
+    report: Dict[str, Any] = {"chain": chain}
+
+    profiler: cProfile.Profile = cProfile.Profile()
+    started: float = perf_counter()
+    profiler.runcall(run)
+    report["cprofile_elapsed"] = perf_counter() - started
+    report["stats"] = pstats.Stats(profiler)
+    if stats_path:
+        profiler.dump_stats(stats_path)
+
+    awaited: Dict[str, float] = {name: collection["awaited"] for name, collection in backend.statistics().items()
+                                 } if backend is not None else {}
+    folded_profiler: FoldedStackProfiler = FoldedStackProfiler()
+    started = perf_counter()
+    with awaited_frames(folded_profiler), folded_profiler:
+        run()
+    report["folded_elapsed"] = perf_counter() - started
+    report["bcrypt"] = folded_profiler.total("bcrypt")
+    report["db_awaited"] = {name: collection["awaited"] - awaited[name]
+                            for name, collection in backend.statistics().items()
+                            if collection["awaited"] > awaited[name]} if backend is not None else {}
+    if folded_path:
+        folded_profiler.write(folded_path)
+    report["failures"] = dict(failures)
+    return report
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(description=__doc__)
+    parser.add_argument("chain", choices=CHAINS)
+    parser.add_argument("--count", type=int, default=1000, help="Number of inputs to generate.")
+    parser.add_argument("--input", help="JSON file with array of inputs: passwords, address lists or dictionaries.")
+    parser.add_argument("--stats", help="File to write cProfile stats to.")
+    parser.add_argument("--folded", help="File to write folded stacks to.")
+    parser.add_argument("--latency", type=float, default=0.0005, help="Latency of stand-in backend in seconds.")
+    parser.add_argument("--bcrypt-cost", type=int, default=10, help="Cost of reference password hashes.")
+    parser.add_argument("--in-flight", type=int, default=DatabaseLimiter.DEFAULT_MAX_CONCURRENCY,
+                        help="Maximum number of payloads validated at once by DB-backed chain.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=20, help="Number of the most expensive functions to print.")
+    arguments = parser.parse_args()
+
+    inputs: Optional[List[Any]] = None
+    if arguments.input:
+        with open(arguments.input) as input_file:
+            inputs = json.load(input_file)
+
+    report: Dict[str, Any] = profile(chain=arguments.chain, inputs=inputs, count=arguments.count,
+                                     seed=arguments.seed, latency=arguments.latency,
+                                     bcrypt_cost=arguments.bcrypt_cost, stats_path=arguments.stats,
+                                     folded_path=arguments.folded, max_in_flight=arguments.in_flight)
+    report["stats"].sort_stats("cumulative").print_stats(arguments.top)
+    print("Elapsed: {:.3f} s under cProfile, {:.3f} s under folded stack profiler".format(
+        report["cprofile_elapsed"], report["folded_elapsed"]))
+    print("Time in bcrypt: {:.3f} s".format(report["bcrypt"]))
+    for name, awaited in report["db_awaited"].items():
+        print("Awaited on {}: {:.3f} s".format(name, awaited))
+    for name, failed in report["failures"].items():
+        print("Failed with {}: {}".format(name, failed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from bson import ObjectId
+
+
+def object_id(document_id: Any) -> Any:
+    """
+    Returns ObjectId of given id if it is valid one. Otherwise returns id as is.
+
+    :param document_id: Document id.
+    """
+
+    return ObjectId(document_id) if isinstance(document_id, str) and ObjectId.is_valid(document_id) else document_id
+
+
+async def document_exists(model: type, **query: Any) -> bool:
+    """
+    Returns True if collection of given model contains document matching given query. Fetches at most one document
+    and only its id, without building model object.
+
+    :param model: Model class, e.g. User.
+    """
+
+    return await model.objects.coll().find_one(query, {"_id": 1}) is not None
+
+
+async def find_projected(model: type, document_id: Any, fields: Iterable[str]) -> Optional[Dict[str, Any]]:
+    """
+    Returns given fields of document of given model with given id as dictionary or None if there is no such document.
+    Model object is not built.
+
+    :param model: Model class, e.g. Item.
+    :param document_id: Document id.
+    :param fields: Fields to fetch.
+    """
+
+    return await model.objects.coll().find_one({"_id": object_id(document_id)}, {field: 1 for field in fields})
+
+
+async def existing_values(model: type, field: str, values: Iterable[Any], **query: Any) -> Set[Any]:
+    """
+    Returns those of given values of field which are used by documents of given model matching query. All values are
+    looked up by single query which fetches only the field.
+
+    :param model: Model class, e.g. User.
+    :param field: Field to look up, e.g. "login".
+    :param values: Values to look up.
+    """
+
+    documents: List[Dict[str, Any]] = await model.objects.coll().find(
+        {field: {"$in": list(values)}, **query}, {field: 1, "_id": 0}).to_list(length=None)
+    return {document[field] for document in documents}
+
+
+async def find_projected_many(model: type, document_ids: Iterable[Any],
+                              fields: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns given fields of documents of given model with given ids as dictionaries keyed by string id. All documents
+    are fetched by single query; ids without document are missing from the result.
+
+    :param model: Model class, e.g. Item.
+    :param document_ids: Document ids.
+    :param fields: Fields to fetch.
+    """
+
+    documents: List[Dict[str, Any]] = await model.objects.coll().find(
+        {"_id": {"$in": [object_id(document_id) for document_id in document_ids]}},
+        {field: 1 for field in fields}).to_list(length=None)
+    return {str(document["_id"]): document for document in documents}
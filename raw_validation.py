@@ -0,0 +1,188 @@
+"""
+Fused decoding and validation of raw JSON request bodies. Only fields read by validator chain and held by the
+requested record are decoded: with msgspec other fields are skipped by the decoder itself, otherwise payload is
+decoded by orjson or json and reduced to needed fields right away. Bodies which are too large, have unexpected
+structure, miss required fields or have fields of other types than record declares are rejected before the chain
+runs.
+"""
+import json
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Type, Union
+
+from models.validation.chain import unroll_chain
+from models.validation.exceptions import InvalidPayloadException
+from models.validation.records import PayloadRecord
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MAXIMUM_PAYLOAD_SIZE: int = 64 * 1024
+
+_structs: Dict[Tuple[str, ...], Any] = {}
+
+
+def chain_input_fields(validator: Any) -> Optional[FrozenSet[str]]:
+    """
+    Returns fields read by all validators of chain which starts with given validator or None if some validator does
+    not declare INPUT_FIELDS.
+
+    :param validator: The first validator of chain.
+    """
+
+    fields: Set[str] = set()
+    for chain_validator in unroll_chain(validator):
+        if chain_validator.INPUT_FIELDS is None:
+            return None
+        fields |= chain_validator.INPUT_FIELDS
+    return frozenset(fields)
+
+
+Schema = Tuple[Tuple[str, Optional[type], bool], ...]
+
+
+def _struct(schema: Schema) -> Any:
+    struct: Optional[Any] = _structs.get(schema)
+    if struct is None:
+        struct = msgspec.defstruct("Payload", [
+            (field, field_type, msgspec.NODEFAULT) if is_required else
+            (field, Union[field_type, msgspec.UnsetType] if field_type is not None else Any, msgspec.UNSET)
+            for field, field_type, is_required in schema], kw_only=True)
+        _structs[schema] = struct
+    return struct
+
+
+def _struct_to_dictionary(payload: Any, schema: Schema) -> Dict[str, Any]:
+    dictionary: Dict[str, Any] = {}
+    for field, _, _ in schema:
+        value: Any = getattr(payload, field)
+        if value is not msgspec.UNSET:
+            dictionary[field] = value
+    return dictionary
+
+
+def _is_of_type(value: Any, field_type: type) -> bool:
+    if isinstance(value, bool) and field_type is not bool:
+        return False
+    return isinstance(value, (int, float) if field_type is float else field_type)
+
+
+def _to_dictionary(payload: Any, schema: Schema, reduce: bool) -> Dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise InvalidPayloadException("object expected")
+    for field, field_type, is_required in schema:
+        if field not in payload:
+            if is_required:
+                raise InvalidPayloadException("missing field {}".format(field))
+        elif field_type is not None and not _is_of_type(payload[field], field_type):
+            raise InvalidPayloadException("field {} must be {}".format(field, field_type.__name__))
+    return {field: payload[field] for field, _, _ in schema if field in payload} if reduce else payload
+
+
+def decode(raw: bytes, schema: Schema, many: bool = False, reduce: bool = True) -> Any:
+    """
+    Decodes JSON object or, if many is True, every object of JSON array and checks that fields of schema are of their
+    types and that required ones are present. If reduce is False, the whole objects are decoded.
+
+    :param raw: Raw request body.
+    :param schema: Field, its type or None if type is not checked, and whether field is required, sorted by field.
+    :param many: Whether body is array of objects.
+    :param reduce: Whether only fields of schema are decoded.
+    """
+
+    if len(raw) > MAXIMUM_PAYLOAD_SIZE:
+        raise InvalidPayloadException("payload is too large")
+
+    if msgspec is not None and reduce:
+        try:
+            payload: Any = msgspec.json.decode(raw, type=List[_struct(schema)] if many else _struct(schema))
+        except msgspec.ValidationError as error:
+            raise InvalidPayloadException(str(error)) from None
+        except msgspec.DecodeError:
+            raise InvalidPayloadException("malformed JSON") from None
+        dictionaries: List[Dict[str, Any]] = [_struct_to_dictionary(decoded_object, schema)
+                                              for decoded_object in (payload if many else [payload])]
+        return dictionaries if many else dictionaries[0]
+
+    try:
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError:
+        raise InvalidPayloadException("malformed JSON") from None
+    if many and not isinstance(payload, list):
+        raise InvalidPayloadException("array of objects expected")
+    if many:
+        return [_to_dictionary(decoded_object, schema, reduce) for decoded_object in payload]
+    return _to_dictionary(payload, schema, reduce)
+
+
+def _schema(validator: Any, record_type: Type[PayloadRecord]) -> Tuple[Schema, bool]:
+    """
+    Returns schema of payload which given chain validates and record type holds, and whether payload can be reduced to
+    fields of schema. Fields of record which chain reads are required if record declares them so; if some validator
+    does not declare INPUT_FIELDS, the whole payload is kept and all required fields of record are required.
+    """
+
+    input_fields: Optional[FrozenSet[str]] = chain_input_fields(validator)
+    fields: FrozenSet[str] = frozenset(record_type.fields()) | (input_fields or frozenset())
+    required: FrozenSet[str] = record_type.REQUIRED_FIELDS if input_fields is None else \
+        record_type.REQUIRED_FIELDS & input_fields
+    return tuple((field, record_type.FIELD_TYPES.get(field), field in required) for field in sorted(fields)), \
+        input_fields is not None
+
+
+def _decode(raw: bytes, validator: Any, record_type: Type[PayloadRecord], many: bool = False) -> Any:
+    schema, reduce = _schema(validator, record_type)
+    payload: Any = decode(raw, schema, many=many, reduce=reduce)
+    for decoded_object in (payload if many else [payload]):
+        record_type.check(decoded_object)
+    return payload
+
+
+def decode_and_validate(raw: bytes, validator: Any, record_type: Type[PayloadRecord]) -> PayloadRecord:
+    """
+    Decodes raw body, e.g. review, validates it by validate method of given chain and returns it as record.
+
+    :param raw: Raw request body.
+    :param validator: The first validator of chain, e.g. ReviewValidator chain.
+    :param record_type: Type of record to return, e.g. ReviewPayloadRecord.
+    """
+
+    payload: Dict[str, Any] = _decode(raw, validator, record_type)
+    validator.validate(payload)
+    return record_type.from_mapping(payload)
+
+
+def decode_and_validate_list(raw: bytes, validator: Any, record_type: Type[PayloadRecord]) -> List[PayloadRecord]:
+    """
+    Decodes raw body which is array of objects, e.g. addresses, validates it by validate method of given chain and
+    returns it as list of records.
+
+    :param raw: Raw request body.
+    :param validator: The first validator of chain, e.g. AddressValidator chain.
+    :param record_type: Type of records to return, e.g. AddressPayloadRecord.
+    """
+
+    payload: List[Dict[str, Any]] = _decode(raw, validator, record_type, many=True)
+    validator.validate(payload)
+    return [record_type.from_mapping(decoded_object) for decoded_object in payload]
+
+
+async def decode_and_validate_dictionary(raw: bytes, validator: Any,
+                                         record_type: Type[PayloadRecord]) -> PayloadRecord:
+    """
+    Decodes raw body, e.g. user signup or product, validates it by validate dictionary method of given chain and
+    returns it as record.
+
+    :param raw: Raw request body.
+    :param validator: The first validator of chain, e.g. UserValidator or ProductValidator chain.
+    :param record_type: Type of record to return, e.g. SignupPayloadRecord or ProductPayloadRecord.
+    """
+
+    payload: Dict[str, Any] = _decode(raw, validator, record_type)
+    await validator.validate_dictionary(payload)
+    return record_type.from_mapping(payload)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from models.items import Item
+from models.validation.exceptions import InvalidPayloadException
+
+
+def required(mapping: Mapping, field: str) -> Any:
+    """
+    Returns value of given field of mapping. Raises exception if mapping has no such field, so that partial mapping,
+    e.g. document projected without the field, does not pass validators by default value.
+
+    :param mapping: Entity presented in form of mapping.
+    :param field: Field name.
+    """
+
+    try:
+        return mapping[field]
+    except KeyError:
+        raise InvalidPayloadException("missing field {}".format(field)) from None
+
+
+class ProductRecord:
+    """
+    Lightweight stand-in for Item which holds only fields read by product validators.
+    """
+
+    __slots__ = ("_id", "is_enable", "draft", "validTill")
+
+    def __init__(self, is_enable: bool, draft: bool, validTill: Optional[float], _id: Any = None):
+        self._id: Any = _id
+        self.is_enable: bool = is_enable
+        self.draft: bool = draft
+        self.validTill: Optional[float] = validTill
+
+    is_expired = Item.is_expired
+
+    @classmethod
+    def from_mapping(cls, product: Mapping) -> ProductRecord:
+        """
+        Creates record from product presented in form of mapping, e.g. request JSON or projected DB document. Raises
+        exception if any of is_enable, draft and validTill fields is missing.
+
+        :param product: Product presented in form of mapping.
+        """
+
+        return cls(_id=product.get("_id", product.get("ID")), is_enable=required(product, "is_enable"),
+                   draft=required(product, "draft"), validTill=required(product, "validTill"))
+
+
+class UserRecord:
+    """
+    Lightweight stand-in for User which holds only fields read by user validators.
+    """
+
+    __slots__ = ("_id", "is_enable", "email_conform")
+
+    def __init__(self, is_enable: bool, email_conform: bool, _id: Any = None):
+        self._id: Any = _id
+        self.is_enable: bool = is_enable
+        self.email_conform: bool = email_conform
+
+    @classmethod
+    def from_mapping(cls, user: Mapping) -> UserRecord:
+        """
+        Creates record from user presented in form of mapping, e.g. request JSON or projected DB document. Raises
+        exception if is_enable or email_conform field is missing.
+
+        :param user: User presented in form of mapping.
+        """
+
+        return cls(_id=user.get("_id", user.get("ID")), is_enable=required(user, "is_enable"),
+                   email_conform=required(user, "email_conform"))
+
+
+class ShoppingListElementRecord:
+    """
+    Lightweight stand-in for ShoppingListElement which holds only fields read by shopping list element validators.
+    """
+
+    __slots__ = ("_id", "is_custom", "name")
+
+    def __init__(self, is_custom: bool, name: str = "", _id: Any = None):
+        self._id: Any = _id
+        self.is_custom: bool = is_custom
+        self.name: str = name
+
+    @classmethod
+    def from_mapping(cls, shopping_list_element: Mapping) -> ShoppingListElementRecord:
+        """
+        Creates record from shopping list element presented in form of mapping. Raises exception if is_custom field is
+        missing; missing name of custom element is treated as empty one and fails name validation.
+
+        :param shopping_list_element: Shopping list element presented in form of mapping.
+        """
+
+        return cls(_id=shopping_list_element.get("_id", shopping_list_element.get("ID")),
+                   is_custom=required(shopping_list_element, "is_custom"),
+                   name=shopping_list_element.get("name") or "")
+
+
+class ShoppingCartElementRecord:
+    """
+    Lightweight stand-in for SCElement which holds only fields read by shopping cart element validators.
+    """
+
+    __slots__ = ("_id", "item_id")
+
+    def __init__(self, _id: Any = None, item_id: Any = None):
+        self._id: Any = _id
+        self.item_id: Any = item_id
+
+    @classmethod
+    def from_mapping(cls, shopping_cart_element: Mapping) -> ShoppingCartElementRecord:
+        """
+        Creates record from shopping cart element presented in form of mapping.
+
+        :param shopping_cart_element: Shopping cart element presented in form of mapping.
+        """
+
+        return cls(_id=shopping_cart_element.get("_id", shopping_cart_element.get("ID")),
+                   item_id=shopping_cart_element.get("item_id"))
+
+
+class PayloadRecord:
+    """
+    Base of compact records decoded from raw request bodies. Subclasses declare type of every field they hold in
+    FIELD_TYPES and fields which must be present, if validator chain reads them, in REQUIRED_FIELDS; fields missing in
+    the payload are None.
+    """
+
+    __slots__ = ()
+    FIELD_TYPES: Dict[str, type] = {}
+    REQUIRED_FIELDS: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def fields(cls) -> Tuple[str, ...]:
+        """
+        Returns fields of record, including fields of base records.
+        """
+
+        return tuple(field for record_type in reversed(cls.__mro__) for field in getattr(record_type, "__slots__", ()))
+
+    @classmethod
+    def check(cls, payload: Mapping) -> None:
+        """
+        Raises exception if decoded payload, which fields are already of declared types, violates constraint between
+        its fields. Base implementation has no such constraints.
+
+        :param payload: Decoded payload.
+        """
+
+    @classmethod
+    def from_mapping(cls, payload: Mapping) -> PayloadRecord:
+        """
+        Creates record from payload presented in form of mapping.
+
+        :param payload: Decoded payload.
+        """
+
+        record: PayloadRecord = cls.__new__(cls)
+        for field in cls.fields():
+            setattr(record, field, payload.get(field))
+        return record
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        """
+        Returns fields of record which are present in the payload.
+        """
+
+        return {field: getattr(self, field) for field in self.fields() if getattr(self, field) is not None}
+
+
+class ReviewPayloadRecord(PayloadRecord):
+    FIELD_TYPES: Dict[str, type] = {"rating": int, "body": str, "item_id": str, "user_id": str}
+    REQUIRED_FIELDS: FrozenSet[str] = frozenset({"rating", "body"})
+    __slots__ = tuple(FIELD_TYPES)
+
+
+class AddressPayloadRecord(PayloadRecord):
+    FIELD_TYPES: Dict[str, type] = {"isPrimary": bool, "address1": str, "address2": str}
+    REQUIRED_FIELDS: FrozenSet[str] = frozenset({"isPrimary", "address1"})
+    __slots__ = tuple(FIELD_TYPES)
+
+
+class SignupPayloadRecord(PayloadRecord):
+    FIELD_TYPES: Dict[str, type] = {"login": str, "email": str, "title": str}
+    REQUIRED_FIELDS: FrozenSet[str] = frozenset({"login", "email", "title"})
+    __slots__ = tuple(FIELD_TYPES)
+
+
+class ProductPayloadRecord(PayloadRecord):
+    FIELD_TYPES: Dict[str, type] = {"productNo": str, "valitFrom": float, "validTill": float, "saleIsOn": bool,
+                                    "saleDateFrom": float, "saleDateTill": float}
+    REQUIRED_FIELDS: FrozenSet[str] = frozenset({"valitFrom", "validTill"})
+    __slots__ = tuple(FIELD_TYPES)
+
+    @classmethod
+    def check(cls, payload: Mapping) -> None:
+        """
+        Raises exception if sale is on and any of sale dates is missing.
+
+        :param payload: Decoded payload.
+        """
+
+        if payload.get("saleIsOn"):
+            for field in ("saleDateFrom", "saleDateTill"):
+                required(payload, field)
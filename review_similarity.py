@@ -0,0 +1,147 @@
+from __future__ import annotations
+import json
+import os
+import re
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Dict, List, Set, Tuple
+
+_WORD_PATTERN = re.compile(r"\w+")
+_MASK: int = (1 << 64) - 1
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """
+    Returns 64-bit SimHash fingerprint of given text. Text is compared by case-insensitive word shingles, so texts
+    which differ only in case, punctuation or whitespaces have the same fingerprint.
+
+    Bit of fingerprint is set if more than half of shingle hashes have it set. Shingle hashes are summed by bit-sliced
+    counter, i.e. counter_bits[i] keeps i-th bit of all 64 counts at once, so every shingle costs a few operations on
+    64-bit integers instead of 64 per-bit updates.
+
+    :param text: Text to fingerprint.
+    :param shingle_size: Number of words in single shingle.
+    """
+
+    words: List[str] = _WORD_PATTERN.findall(text.lower())
+    shingles: Set[str] = {" ".join(words[position:position + shingle_size])
+                          for position in range(max(len(words) - shingle_size + 1, 1))}
+    counter_bits: List[int] = []
+    for shingle in shingles:
+        carry: int = int.from_bytes(blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for position, counter_bit in enumerate(counter_bits):
+            counter_bits[position], carry = counter_bit ^ carry, counter_bit & carry
+            if not carry:
+                break
+        else:
+            counter_bits.append(carry)
+    return _greater_than(counter_bits, len(shingles) // 2)
+
+
+def _greater_than(counter_bits: List[int], threshold: int) -> int:
+    """
+    Returns 64-bit mask of counts of bit-sliced counter which are greater than threshold, comparing counts from the most
+    significant bit down.
+    """
+
+    greater: int = 0
+    equal: int = _MASK
+    for position in reversed(range(max(len(counter_bits), threshold.bit_length()))):
+        counter_bit: int = counter_bits[position] if position < len(counter_bits) else 0
+        if threshold >> position & 1:
+            equal &= counter_bit
+        else:
+            greater |= equal & counter_bit
+            equal &= ~counter_bit
+    return greater
+
+
+class SimHashIndex:
+    """
+    Bounded in-memory index of SimHash fingerprints grouped by scope, e.g. product or author. Fingerprint is split into
+    maximum distance + 1 bands, so fingerprints within maximum distance always share at least one band and can be
+    found without scanning the whole scope. The oldest fingerprints are evicted once index is full.
+    """
+
+    def __init__(self, max_size: int = 100000, max_distance: int = 7):
+        self.max_size: int = max_size
+        self.max_distance: int = max_distance
+        self.bands: int = max_distance + 1
+        self.band_bits: int = 64 // self.bands
+        self._entries: OrderedDict[Tuple[str, int], None] = OrderedDict()
+        self._bands: Dict[Tuple[str, int, int], Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _band_keys(self, scope: str, fingerprint: int) -> List[Tuple[str, int, int]]:
+        mask: int = (1 << self.band_bits) - 1
+        return [(scope, band, fingerprint >> band * self.band_bits & mask) for band in range(self.bands - 1)] + [
+            (scope, self.bands - 1, fingerprint >> (self.bands - 1) * self.band_bits)]
+
+    def contains_near_duplicate(self, scope: str, fingerprint: int) -> bool:
+        """
+        Returns True if scope contains fingerprint which differs from given one in no more than maximum distance bits.
+
+        :param scope: Scope to search in.
+        :param fingerprint: SimHash fingerprint.
+        """
+
+        for band_key in self._band_keys(scope, fingerprint):
+            for candidate in self._bands.get(band_key, ()):
+                if bin(candidate ^ fingerprint).count("1") <= self.max_distance:
+                    return True
+        return False
+
+    def add(self, scope: str, fingerprint: int) -> None:
+        """
+        Adds fingerprint to scope, evicting the oldest fingerprint if index is full.
+
+        :param scope: Scope to add fingerprint to.
+        :param fingerprint: SimHash fingerprint.
+        """
+
+        entry: Tuple[str, int] = (scope, fingerprint)
+        if entry in self._entries:
+            self._entries.move_to_end(entry)
+            return
+        self._entries[entry] = None
+        for band_key in self._band_keys(scope, fingerprint):
+            self._bands.setdefault(band_key, set()).add(fingerprint)
+        while len(self._entries) > self.max_size:
+            self._evict(*self._entries.popitem(last=False)[0])
+
+    def _evict(self, scope: str, fingerprint: int) -> None:
+        for band_key in self._band_keys(scope, fingerprint):
+            band: Set[int] = self._bands[band_key]
+            band.discard(fingerprint)
+            if not band:
+                del self._bands[band_key]
+
+    def save(self, path: str) -> None:
+        """
+        Saves snapshot of the index to local file.
+
+        :param path: Path of snapshot file.
+        """
+
+        temporary_path: str = path + ".tmp"
+        with open(temporary_path, "w") as snapshot:
+            json.dump({"max_size": self.max_size, "max_distance": self.max_distance,
+                       "entries": [[scope, fingerprint] for scope, fingerprint in self._entries]}, snapshot)
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> SimHashIndex:
+        """
+        Loads index from snapshot file.
+
+        :param path: Path of snapshot file.
+        """
+
+        with open(path) as snapshot:
+            data: Dict = json.load(snapshot)
+        index: SimHashIndex = cls(max_size=data["max_size"], max_distance=data["max_distance"])
+        for scope, fingerprint in data["entries"]:
+            index.add(scope, fingerprint)
+        return index
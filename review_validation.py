@@ -1,8 +1,13 @@
 from __future__ import annotations
-from typing import Optional, Dict
+from typing import Optional, Dict, List, FrozenSet
 
+from models.validation.chain import BatchValidationMixin, collect_outcomes
+from models.validation.review_similarity import SimHashIndex, simhash
+
+
+class ReviewValidator(BatchValidationMixin):
+    INPUT_FIELDS: Optional[FrozenSet[str]] = None
 
-class ReviewValidator:
     def __init__(self, next_validator: Optional[ReviewValidator] = None):
         self.next_validator: Optional[ReviewValidator] = next_validator
 
@@ -23,6 +28,8 @@ class ReviewValidator:
 
 
 class RatingValidator(ReviewValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"rating"})
+
     def validate(self, review_to_validate: Dict) -> None:
 
         """
@@ -46,6 +53,8 @@ class RatingValidator(ReviewValidator):
 
 
 class BodyValidator(ReviewValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"body"})
+
     def validate(self, review_to_validate: Dict) -> None:
 
         """
@@ -66,3 +75,54 @@ class BodyValidator(ReviewValidator):
             raise InvalidReviewBodyException
         else:
             super().validate(review_to_validate)
+
+
+class DuplicateBodyValidator(ReviewValidator):
+    IS_STATEFUL: bool = True
+    PRODUCT_ID_FIELD: str = "item_id"
+    AUTHOR_ID_FIELD: str = "user_id"
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"body", PRODUCT_ID_FIELD, AUTHOR_ID_FIELD})
+
+    def __init__(self, next_validator: Optional[ReviewValidator] = None, index: Optional[SimHashIndex] = None):
+        super().__init__(next_validator)
+        self.index: SimHashIndex = index if index is not None else SimHashIndex()
+
+    def validate(self, review_to_validate: Dict) -> None:
+
+        """
+            Raises exception if review body is the same as or nearly the same as body of another review of the same
+                product or author. Otherwise passes review to base validator and remembers its body if the rest of
+                the chain passes.
+
+            :type review_to_validate: Dict
+            :param review_to_validate: Review fields presented in form of dictionary.
+
+            :return: None
+        """
+
+        from models.validation.exceptions import DuplicateReviewBodyException
+
+        fingerprint: int = simhash(review_to_validate["body"])
+        scopes: List[str] = ["{}:{}".format(field, review_to_validate[field])
+                             for field in (self.PRODUCT_ID_FIELD, self.AUTHOR_ID_FIELD) if review_to_validate.get(field)]
+
+        if any(self.index.contains_near_duplicate(scope, fingerprint) for scope in scopes):
+            raise DuplicateReviewBodyException
+        else:
+            super().validate(review_to_validate)
+            for scope in scopes:
+                self.index.add(scope, fingerprint)
+
+    def validate_many(self, reviews_to_validate: List[Dict]) -> List[Optional[Exception]]:
+
+        """
+            Validates every given review by the whole chain which starts with this validator, one review after
+                another, since body is remembered only if the rest of the chain passes.
+
+            :type reviews_to_validate: List[Dict]
+            :param reviews_to_validate: Review fields presented in form of dictionary.
+
+            :return: Exception raised for every review or None if review is valid.
+        """
+
+        return collect_outcomes(self.validate, reviews_to_validate)
@@ -0,0 +1,209 @@
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from copy import deepcopy
+from random import Random
+from time import perf_counter, time
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from models.validation.database_limiter import run_without_deadline, validation_deadline
+
+
+def _verdict(outcome: Optional[Exception]) -> Optional[str]:
+    return None if outcome is None else type(outcome).__qualname__
+
+
+class ShadowMismatch:
+    """
+    Payload on which primary and candidate chains gave different verdicts. Payload itself is not kept, since it may
+    contain passwords or personal data.
+    """
+
+    __slots__ = ("method", "primary", "candidate", "primary_latency", "candidate_latency", "recorded_at")
+
+    def __init__(self, method: str, primary: Optional[str], candidate: Optional[str], primary_latency: float,
+                 candidate_latency: float):
+        self.method: str = method
+        self.primary: Optional[str] = primary
+        self.candidate: Optional[str] = candidate
+        self.primary_latency: float = primary_latency
+        self.candidate_latency: float = candidate_latency
+        self.recorded_at: float = time()
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class ShadowRunner:
+    """
+    Runs candidate chain alongside primary one on sampled share of calls, e.g. to check that reordered or rewritten
+    chain gives the same verdicts and is faster. Callers always get outcome of primary chain; candidate runs after it
+    off the critical path: in executor for validate method and as separate task for validate dictionary method.
+    Verdicts, i.e. None or type of raised exception, are compared and latency difference is recorded. Candidate gets
+    deep copy of arguments taken before primary chain runs, and runs outside of deadline of the caller, with its own
+    deadline if candidate_timeout is given. Sampled calls are dropped while max_pending candidate runs are in progress,
+    so candidate can not pile up work behind slow chain. Candidate should not share stateful validators, e.g.
+    DuplicateBodyValidator, with primary chain.
+    """
+
+    def __init__(self, primary: Any, candidate: Any, sample_rate: float = 0.01, mismatch_log_size: int = 100,
+                 latency_window: int = 1000, executor: Optional[Executor] = None, random: Optional[Random] = None,
+                 max_pending: int = 100, candidate_timeout: Optional[float] = None):
+        self.primary: Any = primary
+        self.candidate: Any = candidate
+        self.sample_rate: float = sample_rate
+        self.mismatches: Deque[ShadowMismatch] = deque(maxlen=mismatch_log_size)
+        self.latency_deltas: Deque[float] = deque(maxlen=latency_window)
+        self._executor: Executor = executor if executor is not None else ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="shadow-validation")
+        self._random: Random = random if random is not None else Random()
+        self.max_pending: int = max_pending
+        self.candidate_timeout: Optional[float] = candidate_timeout
+        self._lock: threading.Lock = threading.Lock()
+        self._futures: Set[Future] = set()
+        self._tasks: Set[asyncio.Future] = set()
+        self.calls: int = 0
+        self.sampled: int = 0
+        self.dropped: int = 0
+        self.compared: int = 0
+        self.mismatched: int = 0
+
+    def _is_sampled(self, pending: int) -> bool:
+        self.calls += 1
+        if self._random.random() >= self.sample_rate:
+            return False
+        self.sampled += 1
+        if pending >= self.max_pending:
+            self.dropped += 1
+            return False
+        return True
+
+    def _copy(self, arguments: Any) -> Optional[Any]:
+        try:
+            return deepcopy(arguments)
+        except Exception:
+            self.dropped += 1
+            return None
+
+    def _record(self, method: str, primary_outcome: Optional[Exception], primary_latency: float,
+                candidate_outcome: Optional[Exception], candidate_latency: float) -> None:
+        primary_verdict: Optional[str] = _verdict(primary_outcome)
+        candidate_verdict: Optional[str] = _verdict(candidate_outcome)
+        with self._lock:
+            self.compared += 1
+            self.latency_deltas.append(candidate_latency - primary_latency)
+            if primary_verdict != candidate_verdict:
+                self.mismatched += 1
+                self.mismatches.append(ShadowMismatch(method=method, primary=primary_verdict,
+                                                      candidate=candidate_verdict, primary_latency=primary_latency,
+                                                      candidate_latency=candidate_latency))
+
+    def _run_candidate(self, primary_outcome: Optional[Exception], primary_latency: float, args: tuple,
+                       kwargs: Dict[str, Any]) -> None:
+        started: float = perf_counter()
+        candidate_outcome: Optional[Exception] = None
+        try:
+            self.candidate.validate(*args, **kwargs)
+        except Exception as exception:
+            candidate_outcome = exception
+        self._record("validate", primary_outcome, primary_latency, candidate_outcome, perf_counter() - started)
+
+    def validate(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Returns result of validate method of primary chain or raises its exception. If call is sampled, copy of the
+        same arguments is validated by candidate chain in executor.
+        """
+
+        arguments: Optional[Tuple[tuple, Dict[str, Any]]] = self._copy((args, kwargs)) if self._is_sampled(
+            len(self._futures)) else None
+        if arguments is None:
+            return self.primary.validate(*args, **kwargs)
+        started: float = perf_counter()
+        try:
+            result: Any = self.primary.validate(*args, **kwargs)
+        except Exception as exception:
+            self._submit(exception, perf_counter() - started, arguments)
+            raise
+        self._submit(None, perf_counter() - started, arguments)
+        return result
+
+    def _submit(self, primary_outcome: Optional[Exception], primary_latency: float,
+                arguments: Tuple[tuple, Dict[str, Any]]) -> None:
+        args, kwargs = arguments
+        future: Future = self._executor.submit(self._run_candidate, primary_outcome, primary_latency, args, kwargs)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+
+    async def _run_candidate_dictionary(self, primary_outcome: Optional[Exception], primary_latency: float,
+                                        payload: Dict) -> None:
+        started: float = perf_counter()
+        candidate_outcome: Optional[Exception] = None
+        try:
+            if self.candidate_timeout is None:
+                await self.candidate.validate_dictionary(payload)
+            else:
+                with validation_deadline(self.candidate_timeout):
+                    await self.candidate.validate_dictionary(payload)
+        except Exception as exception:
+            candidate_outcome = exception
+        self._record("validate_dictionary", primary_outcome, primary_latency, candidate_outcome,
+                     perf_counter() - started)
+
+    async def validate_dictionary(self, payload: Dict) -> None:
+        """
+        Validates payload by validate dictionary method of primary chain and raises its exception. If call is sampled,
+        copy of payload is validated by candidate chain in separate task which is not awaited.
+
+        :param payload: Payload presented in form of dictionary.
+        """
+
+        candidate_payload: Optional[Dict] = self._copy(payload) if self._is_sampled(len(self._tasks)) else None
+        if candidate_payload is None:
+            await self.primary.validate_dictionary(payload)
+            return
+        started: float = perf_counter()
+        try:
+            await self.primary.validate_dictionary(payload)
+        except Exception as exception:
+            self._schedule(exception, perf_counter() - started, candidate_payload)
+            raise
+        self._schedule(None, perf_counter() - started, candidate_payload)
+
+    def _schedule(self, primary_outcome: Optional[Exception], primary_latency: float, payload: Dict) -> None:
+        task: asyncio.Future = asyncio.ensure_future(
+            run_without_deadline(self._run_candidate_dictionary, primary_outcome, primary_latency, payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits until candidate runs of validate method which are in progress are finished.
+
+        :param timeout: Maximum time to wait in seconds.
+        """
+
+        wait(list(self._futures), timeout=timeout)
+
+    async def drain(self) -> None:
+        """
+        Waits until candidate runs of validate dictionary method which are in progress are finished.
+        """
+
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns number of calls, sampled, dropped and compared calls, mismatches and latency difference of candidate
+        chain, in seconds, over the last compared calls; negative difference means candidate is faster.
+        """
+
+        with self._lock:
+            deltas: List[float] = sorted(self.latency_deltas)
+        return {"calls": self.calls, "sampled": self.sampled, "dropped": self.dropped, "compared": self.compared,
+                "mismatched": self.mismatched,
+                "mismatch_rate": self.mismatched / self.compared if self.compared else 0.0,
+                "latency_delta_mean": sum(deltas) / len(deltas) if deltas else 0.0,
+                "latency_delta_p50": deltas[len(deltas) // 2] if deltas else 0.0,
+                "latency_delta_p95": deltas[min(len(deltas) - 1, int(len(deltas) * 0.95))] if deltas else 0.0}
@@ -1,12 +1,20 @@
 from __future__ import annotations
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Mapping, FrozenSet, Any, Set, Tuple
 
 from models.sc_element import SCElement
 from models.items import Item
 from models.enums.delivery_method import DeliveryMethod
+from models.validation.chain import DictionaryBatchValidationMixin
+from models.validation.database_limiter import database_limiter
+from models.validation.lookup_coalescing import lookup_coalescer
+from models.validation.queries import find_projected, find_projected_many
+from models.validation.records import ShoppingCartElementRecord
 
 
-class ShoppingCartElementValidator:
+class ShoppingCartElementValidator(DictionaryBatchValidationMixin):
+    INPUT_FIELDS: Optional[FrozenSet[str]] = None
+    IS_DB_BACKED: bool = False
+
     def __init__(self, next_validator: Optional[ShoppingCartElementValidator] = None):
         self.next_validator: Optional[ShoppingCartElementValidator] = next_validator
 
@@ -21,6 +29,16 @@ class ShoppingCartElementValidator:
         if self.next_validator is not None:
             self.next_validator.validate(shopping_cart_element_to_validate)
 
+    def validate_mapping(self, shopping_cart_element_to_validate: Mapping) -> None:
+        """
+        Runs the same checks as validate method on shopping cart element presented in form of mapping, e.g. request
+        JSON or projected DB document, without building SCElement object.
+
+        :param shopping_cart_element_to_validate: Shopping cart element to validate.
+        """
+
+        self.validate(ShoppingCartElementRecord.from_mapping(shopping_cart_element_to_validate))
+
     async def validate_dictionary(self, shopping_cart_element_to_validate: Dict) -> None:
         """
         Base implementation of validate dictionary method. Passes validation to the next validator if exists. Otherwise
@@ -34,9 +52,29 @@ class ShoppingCartElementValidator:
 
 
 class DeliveryMethodIsNotAvailableValidator(ShoppingCartElementValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"ID", "delivery"})
+    IS_DB_BACKED: bool = True
+
+    PRODUCT_FIELDS: Tuple[str, ...] = ("deliveryOffered", "marketPickOffered")
+
     def validate(self, shopping_cart_element_to_validate: SCElement) -> None:
         super().validate(shopping_cart_element_to_validate)
 
+    @staticmethod
+    def is_delivery_method_available(shopping_cart_element_to_validate: Dict, product: Dict[str, Any]) -> bool:
+        """
+        Returns False if specified delivery method is not offered for product of shopping cart element.
+
+        :param shopping_cart_element_to_validate: Shopping cart element to validate.
+        :param product: Product fields listed in PRODUCT_FIELDS.
+        """
+
+        is_us_delivery_not_available: bool = shopping_cart_element_to_validate["delivery"][
+            "method"] == DeliveryMethod.US_DELIVERY.value and not product.get("deliveryOffered")
+        is_pick_up_not_available: bool = shopping_cart_element_to_validate["delivery"][
+            "method"] == DeliveryMethod.PICK_UP.value and not product.get("marketPickOffered")
+        return not (is_us_delivery_not_available or is_pick_up_not_available)
+
     async def validate_dictionary(self, shopping_cart_element_to_validate: Dict) -> None:
         """
         Raises exception if specified delivery method is not available. Otherwise passes product to base validator.
@@ -46,13 +84,38 @@ class DeliveryMethodIsNotAvailableValidator(ShoppingCartElementValidator):
 
         from controller.ErrorHandler import DeliveryMethodIsNotAvailableException
 
-        shopping_cart_element: SCElement = await SCElement.objects.get(shopping_cart_element_to_validate["ID"])
-        product: Item = await Item.objects.get(shopping_cart_element.item_id)
-        is_us_delivery_not_available: bool = shopping_cart_element_to_validate["delivery"][
-                                                 "method"] == DeliveryMethod.US_DELIVERY.value and not product.deliveryOffered
-        is_pick_up_not_available: bool = shopping_cart_element_to_validate["delivery"][
-                                             "method"] == DeliveryMethod.PICK_UP.value and not product.marketPickOffered
-        if is_us_delivery_not_available or is_pick_up_not_available:
+        shopping_cart_element: Dict[str, Any] = await lookup_coalescer.run(
+            "sc_elements", find_projected, SCElement, shopping_cart_element_to_validate["ID"], ("item_id",))
+        product: Dict[str, Any] = await lookup_coalescer.run(
+            "items", find_projected, Item, shopping_cart_element["item_id"], self.PRODUCT_FIELDS)
+        if not self.is_delivery_method_available(shopping_cart_element_to_validate, product):
             raise DeliveryMethodIsNotAvailableException
         else:
             await super().validate_dictionary(shopping_cart_element_to_validate)
+
+    async def validate_dictionary_many(self, shopping_cart_elements: List[Dict]) -> List[Optional[Exception]]:
+        """
+        Batched implementation of validate dictionary method. All shopping cart elements and then all their products
+        are fetched by one query per collection; shopping cart elements which passed are passed to the next validator.
+
+        :param shopping_cart_elements: Shopping cart elements presented in form of dictionary.
+        """
+
+        from controller.ErrorHandler import DeliveryMethodIsNotAvailableException
+
+        element_ids: Set[Any] = {element["ID"] for element in shopping_cart_elements if "ID" in element}
+        stored_elements: Dict[str, Dict[str, Any]] = await database_limiter.run(
+            "sc_elements", find_projected_many, SCElement, element_ids, ("item_id",)) if element_ids else {}
+        products: Dict[str, Dict[str, Any]] = await database_limiter.run(
+            "items", find_projected_many, Item, {element["item_id"] for element in stored_elements.values()},
+            self.PRODUCT_FIELDS) if stored_elements else {}
+        outcomes: List[Optional[Exception]] = [None] * len(shopping_cart_elements)
+        for position, shopping_cart_element_to_validate in enumerate(shopping_cart_elements):
+            try:
+                product: Dict[str, Any] = products[
+                    str(stored_elements[str(shopping_cart_element_to_validate["ID"])]["item_id"])]
+                if not self.is_delivery_method_available(shopping_cart_element_to_validate, product):
+                    outcomes[position] = DeliveryMethodIsNotAvailableException()
+            except Exception as exception:
+                outcomes[position] = exception
+        return await self.validate_next_dictionary_many(shopping_cart_elements, outcomes)
@@ -1,10 +1,16 @@
 from __future__ import annotations
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Mapping, Any, Tuple, Union
 
+from models.items import Item
 from models.shopping_list_entry import ShoppingListElement
+from models.validation.chain import BatchValidationMixin, collect_outcomes, detach, passed_positions
+from models.validation.database_limiter import database_limiter
+from models.validation.exceptions import InvalidPayloadException
+from models.validation.queries import find_projected_many
+from models.validation.records import ShoppingListElementRecord, ProductRecord
 
 
-class ShoppingListElementValidator:
+class ShoppingListElementValidator(BatchValidationMixin):
     def __init__(self, next_validator: Optional[ShoppingListElementValidator] = None):
         self.next_validator: Optional[ShoppingListElementValidator] = next_validator
 
@@ -19,6 +25,16 @@ class ShoppingListElementValidator:
         if self.next_validator is not None:
             self.next_validator.validate(shopping_list_element_to_validate)
 
+    def validate_mapping(self, shopping_list_element_to_validate: Mapping) -> None:
+        """
+        Runs the same checks as validate method on shopping list element presented in form of mapping, e.g. request
+        JSON or projected DB document, without building ShoppingListElement object.
+
+        :param shopping_list_element_to_validate: Shopping list element to validate.
+        """
+
+        self.validate(ShoppingListElementRecord.from_mapping(shopping_list_element_to_validate))
+
     def validate_dictionary(self, shopping_list_element_to_validate: Dict) -> None:
         """
         Base implementation of validate dictionary method. Passes validation to the next validator if exists. Otherwise
@@ -30,6 +46,35 @@ class ShoppingListElementValidator:
         if self.next_validator is not None:
             self.next_validator.validate_dictionary(shopping_list_element_to_validate)
 
+    def validate_dictionary_many(self, shopping_list_elements: List[Dict]) -> List[Optional[Exception]]:
+        """
+        Validates every given shopping list element presented in form of dictionary by the chain which starts with
+        this validator. Exception of failed shopping list element is returned in its place instead of being raised.
+        Unlike dictionary batch API of other validators, it is synchronous, as validate dictionary method is.
+
+        :param shopping_list_elements: Shopping list elements presented in form of dictionary.
+        """
+
+        return self.validate_next_dictionary_many(shopping_list_elements, collect_outcomes(
+            detach(self).validate_dictionary, shopping_list_elements))
+
+    def validate_next_dictionary_many(self, shopping_list_elements: List[Dict],
+                                      outcomes: List[Optional[Exception]]) -> List[Optional[Exception]]:
+        """
+        Passes shopping list elements which have no exception in outcomes to validate dictionary many method of the next
+        validator if exists and fills outcomes with its results.
+
+        :param shopping_list_elements: Shopping list elements presented in form of dictionary.
+        :param outcomes: Outcomes of this validator, one per shopping list element.
+        """
+
+        if self.next_validator is not None:
+            passed: List[int] = passed_positions(outcomes)
+            for position, outcome in zip(passed, self.next_validator.validate_dictionary_many(
+                    [shopping_list_elements[position] for position in passed])):
+                outcomes[position] = outcome
+        return outcomes
+
 
 class NameValidator(ShoppingListElementValidator):
     MINIMUM_NAME_LENGTH: int = 1
@@ -54,3 +99,87 @@ class NameValidator(ShoppingListElementValidator):
 
     def validate_dictionary(self, shopping_list_element_to_validate: Dict) -> None:
         super().validate_dictionary(shopping_list_element_to_validate)
+
+
+class StaleShoppingListEntry:
+    """
+    Shopping list entry which references product that can not be bought anymore, with reasons why.
+    """
+
+    __slots__ = ("position", "entry", "item_id", "reasons")
+
+    def __init__(self, position: int, entry: Union[ShoppingListElement, Mapping], item_id: Any, reasons: List[str]):
+        self.position: int = position
+        self.entry: Union[ShoppingListElement, Mapping] = entry
+        self.item_id: Any = item_id
+        self.reasons: List[str] = reasons
+
+
+class ShoppingListValidator:
+    """
+    Validates the whole shopping list in single pass. Products referenced by entries which are not custom are fetched
+    by single query with only fields needed to check their availability and delivery flags. Stale entries are
+    returned instead of raising on the first one, so all of them can be reported or removed at once. Entries which are
+    not custom reference product by ITEM_ID_FIELD; entries with empty reference are reported as missing.
+    """
+
+    ITEM_ID_FIELD: str = "subcategory_entry_id"
+    PRODUCT_FIELDS: Tuple[str, ...] = ("is_enable", "draft", "validTill", "deliveryOffered", "marketPickOffered")
+
+    MISSING: str = "missing"
+    INCOMPLETE: str = "incomplete"
+    BLOCKED: str = "blocked"
+    DRAFT: str = "draft"
+    EXPIRED: str = "expired"
+    NOT_DELIVERABLE: str = "not deliverable"
+
+    @staticmethod
+    def _field(entry: Union[ShoppingListElement, Mapping], field: str, default: Any = None) -> Any:
+        return entry.get(field, default) if isinstance(entry, Mapping) else getattr(entry, field, default)
+
+    def reasons(self, product: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        Returns reasons why product can not be bought or empty list if it can.
+
+        :param product: Product fields listed in PRODUCT_FIELDS or None if there is no such product.
+        """
+
+        if product is None:
+            return [self.MISSING]
+        try:
+            record: ProductRecord = ProductRecord.from_mapping(product)
+        except InvalidPayloadException:
+            return [self.INCOMPLETE]
+        reasons: List[str] = []
+        if not record.is_enable:
+            reasons.append(self.BLOCKED)
+        if record.draft:
+            reasons.append(self.DRAFT)
+        if record.is_expired():
+            reasons.append(self.EXPIRED)
+        if not product.get("deliveryOffered") and not product.get("marketPickOffered"):
+            reasons.append(self.NOT_DELIVERABLE)
+        return reasons
+
+    async def find_stale_entries(self, shopping_list: List[Union[ShoppingListElement, Mapping]]
+                                 ) -> List[StaleShoppingListEntry]:
+        """
+        Returns stale entries of shopping list. Custom entries are skipped.
+
+        :param shopping_list: Shopping list elements or their mappings.
+        """
+
+        item_ids: Dict[int, Any] = {position: self._field(entry, self.ITEM_ID_FIELD)
+                                    for position, entry in enumerate(shopping_list)
+                                    if not self._field(entry, "is_custom", False)}
+        referenced_ids: List[Any] = list({str(item_id): item_id for item_id in item_ids.values() if item_id}.values())
+        products: Dict[str, Dict[str, Any]] = await database_limiter.run(
+            "items", find_projected_many, Item, referenced_ids, self.PRODUCT_FIELDS) if referenced_ids else {}
+
+        stale_entries: List[StaleShoppingListEntry] = []
+        for position, item_id in item_ids.items():
+            reasons: List[str] = self.reasons(products.get(str(item_id)) if item_id else None)
+            if reasons:
+                stale_entries.append(StaleShoppingListEntry(position=position, entry=shopping_list[position],
+                                                            item_id=item_id, reasons=reasons))
+        return stale_entries
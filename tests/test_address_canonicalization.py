@@ -0,0 +1,102 @@
+from mock import patch, MagicMock
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.validation_memo import ValidationMemo
+from models.validation.address_canonicalization import canonical_key, CanonicalAddressValidator, \
+    ValidatedAddressCache
+from models.validation.address_validation import NoPrimaryValidator, InvalidAddressLine1LengthValidator, \
+    InvalidAddressLine2LengthValidator
+from controller.ErrorHandler import NoPrimaryAddressException, InvalidAddressLineFieldValuesException
+
+
+class TestAddressCanonicalization(AsyncTestCase):
+    """
+    Summary: Skips re-validation of addresses which canonical form was already validated.
+    Unit under test: models.validation.address_canonicalization.CanonicalAddressValidator.
+    Preconditions:
+        3. Mock models.validation.address_validation.InvalidAddressLine1LengthValidator.validate method;
+    Parameters to test:
+        1. Is canonical key independent of whitespace, case, order of fields and primary flag;
+        2. Are addresses validated in canonical form and replaced by it;
+        3. Are per-address validators skipped for cached addresses while list validators are not;
+        4. Is the least recently used key evicted;
+        5. Are outcomes of wrappers of different chains not replayed by validation memo;
+    Test scenario:
+        1. Compare keys of addresses which differ in whitespace, case, order of fields and primary flag;
+           Compare keys of addresses which differ in content;
+
+        2. Validate addresses with padded address line 1 which is too long before canonicalization;
+           Check if address line 1 was collapsed;
+           Validate addresses with address line 1 which is too short after canonicalization;
+           Compare received error and sample one;
+           Check if address line 1 was not changed;
+           Validate addresses with too long address line 2;
+           Compare received error and sample one;
+
+        3. Validate the same address twice in different case;
+           Check if mocked method was called only for the first list;
+           Validate the cached address which is not primary;
+           Compare received error and sample one;
+           Check if dedup ratio was reported;
+
+        4. Add more keys than cache can hold;
+           Check if the first key was evicted;
+
+        5. Validate address with too short address line 1 through memo by wrapper of lenient chain and then by
+           wrapper of strict chain;
+           Compare received error and sample one;
+           Check if memo had no hits;
+    """
+
+    def test_canonical_key(self):
+        self.assertEqual(canonical_key({"address1": " 1  Main Street ", "city": "Springfield", "isPrimary": True}),
+                         canonical_key({"city": "SPRINGFIELD", "address1": "1 main street", "isPrimary": False}))
+        self.assertNotEqual(canonical_key({"address1": "1 Main Street"}), canonical_key({"address1": "2 Main Street"}))
+
+    def test_canonical_form_is_validated(self):
+        validator: CanonicalAddressValidator = CanonicalAddressValidator(
+            NoPrimaryValidator(InvalidAddressLine1LengthValidator(InvalidAddressLine2LengthValidator())))
+        addresses = [{"address1": "12 Main" + " " * 200 + "Street", "address2": "", "isPrimary": True}]
+
+        validator.validate(addresses)
+
+        self.assertEqual(addresses[0]["address1"], "12 Main Street")
+        short_addresses = [{"address1": "  ab  ", "address2": "", "isPrimary": True}]
+        with self.assertRaises(InvalidAddressLineFieldValuesException):
+            validator.validate(short_addresses)
+        self.assertEqual(short_addresses[0]["address1"], "  ab  ")
+        with self.assertRaises(InvalidAddressLineFieldValuesException):
+            validator.validate([{"address1": "1 Main Street", "address2": "a" * 101, "isPrimary": True}])
+
+    @patch("models.validation.address_validation.InvalidAddressLine1LengthValidator.validate")
+    def test_cached_addresses_skip_per_address_validators(self, validate_mock: MagicMock):
+        validator: CanonicalAddressValidator = CanonicalAddressValidator(
+            NoPrimaryValidator(InvalidAddressLine1LengthValidator()))
+
+        validator.validate([{"address1": "1 Main Street", "isPrimary": True}])
+        validator.validate([{"address1": "1 MAIN STREET", "isPrimary": True}])
+
+        self.assertEqual(validate_mock.call_count, 1)
+        with self.assertRaises(NoPrimaryAddressException):
+            validator.validate([{"address1": "1 main street", "isPrimary": False}])
+        self.assertEqual(validator.cache.statistics()["dedup_ratio"], 2 / 3)
+
+    def test_eviction(self):
+        cache: ValidatedAddressCache = ValidatedAddressCache(max_size=2)
+
+        for key in ("a", "b", "c"):
+            cache.add(key)
+
+        self.assertNotIn("a", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.statistics()["evicted"], 1)
+
+    def test_memo_does_not_replay_other_chain(self):
+        memo: ValidationMemo = ValidationMemo()
+        addresses = [{"address1": "a", "isPrimary": True}]
+
+        memo.validate(CanonicalAddressValidator(NoPrimaryValidator()), addresses)
+        with self.assertRaises(InvalidAddressLineFieldValuesException):
+            memo.validate(CanonicalAddressValidator(NoPrimaryValidator(InvalidAddressLine1LengthValidator())),
+                          addresses)
+        self.assertEqual(memo.statistics()["hits"], 0)
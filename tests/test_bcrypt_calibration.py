@@ -0,0 +1,56 @@
+from mock import patch
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.bcrypt_calibration import calibrate
+
+
+def doubling_cost(cost, rounds):
+    return {"cost": cost, "hashpw": 0.001 * 2 ** (cost - 10), "checkpw": 0.001 * 2 ** (cost - 10)}
+
+
+class TestBcryptCalibration(AsyncTestCase):
+    """
+    Summary: Recommends bcrypt cost for target login latency.
+    Unit under test: models.validation.bcrypt_calibration.calibrate.
+    Preconditions: Benchmark of cost is stubbed: checkpw takes 1 ms with cost 10 and twice as long with every next cost.
+    Parameters to test:
+        1. Is the highest cost within target latency recommended;
+        2. Is minimum cost recommended if it already exceeds target latency;
+        3. Is maximum cost recommended if every cost is within target latency;
+    Test scenario:
+        1. Calibrate with target latency of 5 ms;
+           Check if cost 12 is recommended within target;
+           Check if benchmark stopped at the first cost which exceeds target latency;
+
+        2. Calibrate with target latency of 0.5 ms;
+           Check if minimum cost is recommended out of target;
+           Check if only minimum cost was benchmarked;
+
+        3. Calibrate with target latency of 1 s and maximum cost 14;
+           Check if maximum cost is recommended within target;
+           Check if no cost above maximum was benchmarked;
+    """
+
+    @patch("models.validation.bcrypt_calibration.benchmark_cost", side_effect=doubling_cost)
+    def test_target_latency(self, benchmark_cost):
+        result = calibrate(target_latency=0.005)
+
+        self.assertEqual(result["recommended_cost"], 12)
+        self.assertTrue(result["within_target"])
+        self.assertEqual([measurement["cost"] for measurement in result["measurements"]], [10, 11, 12, 13])
+
+    @patch("models.validation.bcrypt_calibration.benchmark_cost", side_effect=doubling_cost)
+    def test_minimum_cost(self, benchmark_cost):
+        result = calibrate(target_latency=0.0005)
+
+        self.assertEqual(result["recommended_cost"], 10)
+        self.assertFalse(result["within_target"])
+        self.assertEqual(benchmark_cost.call_count, 1)
+
+    @patch("models.validation.bcrypt_calibration.benchmark_cost", side_effect=doubling_cost)
+    def test_maximum_cost(self, benchmark_cost):
+        result = calibrate(target_latency=1.0, maximum_cost=14)
+
+        self.assertEqual(result["recommended_cost"], 14)
+        self.assertTrue(result["within_target"])
+        self.assertEqual([call[1]["cost"] for call in benchmark_cost.call_args_list], [10, 11, 12, 13, 14])
@@ -0,0 +1,127 @@
+import os
+from tempfile import TemporaryDirectory
+from time import time
+
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.catalog_sweep import CatalogSweep
+from models.validation.product_availability import ProductAvailabilityIndex
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    def sort(self, field, direction):
+        self.documents = sorted(self.documents, key=lambda document: document[field], reverse=direction < 0)
+        return self
+
+    def batch_size(self, batch_size):
+        return self
+
+    def __aiter__(self):
+        self.iterator = iter(self.documents)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    def __init__(self, documents):
+        self.documents = {document["_id"]: document for document in documents}
+        self.bulk_writes = []
+        self.queries = []
+
+    def find(self, query, projection):
+        self.queries.append(query)
+        minimum_id = query.get("_id", {}).get("$gt")
+        return FakeCursor([{field: value for field, value in document.items() if field in projection or field == "_id"}
+                           for document in self.documents.values() if minimum_id is None or document["_id"] > minimum_id])
+
+    async def bulk_write(self, updates, ordered):
+        self.bulk_writes.append(updates)
+        for update in updates:
+            self.documents[update._filter["_id"]].update(update._doc["$set"])
+
+
+class TestCatalogSweep(AsyncTestCase):
+    """
+    Summary: Re-validates every product of catalog.
+    Unit under test: models.validation.catalog_sweep.CatalogSweep.
+    Preconditions: None.
+    Parameters to test:
+        1. Are changed statuses written back in batches;
+        2. Is interrupted sweep resumed from checkpoint and is the next sweep started from the beginning;
+    Test scenario:
+        1. Sweep catalog of available, blocked, draft and expired products;
+           Check if statuses and availability index are correct;
+           Check if one bulk write per batch with changes was made;
+
+        2. Sweep catalog with checkpoint and interrupt it by failed bulk write of the second batch;
+           Sweep catalog again;
+           Check if sweep continued after the first batch and counted products of both runs;
+           Check if checkpoint was removed;
+           Sweep catalog again;
+           Check if sweep started from the beginning with zeroed counters;
+    """
+
+    def setUp(self):
+        super(TestCatalogSweep, self).setUp()
+        self.collection = FakeCollection([
+            {"_id": "1", "is_enable": True, "draft": False, "validTill": time() + 3600, "is_available": True},
+            {"_id": "2", "is_enable": False, "draft": False, "validTill": time() + 3600, "is_available": True},
+            {"_id": "3", "is_enable": True, "draft": True, "validTill": time() + 3600, "is_available": False},
+            {"_id": "4", "is_enable": True, "draft": False, "validTill": time() - 3600, "is_available": True},
+            {"_id": "5", "is_enable": True, "draft": False, "validTill": None, "is_available": False,
+             "description": "a" * 1000},
+        ])
+
+    @gen_test
+    async def test_statuses(self):
+        availability_index: ProductAvailabilityIndex = ProductAvailabilityIndex()
+
+        statistics = await CatalogSweep(collection=self.collection, batch_size=2,
+                                        availability_index=availability_index).run()
+
+        self.assertEqual({item_id: document["is_available"] for item_id, document in self.collection.documents.items()},
+                         {"1": True, "2": False, "3": False, "4": False, "5": True})
+        self.assertEqual(availability_index.filter_available(["1", "2", "3", "4", "5"]), ["1", "5"])
+        self.assertEqual(statistics["processed"], 5)
+        self.assertEqual(statistics["changed"], 3)
+        self.assertEqual([len(updates) for updates in self.collection.bulk_writes], [1, 1, 1])
+
+    @gen_test
+    async def test_checkpoint(self):
+        bulk_write = self.collection.bulk_write
+
+        async def interrupted_bulk_write(updates, ordered):
+            if self.collection.bulk_writes:
+                raise RuntimeError("connection closed")
+            await bulk_write(updates, ordered)
+
+        with TemporaryDirectory() as directory:
+            checkpoint_path: str = os.path.join(directory, "sweep.json")
+            self.collection.bulk_write = interrupted_bulk_write
+            with self.assertRaises(RuntimeError):
+                await CatalogSweep(collection=self.collection, batch_size=2, checkpoint_path=checkpoint_path).run()
+            self.collection.bulk_write = bulk_write
+
+            statistics = await CatalogSweep(collection=self.collection, batch_size=2,
+                                            checkpoint_path=checkpoint_path).run()
+
+            self.assertEqual(self.collection.queries[-1], {"_id": {"$gt": "2"}})
+            self.assertEqual(statistics["processed"], 5)
+            self.assertEqual(statistics["changed"], 3)
+            self.assertFalse(os.path.exists(checkpoint_path))
+
+            statistics = await CatalogSweep(collection=self.collection, batch_size=2,
+                                            checkpoint_path=checkpoint_path).run()
+
+        self.assertEqual(self.collection.queries[-1], {})
+        self.assertEqual(statistics["processed"], 5)
+        self.assertEqual(statistics["changed"], 0)
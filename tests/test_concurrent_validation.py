@@ -0,0 +1,55 @@
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.concurrent_validation import validate_dictionary_concurrently
+from models.validation.memory_backend import InMemoryBackend
+from models.validation.user_validation import LoginValidator, EmailValidator, BuyerCompanyNameValidator
+from controller.ErrorHandler import LoginIsAlreadyInUseException, EmailIsAlreadyInUseException
+from models.users import User
+
+
+class TestConcurrentValidation(AsyncTestCase):
+    """
+    Summary: Runs independent validators of chain concurrently.
+    Unit under test: models.validation.concurrent_validation.validate_dictionary_concurrently.
+    Preconditions:
+        1. Serve lookups by models.validation.memory_backend.InMemoryBackend;
+    Parameters to test:
+        1. Is exception of the first failed validator of chain raised;
+        2. Is valid user passed;
+    Test scenario:
+        1. Validate user whose login and email are in use;
+           Compare received error and sample one;
+
+        2. Validate user whose login, email and buyer/company name are not in use;
+           Check if every validator looked up the backend;
+    """
+
+    def setUp(self):
+        super(TestConcurrentValidation, self).setUp()
+        self.backend: InMemoryBackend = InMemoryBackend(latency=0.001)
+
+    @gen_test
+    async def test_first_failed_validator_exception_is_raised(self):
+        self.backend.add(User(login="test1", email="test1@example.com", title="Test 1"),
+                         User(login="test2", email="example@example.com", title="Test 2"))
+
+        with self.backend.patch():
+            with self.assertRaises(LoginIsAlreadyInUseException):
+                await validate_dictionary_concurrently(
+                    LoginValidator(EmailValidator(BuyerCompanyNameValidator())),
+                    {"login": "test1", "email": "example@example.com", "title": "Test Test"})
+
+            with self.assertRaises(EmailIsAlreadyInUseException):
+                await validate_dictionary_concurrently(
+                    BuyerCompanyNameValidator(EmailValidator(LoginValidator())),
+                    {"login": "test1", "email": "example@example.com", "title": "Test Test"})
+
+    @gen_test
+    async def test_valid_user(self):
+        with self.backend.patch():
+            await validate_dictionary_concurrently(LoginValidator(EmailValidator(BuyerCompanyNameValidator())),
+                                                   {"login": "test1", "email": "example@example.com",
+                                                    "title": "Test Test"})
+
+        self.assertEqual(self.backend.statistics()["users"]["queries"]["index"], 3)
@@ -0,0 +1,74 @@
+import asyncio
+
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.database_limiter import DatabaseLimiter, validation_deadline
+from models.validation.exceptions import ValidationTimeoutException, ValidationOverloadedException
+
+
+class TestDatabaseLimiter(AsyncTestCase):
+    """
+    Summary: Limits concurrent lookups of DB-backed validators.
+    Unit under test: models.validation.database_limiter.DatabaseLimiter.
+    Preconditions: None.
+    Parameters to test:
+        1. Is lookup which does not fit into wait queue shed;
+        2. Is lookup which exceeds deadline of validation failed;
+        3. Are lookups limited in consecutive event loops;
+    Test scenario:
+        1. Run more lookups than collection allows to run and to wait;
+           Compare received errors and sample ones;
+           Check if statistics of collection are correct;
+
+        2. Run lookup that takes longer than deadline of validation;
+           Compare received error and sample one;
+           Check if statistics of collection are correct;
+
+        3. Run more lookups than collection allows to run at once in two consecutive event loops;
+           Compare received results and sample ones;
+           Check if statistics of collection are correct;
+    """
+
+    @staticmethod
+    async def query(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    @gen_test
+    async def test_shed(self):
+        limiter: DatabaseLimiter = DatabaseLimiter()
+        limiter.configure(collection="users", max_concurrency=2, max_waiting=2)
+
+        results = await asyncio.gather(*[limiter.run("users", self.query, 0.01) for _ in range(6)],
+                                       return_exceptions=True)
+
+        self.assertEqual(results[:4], [0.01] * 4)
+        for result in results[4:]:
+            self.assertIsInstance(result, ValidationOverloadedException)
+        self.assertEqual(limiter.statistics()["users"]["shed"], 2)
+        self.assertEqual(limiter.statistics()["users"]["completed"], 4)
+
+    @gen_test
+    async def test_deadline(self):
+        limiter: DatabaseLimiter = DatabaseLimiter()
+
+        with validation_deadline(timeout=0.01):
+            with self.assertRaises(ValidationTimeoutException):
+                await limiter.run("items", self.query, 1)
+
+        self.assertEqual(limiter.statistics()["items"]["timed_out"], 1)
+        self.assertEqual(limiter.statistics()["items"]["in_flight"], 0)
+
+    def test_consecutive_event_loops(self):
+        limiter: DatabaseLimiter = DatabaseLimiter()
+        limiter.configure(collection="users", max_concurrency=1, max_waiting=2)
+
+        async def contend():
+            return await asyncio.gather(*[limiter.run("users", self.query, 0.001) for _ in range(3)])
+
+        for _ in range(2):
+            self.assertEqual(asyncio.run(contend()), [0.001] * 3)
+
+        self.assertEqual(limiter.statistics()["users"]["completed"], 6)
+        self.assertEqual(limiter.statistics()["users"]["waiting"], 0)
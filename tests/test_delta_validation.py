@@ -0,0 +1,61 @@
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.delta_validation import validate_patch, DeltaValidationReport
+from models.validation.memory_backend import InMemoryBackend
+from models.validation.product_validation import ProductCodeAlreadyExistsValidator, \
+    TooShortPriceValidPeriodValidator, TooShortSalePeriodValidator
+from models.validation.user_validation import LoginValidator, EmailValidator, BuyerCompanyNameValidator
+from controller.ErrorHandler import EmailIsAlreadyInUseException
+from models.users import User
+
+
+class TestDeltaValidation(AsyncTestCase):
+    """
+    Summary: Re-validates only fields changed by partial update.
+    Unit under test: models.validation.delta_validation.validate_patch.
+    Preconditions:
+        1. Serve lookups by models.validation.memory_backend.InMemoryBackend;
+    Parameters to test:
+        1. Are validators which input fields were not changed skipped;
+        2. Is exception of changed field raised;
+    Test scenario:
+        1. Validate patch of product which changes only price valid period;
+           Check if only price valid period validator was run;
+           Check if backend was not queried;
+
+        2. Validate patch of user which changes email to one that is in use;
+           Compare received error and sample one;
+           Check if backend was queried only for email;
+    """
+
+    def setUp(self):
+        super(TestDeltaValidation, self).setUp()
+        self.backend: InMemoryBackend = InMemoryBackend()
+
+    @gen_test
+    async def test_unchanged_fields_are_skipped(self):
+        with self.backend.patch():
+            report: DeltaValidationReport = await validate_patch(
+                ProductCodeAlreadyExistsValidator(TooShortPriceValidPeriodValidator(TooShortSalePeriodValidator())),
+                old_document={"productNo": "OR0507162206", "valitFrom": 1612432399, "validTill": 1612534237,
+                              "saleIsOn": False},
+                patch={"productNo": "OR0507162206", "validTill": 1612634237})
+
+        self.assertEqual(report.changed_fields, {"validTill"})
+        self.assertEqual(report.run, ["TooShortPriceValidPeriodValidator"])
+        self.assertEqual(report.skipped, ["ProductCodeAlreadyExistsValidator", "TooShortSalePeriodValidator"])
+        self.assertEqual(self.backend.statistics()["items"]["queries"], {"id": 0, "index": 0, "scan": 0})
+
+    @gen_test
+    async def test_changed_field_is_validated(self):
+        self.backend.add(User(login="test2", email="example@example.com", title="Test 2"))
+
+        with self.backend.patch():
+            with self.assertRaises(EmailIsAlreadyInUseException):
+                await validate_patch(LoginValidator(EmailValidator(BuyerCompanyNameValidator())),
+                                     old_document={"login": "test1", "email": "test1@example.com",
+                                                   "title": "Test Test"},
+                                     patch={"email": "example@example.com"})
+
+        self.assertEqual(self.backend.statistics()["users"]["queries"]["index"], 1)
@@ -0,0 +1,45 @@
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.load_test import run_load, seed_backend, percentile
+from models.validation.memory_backend import InMemoryBackend
+
+
+class TestLoadTest(AsyncTestCase):
+    """
+    Summary: Drives open-loop load of validator chains.
+    Unit under test: models.validation.load_test.run_load.
+    Preconditions: None.
+    Parameters to test:
+        1. Is percentile calculated correctly;
+        2. Is report of short run complete;
+    Test scenario:
+        1. Calculate percentiles of known values;
+           Compare received values and sample ones;
+
+        2. Run load of every scenario against seeded stand-in backend;
+           Check if every scenario received requests and report contains latency percentiles;
+    """
+
+    def test_percentile(self):
+        values = [float(value) for value in range(1, 101)]
+
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile(values, 99.9), 100.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    @gen_test(timeout=30)
+    async def test_run_load(self):
+        backend: InMemoryBackend = InMemoryBackend(latency=0.001)
+        seed_backend(backend, 100)
+
+        with backend.patch():
+            report = await run_load(rate=200, duration=0.5, mix={"signup": 1, "product": 1, "checkout": 1}, size=100,
+                                    conflict_rate=0.5, deadline=1.0, seed=0)
+
+        self.assertEqual(set(report["scenarios"]), {"signup", "product", "checkout"})
+        self.assertEqual(sum(scenario["requests"] for scenario in report["scenarios"].values()), report["requests"])
+        for label in ("p50", "p95", "p99", "p999"):
+            self.assertIn(label, report)
+            self.assertIn(label, report["event_loop_lag"])
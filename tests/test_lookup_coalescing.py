@@ -0,0 +1,133 @@
+import asyncio
+
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.lookup_coalescing import LookupCoalescer
+from models.validation.database_limiter import DatabaseLimiter, validation_deadline
+from models.validation.exceptions import ValidationTimeoutException
+
+
+class TestLookupCoalescing(AsyncTestCase):
+    """
+    Summary: Shares in-flight lookups between concurrent identical lookups.
+    Unit under test: models.validation.lookup_coalescing.LookupCoalescer.
+    Preconditions: None.
+    Parameters to test:
+        1. Are concurrent identical lookups coalesced;
+        2. Is finished lookup not shared with later callers;
+        3. Is shared lookup independent of deadline of the caller which started it;
+        4. Is shared lookup completed for followers if the caller which started it was cancelled;
+        5. Is failed or cancelled lookup forgotten;
+    Test scenario:
+        1. Run identical lookups concurrently together with different one;
+           Check if query was called once per distinct lookup;
+           Check if coalescing statistics are correct;
+
+        2. Run identical lookup after previous one finished;
+           Check if query was called again;
+
+        3. Run identical lookups with short and long deadlines concurrently;
+           Check if caller with short deadline timed out and caller with long deadline received result;
+           Run lookup with short deadline alone;
+           Check if abandoned lookup was cancelled;
+
+        4. Run identical lookups concurrently and cancel the first caller;
+           Check if the other caller received result of single query;
+           Check if no lookup is in flight;
+           Run identical lookups concurrently and cancel both callers;
+           Check if no lookup is in flight;
+
+        5. Run identical failing lookups concurrently;
+           Check if both callers received the exception and no lookup is in flight;
+           Run identical lookup again;
+           Check if query was called again;
+    """
+
+    def setUp(self):
+        super(TestLookupCoalescing, self).setUp()
+        self.calls = []
+
+    async def get(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        return kwargs["login"]
+
+    @gen_test
+    async def test_coalescing(self):
+        coalescer: LookupCoalescer = LookupCoalescer(limiter=DatabaseLimiter())
+
+        results = await asyncio.gather(*[coalescer.run("users", self.get, login="test1") for _ in range(5)],
+                                       coalescer.run("users", self.get, login="test2"))
+
+        self.assertEqual(results, ["test1"] * 5 + ["test2"])
+        self.assertEqual(self.calls, [{"login": "test1"}, {"login": "test2"}])
+        self.assertEqual(coalescer.statistics()["coalesced"], 4)
+        self.assertEqual(coalescer.statistics()["in_flight"], 0)
+
+        await coalescer.run("users", self.get, login="test1")
+
+        self.assertEqual(len(self.calls), 3)
+
+    @gen_test
+    async def test_deadlines_of_callers(self):
+        coalescer: LookupCoalescer = LookupCoalescer(limiter=DatabaseLimiter())
+
+        async def run(timeout):
+            with validation_deadline(timeout):
+                return await coalescer.run("users", self.get, login="test1")
+
+        results = await asyncio.gather(run(0.001), run(1.0), return_exceptions=True)
+
+        self.assertIsInstance(results[0], ValidationTimeoutException)
+        self.assertEqual(results[1], "test1")
+
+        with self.assertRaises(ValidationTimeoutException):
+            await run(0.001)
+        await asyncio.sleep(0.005)
+
+        self.assertEqual(coalescer.statistics()["in_flight"], 0)
+
+    @gen_test
+    async def test_cancelled_caller(self):
+        coalescer: LookupCoalescer = LookupCoalescer(limiter=DatabaseLimiter())
+
+        leader = asyncio.ensure_future(coalescer.run("users", self.get, login="test1"))
+        follower = asyncio.ensure_future(coalescer.run("users", self.get, login="test1"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        self.assertEqual(await asyncio.wait_for(follower, 1.0), "test1")
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(coalescer.statistics()["in_flight"], 0)
+
+        callers = [asyncio.ensure_future(coalescer.run("users", self.get, login="test2")) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        self.assertEqual(coalescer.statistics()["in_flight"], 0)
+
+    @gen_test
+    async def test_failed_lookup(self):
+        coalescer: LookupCoalescer = LookupCoalescer(limiter=DatabaseLimiter())
+
+        async def fail(**kwargs):
+            self.calls.append(kwargs)
+            await asyncio.sleep(0.01)
+            raise ValueError(kwargs["login"])
+
+        results = await asyncio.gather(*[coalescer.run("users", fail, login="test1") for _ in range(2)],
+                                       return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(coalescer.statistics()["in_flight"], 0)
+
+        with self.assertRaises(ValueError):
+            await coalescer.run("users", fail, login="test1")
+
+        self.assertEqual(len(self.calls), 2)
@@ -0,0 +1,89 @@
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.memory_backend import InMemoryBackend
+from models.validation.user_validation import LoginValidator, EmailValidator
+from models.validation.product_validation import ProductCodeAlreadyExistsValidator
+from models.validation.shopping_cart_element_validation import DeliveryMethodIsNotAvailableValidator
+from controller.ErrorHandler import LoginIsAlreadyInUseException, ProductCodeAlreadyExistsException, \
+    DeliveryMethodIsNotAvailableException
+from models.users import User
+from models.items import Item
+from models.sc_element import SCElement
+
+
+class TestMemoryBackend(AsyncTestCase):
+    """
+    Summary: Serves lookups of DB-backed validators from memory.
+    Unit under test: models.validation.memory_backend.InMemoryBackend.
+    Preconditions: None.
+    Parameters to test:
+        1. Are lookups of user and product validators served by indexes;
+        2. Is lookup of shopping cart element validator served by ids;
+        3. Is reindexing of changed document correct;
+        4. Is find by values of indexed field served by index;
+    Test scenario:
+        1. Validate user whose login is in use and product whose code exists;
+           Compare received errors and sample ones;
+           Check if no lookup scanned collection;
+
+        2. Validate shopping cart element whose delivery method is not available;
+           Compare received error and sample one;
+
+        3. Change login of user and update it;
+           Check if user is found only by new login;
+
+        4. Find users by list of logins with projection;
+           Compare received documents and sample ones;
+           Check if lookup did not scan collection;
+    """
+
+    def setUp(self):
+        super(TestMemoryBackend, self).setUp()
+        self.backend: InMemoryBackend = InMemoryBackend(latency=0.001, jitter=0.001)
+        self.user: User = User(login="test1", email="example@example.com", title="Test Test")
+        product: Item = Item(productNo="OR0507162206", is_parent=True, deliveryOffered=False, marketPickOffered=True)
+        product._id = "test_item_id_1"
+        shopping_cart_element: SCElement = SCElement(item_id="test_item_id_1")
+        shopping_cart_element._id = "test_shopping_element_1"
+        self.backend.add(self.user, product, shopping_cart_element)
+
+    @gen_test
+    async def test_indexed_lookups(self):
+        with self.backend.patch():
+            with self.assertRaises(LoginIsAlreadyInUseException):
+                await LoginValidator(EmailValidator()).validate_dictionary({"login": " Test1 ", "email": "a@b.com"})
+
+            with self.assertRaises(ProductCodeAlreadyExistsException):
+                await ProductCodeAlreadyExistsValidator().validate_dictionary({"productNo": "OR0507162206"})
+
+        self.assertEqual(self.backend.statistics()["users"]["queries"], {"id": 0, "index": 1, "scan": 0})
+        self.assertEqual(self.backend.statistics()["items"]["queries"], {"id": 0, "index": 1, "scan": 0})
+
+    @gen_test
+    async def test_id_lookups(self):
+        with self.backend.patch():
+            with self.assertRaises(DeliveryMethodIsNotAvailableException):
+                await DeliveryMethodIsNotAvailableValidator().validate_dictionary(
+                    {"ID": "test_shopping_element_1", "delivery": {"method": "US Delivery"}})
+
+        self.assertEqual(self.backend.statistics()["sc_elements"]["queries"]["id"], 1)
+        self.assertEqual(self.backend.statistics()["items"]["queries"]["id"], 1)
+
+    def test_update(self):
+        self.user.login = "test2"
+        self.backend.collection(User).update(self.user)
+
+        self.assertIsNone(self.backend.collection(User).lookup(login="test1"))
+        self.assertIs(self.backend.collection(User).lookup(login="test2"), self.user)
+
+    @gen_test
+    async def test_find(self):
+        self.backend.add(User(login="test2", email="test2@example.com", title="Test 2"))
+
+        documents = await self.backend.collection(User).find({"login": {"$in": ["test1", "test2", "test3"]}},
+                                                             {"login": 1, "_id": 0}).to_list(length=None)
+
+        self.assertEqual(sorted(documents, key=lambda document: document["login"]),
+                         [{"login": "test1"}, {"login": "test2"}])
+        self.assertEqual(self.backend.statistics()["users"]["queries"], {"id": 0, "index": 1, "scan": 0})
@@ -4,7 +4,7 @@ from tests.base_test_case import AsyncTestCase
 from models.validation.password_validation import InvalidLengthValidator, NoDigitValidator, \
     NoLowercaseCharacterValidator, NoUppercaseCharacterValidator, WhitespaceValidator, \
     NewPasswordIsTheSameAsCurrentOneValidator, OldPasswordIsNotTheSameAsCurrentOneValidator, \
-    PasswordIsNotTheSameAsRepeatPasswordValidator, GivenPasswordIsNotTheSameAsCurrentOneValidator
+    PasswordIsNotTheSameAsRepeatPasswordValidator, GivenPasswordIsNotTheSameAsCurrentOneValidator, BcryptCostPolicy
 from controller.ErrorHandler import InvalidPasswordException, NewPasswordIsTheSameAsCurrentOneException, \
     OldPasswordIsNotTheSameAsCurrentOneException, PasswordIsNotTheSameAsRepeatPasswordException, \
     GivenPasswordIsNotTheSameAsCurrentOneException
@@ -25,6 +25,8 @@ class TestPasswordValidation(AsyncTestCase):
         7. Is validation of old password that is not the same as current one correct;
         8. Is validation of password that is not the same as repeat password correct;
         9. Is validation of given password that is not the same as current one correct;
+        10. Is cost of verified hash checked against policy correctly;
+        11. Is validation of many passwords correct;
     Test scenario:
         1. Validate password which length is invalid;
            Compare received error and sample one;
@@ -52,6 +54,14 @@ class TestPasswordValidation(AsyncTestCase):
 
         9. Validate given password that is not the same as currect one;
            Compare received error and sample one;
+
+        10. Validate given password against hash which cost is lower than policy requires;
+            Check if rehash is required;
+            Validate given password against hash which cost is within policy;
+            Check if rehash is not required;
+
+        11. Validate many passwords by chain at once;
+            Compare received outcomes and sample ones;
     """
 
     def test_invalid_length_validator(self):
@@ -94,3 +104,20 @@ class TestPasswordValidation(AsyncTestCase):
             GivenPasswordIsNotTheSameAsCurrentOneValidator.validate(password="Test12345",
                                                                     current_hashed_password=hashpw(b"Test1234",
                                                                                                    gensalt()))
+
+    def test_given_password_cost_policy(self):
+        cost_policy: BcryptCostPolicy = BcryptCostPolicy(minimum_cost=5, maximum_cost=6)
+
+        self.assertTrue(GivenPasswordIsNotTheSameAsCurrentOneValidator.validate(
+            password="Test1234", current_hashed_password=hashpw(b"Test1234", gensalt(rounds=4)),
+            cost_policy=cost_policy))
+        self.assertFalse(GivenPasswordIsNotTheSameAsCurrentOneValidator.validate(
+            password="Test1234", current_hashed_password=hashpw(b"Test1234", gensalt(rounds=5)),
+            cost_policy=cost_policy))
+
+    def test_validate_many(self):
+        outcomes = InvalidLengthValidator(NoDigitValidator(WhitespaceValidator())).validate_many(
+            ["Test123", "Testtest", "Test 1234", "Test1234"])
+
+        self.assertEqual([type(outcome) for outcome in outcomes[:3]], [InvalidPasswordException] * 3)
+        self.assertIsNone(outcomes[3])
@@ -0,0 +1,81 @@
+from time import sleep, time
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.product_availability import ProductAvailabilityIndex
+from models.validation.product_validation import BlockValidator, DraftValidator, ExpireValidator
+from controller.ErrorHandler import InactiveProductException
+from models.items import Item
+
+
+class TestProductAvailability(AsyncTestCase):
+    """
+    Summary: Stores availability state of products.
+    Unit under test: models.validation.product_availability.ProductAvailabilityIndex.
+    Preconditions: None.
+    Parameters to test:
+        1. Is filtering of product ids correct;
+        2. Is removal of product from the index correct;
+        3. Is validation of indexed product correct;
+        4. Does indexed product expire without update;
+    Test scenario:
+        1. Index available, blocked, draft and expired products;
+           Filter their ids together with id that is not indexed;
+           Check if only available product id was returned;
+
+        2. Remove product from the index and index another one;
+           Check if removed product is not indexed and its slot was reused;
+
+        3. Validate product which state in the index differs from its attributes;
+           Compare received error and sample one;
+
+        4. Index product which price valid period ends in a moment and wait until it ends;
+           Check if product is filtered out and is not accepted by validator;
+    """
+
+    def setUp(self):
+        super(TestProductAvailability, self).setUp()
+        self.index: ProductAvailabilityIndex = ProductAvailabilityIndex()
+        self.index.update_state(item_id="available", is_enable=True, draft=False, valid_till=None)
+        self.index.update_state(item_id="blocked", is_enable=False, draft=False, valid_till=None)
+        self.index.update_state(item_id="draft", is_enable=True, draft=True, valid_till=None)
+        self.index.update_state(item_id="expired", is_enable=True, draft=False, valid_till=1612432399)
+
+    def test_filter_available(self):
+        self.assertEqual(self.index.filter_available(["blocked", "available", "draft", "expired", "unknown"]),
+                         ["available"])
+
+    def test_remove(self):
+        self.index.remove("blocked")
+        self.index.update_state(item_id="new", is_enable=True, draft=False, valid_till=None)
+
+        self.assertNotIn("blocked", self.index)
+        self.assertIsNone(self.index.state("blocked"))
+        self.assertTrue(self.index.is_available("new"))
+        self.assertEqual(len(self.index._states), 4)
+
+    def test_validators_read_index(self):
+        product: Item = Item(is_enable=True, draft=False)
+        product._id = "blocked"
+
+        with self.assertRaises(InactiveProductException):
+            BlockValidator(availability_index=self.index).validate(product)
+
+        product._id = "draft"
+        with self.assertRaises(InactiveProductException):
+            DraftValidator(availability_index=self.index).validate(product)
+
+        product._id = "expired"
+        with self.assertRaises(InactiveProductException):
+            ExpireValidator(availability_index=self.index).validate(product)
+
+    def test_expiration_without_update(self):
+        product: Item = Item(is_enable=True, draft=False, validTill=time() + 0.05)
+        product._id = "expiring"
+        self.index.update(product)
+
+        self.assertEqual(self.index.filter_available(["expiring"]), ["expiring"])
+        sleep(0.1)
+        self.assertEqual(self.index.filter_available(["expiring"]), [])
+        self.assertFalse(self.index.is_available("expiring"))
+        with self.assertRaises(InactiveProductException):
+            ExpireValidator(availability_index=self.index).validate(product)
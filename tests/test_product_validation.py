@@ -32,6 +32,11 @@ class TestProductValidation(AsyncTestCase):
 
         6. Validate product with enabled sale, but too short sale period;
            Compare received error and sample one;
+
+        7. Validate draft product presented in form of mapping;
+           Compare received error and sample one;
+           Validate available product presented in form of mapping;
+           Check if no error was raised;
     """
 
     @gen_test
@@ -72,3 +77,11 @@ class TestProductValidation(AsyncTestCase):
         with self.assertRaises(TooShortSalePeriodException):
             await TooShortSalePeriodValidator().validate_dictionary(
                 product_to_validate={"saleIsOn": True, "saleDateFrom": 1612432399, "saleDateTill": 1612434237})
+
+    def test_validate_mapping(self):
+        with self.assertRaises(InactiveProductException):
+            BlockValidator(DraftValidator(ExpireValidator())).validate_mapping(
+                {"is_enable": True, "draft": True, "validTill": 4102444800})
+
+        BlockValidator(DraftValidator(ExpireValidator())).validate_mapping(
+            {"is_enable": True, "draft": False, "validTill": 4102444800})
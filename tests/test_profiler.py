@@ -0,0 +1,68 @@
+import os
+import pstats
+from tempfile import TemporaryDirectory
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.profiler import profile
+
+
+class TestProfiler(AsyncTestCase):
+    """
+    Summary: Profiles validator chains.
+    Unit under test: models.validation.profiler.profile.
+    Preconditions: None.
+    Parameters to test:
+        1. Is time spent in bcrypt kept in folded stacks;
+        2. Is time awaited on stand-in DB kept in folded stacks;
+        3. Are file-supplied inputs profiled;
+        4. Are lookups neither shed nor failed when more payloads than limits of database limiter are profiled;
+    Test scenario:
+        1. Profile password chain over generated passwords;
+           Check if cProfile stats can be loaded;
+           Check if folded stacks contain bcrypt frame;
+
+        2. Profile user signup chain over generated users;
+           Check if folded stacks contain frame of awaited users collection;
+           Compare awaited time and time awaited according to backend;
+
+        3. Profile address chain over given address lists;
+           Check if report of chain was received;
+
+        4. Profile user signup chain over 300 generated users, i.e. both runs in separate event loops;
+           Check if no failures were reported;
+    """
+
+    def test_password_chain(self):
+        with TemporaryDirectory() as directory:
+            stats_path: str = os.path.join(directory, "password.prof")
+            folded_path: str = os.path.join(directory, "password.folded")
+
+            report = profile("password", inputs=["Test1234", "Test 1234"], bcrypt_cost=4, stats_path=stats_path,
+                             folded_path=folded_path)
+
+            self.assertGreater(pstats.Stats(stats_path).total_calls, 0)
+            with open(folded_path) as folded:
+                self.assertIn(";bcrypt.", folded.read())
+        self.assertGreater(report["bcrypt"], 0)
+
+    def test_signup_chain(self):
+        with TemporaryDirectory() as directory:
+            folded_path: str = os.path.join(directory, "signup.folded")
+
+            report = profile("signup", count=20, latency=0.001, folded_path=folded_path)
+
+            with open(folded_path) as folded:
+                awaited_lines = [line for line in folded if ";[db await users] " in line]
+        self.assertTrue(awaited_lines)
+        self.assertAlmostEqual(sum(int(line.rsplit(" ", 1)[1]) for line in awaited_lines) / 1000000,
+                               report["db_awaited"]["users"], places=3)
+
+    def test_file_supplied_inputs(self):
+        report = profile("address", inputs=[[{"address1": "1 Main Street", "address2": "", "isPrimary": True}]])
+
+        self.assertEqual(report["chain"], "address")
+
+    def test_signup_chain_without_failures(self):
+        report = profile("signup", count=300, latency=0.001)
+
+        self.assertEqual(report["failures"], {})
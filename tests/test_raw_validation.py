@@ -0,0 +1,97 @@
+from mock import patch
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.raw_validation import decode_and_validate, decode_and_validate_list, \
+    decode_and_validate_dictionary, MAXIMUM_PAYLOAD_SIZE
+from models.validation.records import ReviewPayloadRecord, AddressPayloadRecord, ProductPayloadRecord
+from models.validation.review_validation import RatingValidator, BodyValidator
+from models.validation.address_validation import NoPrimaryValidator, InvalidAddressLine1LengthValidator
+from models.validation.product_validation import TooShortPriceValidPeriodValidator, TooShortSalePeriodValidator
+from models.validation.exceptions import InvalidPayloadException
+from controller.ErrorHandler import InvalidReviewBodyException, TooShortPriceValidPeriodException
+
+
+class TestRawValidation(AsyncTestCase):
+    """
+    Summary: Decodes and validates raw JSON request bodies.
+    Unit under test: models.validation.raw_validation.
+    Preconditions: None.
+    Parameters to test:
+        1. Is valid review decoded into record with needed fields only;
+        2. Is invalid review rejected;
+        3. Is body with unexpected structure rejected;
+        4. Are valid addresses decoded into records;
+        5. Is invalid product rejected;
+        6. Are bodies with missing required fields or fields of wrong type rejected with and without msgspec;
+    Test scenario:
+        1. Decode and validate valid review with extra fields;
+           Check if record contains only needed fields;
+
+        2. Decode and validate review with empty body;
+           Compare received error and sample one;
+
+        3. Decode and validate malformed JSON, JSON array instead of object and too large body;
+           Compare received errors and sample ones;
+
+        4. Decode and validate valid list of addresses;
+           Check if records contain correct fields;
+
+        5. Decode and validate product with too short price valid period;
+           Compare received error and sample one;
+
+        6. Decode and validate review without rating, with string rating, with boolean rating and with numeric body,
+           address without primary flag and product on sale without sale dates, with and without msgspec;
+           Compare received errors and sample ones;
+    """
+
+    def test_valid_review(self):
+        record: ReviewPayloadRecord = decode_and_validate(
+            b'{"rating": 5, "body": "Nice item", "item_id": "test_item_id", "images": [{"url": "a"}]}',
+            RatingValidator(BodyValidator()), ReviewPayloadRecord)
+
+        self.assertEqual(record.to_dictionary(), {"rating": 5, "body": "Nice item", "item_id": "test_item_id"})
+        self.assertIsNone(record.user_id)
+
+    def test_invalid_review(self):
+        with self.assertRaises(InvalidReviewBodyException):
+            decode_and_validate(b'{"rating": 5, "body": ""}', RatingValidator(BodyValidator()), ReviewPayloadRecord)
+
+    def test_invalid_structure(self):
+        for raw in (b'{"rating": 5, ', b'[{"rating": 5}]', b" " * (MAXIMUM_PAYLOAD_SIZE + 1)):
+            with self.assertRaises(InvalidPayloadException):
+                decode_and_validate(raw, RatingValidator(BodyValidator()), ReviewPayloadRecord)
+
+    def test_valid_addresses(self):
+        records = decode_and_validate_list(b'[{"isPrimary": true, "address1": "Main street 1", "city": "Kyiv"}]',
+                                           NoPrimaryValidator(InvalidAddressLine1LengthValidator()),
+                                           AddressPayloadRecord)
+
+        self.assertEqual([record.to_dictionary() for record in records],
+                         [{"isPrimary": True, "address1": "Main street 1"}])
+
+    @gen_test
+    async def test_invalid_product(self):
+        with self.assertRaises(TooShortPriceValidPeriodException):
+            await decode_and_validate_dictionary(
+                b'{"valitFrom": 1612432399, "validTill": 1612434237, "saleIsOn": false, "description": "..."}',
+                TooShortPriceValidPeriodValidator(TooShortSalePeriodValidator()), ProductPayloadRecord)
+
+    @gen_test
+    async def test_invalid_fields(self):
+        import models.validation.raw_validation as raw_validation
+
+        for msgspec in {raw_validation.msgspec, None}:
+            with patch("models.validation.raw_validation.msgspec", msgspec):
+                for raw in (b'{"body": "Nice item"}', b'{"rating": "5", "body": "Nice item"}',
+                            b'{"rating": true, "body": "Nice item"}', b'{"rating": 5, "body": 7}'):
+                    with self.assertRaises(InvalidPayloadException):
+                        decode_and_validate(raw, RatingValidator(BodyValidator()), ReviewPayloadRecord)
+                with self.assertRaises(InvalidPayloadException):
+                    decode_and_validate_list(b'[{"address1": "Main street 1"}]',
+                                             NoPrimaryValidator(InvalidAddressLine1LengthValidator()),
+                                             AddressPayloadRecord)
+                with self.assertRaises(InvalidPayloadException):
+                    await decode_and_validate_dictionary(
+                        b'{"valitFrom": 1612432399, "validTill": 1612534237, "saleIsOn": true}',
+                        TooShortPriceValidPeriodValidator(TooShortSalePeriodValidator()), ProductPayloadRecord)
@@ -0,0 +1,45 @@
+import os
+from tempfile import TemporaryDirectory
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.review_similarity import SimHashIndex, simhash
+
+
+class TestReviewSimilarity(AsyncTestCase):
+    """
+    Summary: Finds near-duplicate review bodies.
+    Unit under test: models.validation.review_similarity.SimHashIndex.
+    Preconditions: None.
+    Parameters to test:
+        1. Is size of the index bounded;
+        2. Is snapshot of the index restored correctly;
+    Test scenario:
+        1. Add more fingerprints than index can hold;
+           Check if the oldest fingerprint was evicted;
+
+        2. Save index to file and load it back;
+           Check if near duplicate is found in loaded index;
+    """
+
+    def test_eviction(self):
+        index: SimHashIndex = SimHashIndex(max_size=2)
+        for text in ("first review text", "second review text", "third review text"):
+            index.add("item:test_item_id", simhash(text))
+
+        self.assertEqual(len(index), 2)
+        self.assertFalse(index.contains_near_duplicate("item:test_item_id", simhash("first review text")))
+        self.assertTrue(index.contains_near_duplicate("item:test_item_id", simhash("Third review, text!")))
+
+    def test_snapshot(self):
+        index: SimHashIndex = SimHashIndex()
+        index.add("user:test_user_id", simhash("Nice item, arrived on time, works fine."))
+
+        with TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "reviews.json")
+            index.save(path)
+            loaded_index: SimHashIndex = SimHashIndex.load(path)
+
+        self.assertTrue(loaded_index.contains_near_duplicate("user:test_user_id",
+                                                             simhash("nice item arrived on time works fine")))
+        self.assertFalse(loaded_index.contains_near_duplicate("user:another_user_id",
+                                                              simhash("nice item arrived on time works fine")))
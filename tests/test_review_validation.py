@@ -1,7 +1,8 @@
 from tornado.testing import gen_test
 
 from tests.base_test_case import AsyncTestCase
-from models.validation.review_validation import RatingValidator, BodyValidator
+from models.validation.review_validation import RatingValidator, BodyValidator, DuplicateBodyValidator
+from models.validation.exceptions import DuplicateReviewBodyException
 from controller.ErrorHandler import InvalidReviewRatingException, InvalidReviewBodyException
 
 
@@ -18,6 +19,11 @@ class TestReviewValidation(AsyncTestCase):
 
             2. Validate invalid review body;
                Compare received error and sample one;
+
+            3. Validate review which body nearly duplicates body of another review of the same product;
+               Compare received error and sample one;
+               Validate the same review of another product and author;
+               Check if no error was raised;
     """
 
     def setUp(self):
@@ -33,3 +39,18 @@ class TestReviewValidation(AsyncTestCase):
     def test_text_validator(self):
         with self.assertRaises(expected_exception=InvalidReviewBodyException):
             BodyValidator().validate({"body": ""})
+
+    def test_duplicate_body_validator(self):
+        validator: DuplicateBodyValidator = DuplicateBodyValidator()
+        validator.validate({"item_id": "test_item_id_1", "user_id": "test_user_id_1",
+                            "body": "Great product, fast delivery and the quality is exactly as described. "
+                                    "Would buy again from this seller!"})
+
+        with self.assertRaises(expected_exception=DuplicateReviewBodyException):
+            validator.validate({"item_id": "test_item_id_1", "user_id": "test_user_id_2",
+                                "body": "great product fast delivery and the quality is exactly as described. "
+                                        "Would buy again from this shop!"})
+
+        validator.validate({"item_id": "test_item_id_2", "user_id": "test_user_id_2",
+                            "body": "Great product, fast delivery and the quality is exactly as described. "
+                                    "Would buy again from this seller!"})
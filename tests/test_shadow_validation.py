@@ -0,0 +1,140 @@
+from random import Random
+
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.shadow_validation import ShadowRunner
+from models.validation.database_limiter import validation_deadline
+from models.validation.memory_backend import InMemoryBackend
+from models.validation.password_validation import InvalidLengthValidator, NoDigitValidator
+from models.validation.user_validation import LoginValidator, EmailValidator
+from controller.ErrorHandler import InvalidPasswordException, LoginIsAlreadyInUseException
+from models.users import User
+
+
+class TestShadowValidation(AsyncTestCase):
+    """
+    Summary: Runs candidate chain alongside primary one and compares verdicts.
+    Unit under test: models.validation.shadow_validation.ShadowRunner.
+    Preconditions:
+        1. Serve lookups by models.validation.memory_backend.InMemoryBackend;
+    Parameters to test:
+        1. Are verdicts of validate method compared;
+        2. Are verdicts of validate dictionary method compared;
+        3. Are calls which are not sampled passed only to primary chain;
+        4. Does candidate run outside of deadline of the caller, with its own deadline if given;
+        5. Does candidate get payload as it was before primary chain ran;
+        6. Are sampled calls dropped while too many candidate runs are in progress;
+    Test scenario:
+        1. Validate passwords by primary chain and reordered candidate chain without digit check;
+           Compare received errors and errors of primary chain;
+           Check if only password without digit was logged as mismatch;
+
+        2. Validate user whose login and email are in use by primary chain and reordered candidate chain;
+           Compare received error and error of primary chain;
+           Check if mismatch of exception types was logged;
+
+        3. Validate password with zero sample rate;
+           Check if nothing was compared;
+
+        4. Validate user with deadline which candidate chain can not meet;
+           Check if there was no mismatch;
+           Validate user with candidate timeout which candidate chain can not meet;
+           Check if timeout of candidate was logged as mismatch;
+
+        5. Validate user and change its login to login in use before candidate runs;
+           Check if there was no mismatch;
+
+        6. Validate two users with one pending candidate run allowed;
+           Check if the second call was dropped;
+    """
+
+    def test_validate(self):
+        runner: ShadowRunner = ShadowRunner(primary=InvalidLengthValidator(NoDigitValidator()),
+                                            candidate=InvalidLengthValidator(), sample_rate=1.0)
+
+        with self.assertRaises(InvalidPasswordException):
+            runner.validate(password="Test123")
+        with self.assertRaises(InvalidPasswordException):
+            runner.validate(password="Testtest")
+        runner.validate(password="Test1234")
+        runner.join()
+
+        self.assertEqual(runner.statistics()["compared"], 3)
+        self.assertEqual(runner.statistics()["mismatched"], 1)
+        self.assertEqual(runner.mismatches[0].primary, "InvalidPasswordException")
+        self.assertIsNone(runner.mismatches[0].candidate)
+
+    @gen_test
+    async def test_validate_dictionary(self):
+        backend: InMemoryBackend = InMemoryBackend(latency=0.001)
+        backend.add(User(login="test1", email="example@example.com", title="Test 1"))
+        runner: ShadowRunner = ShadowRunner(primary=LoginValidator(EmailValidator()),
+                                            candidate=EmailValidator(LoginValidator()), sample_rate=1.0)
+
+        with backend.patch():
+            with self.assertRaises(LoginIsAlreadyInUseException):
+                await runner.validate_dictionary({"login": "test1", "email": "example@example.com"})
+            await runner.drain()
+
+        self.assertEqual(runner.statistics()["mismatched"], 1)
+        self.assertEqual(runner.mismatches[0].to_dictionary()["candidate"], "EmailIsAlreadyInUseException")
+
+    def test_not_sampled(self):
+        runner: ShadowRunner = ShadowRunner(primary=InvalidLengthValidator(), candidate=NoDigitValidator(),
+                                            sample_rate=0.0, random=Random(0))
+
+        runner.validate(password="Testtest")
+        runner.join()
+
+        self.assertEqual(runner.statistics()["calls"], 1)
+        self.assertEqual(runner.statistics()["compared"], 0)
+
+    @gen_test
+    async def test_candidate_deadline(self):
+        backend: InMemoryBackend = InMemoryBackend(latency=0.02)
+        backend.add(User(login="test1", email="example@example.com", title="Test 1"))
+        runner: ShadowRunner = ShadowRunner(primary=LoginValidator(), candidate=LoginValidator(EmailValidator()),
+                                            sample_rate=1.0)
+
+        with backend.patch():
+            with validation_deadline(0.03):
+                await runner.validate_dictionary({"login": "test2", "email": "test2@example.com"})
+            await runner.drain()
+            self.assertEqual(runner.statistics()["mismatched"], 0)
+
+            runner.candidate_timeout = 0.001
+            await runner.validate_dictionary({"login": "test3", "email": "test3@example.com"})
+            await runner.drain()
+
+        self.assertEqual(runner.statistics()["mismatched"], 1)
+        self.assertEqual(runner.mismatches[0].candidate, "ValidationTimeoutException")
+
+    @gen_test
+    async def test_candidate_payload_is_copied(self):
+        backend: InMemoryBackend = InMemoryBackend(latency=0.001)
+        backend.add(User(login="test1", email="example@example.com", title="Test 1"))
+        runner: ShadowRunner = ShadowRunner(primary=LoginValidator(), candidate=LoginValidator(), sample_rate=1.0)
+        user = {"login": "test2"}
+
+        with backend.patch():
+            await runner.validate_dictionary(user)
+            user["login"] = "test1"
+            await runner.drain()
+
+        self.assertEqual(runner.statistics()["compared"], 1)
+        self.assertEqual(runner.statistics()["mismatched"], 0)
+
+    @gen_test
+    async def test_pending_candidate_runs_are_bounded(self):
+        backend: InMemoryBackend = InMemoryBackend(latency=0.01)
+        runner: ShadowRunner = ShadowRunner(primary=EmailValidator(), candidate=LoginValidator(), sample_rate=1.0,
+                                            max_pending=1)
+
+        with backend.patch():
+            await runner.validate_dictionary({"login": "test1", "email": "test1@example.com"})
+            await runner.validate_dictionary({"login": "test2", "email": "test2@example.com"})
+            await runner.drain()
+
+        self.assertEqual(runner.statistics()["dropped"], 1)
+        self.assertEqual(runner.statistics()["compared"], 1)
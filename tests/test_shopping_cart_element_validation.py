@@ -1,7 +1,7 @@
 from tornado.testing import gen_test
-from mock import patch
 
 from tests.base_test_case import AsyncTestCase
+from models.validation.memory_backend import InMemoryBackend
 from models.validation.shopping_cart_element_validation import DeliveryMethodIsNotAvailableValidator
 from controller.ErrorHandler import DeliveryMethodIsNotAvailableException
 from models.sc_element import SCElement
@@ -12,28 +12,36 @@ class TestShoppingCartElementValidation(AsyncTestCase):
     """
     Summary: Validates shopping cart elements.
     Unit under test: models.validation.shopping_cart_element_validator.ShoppingCartElementValidator.
-    Preconditions: None.
+    Preconditions:
+        1. Fill in-memory backend with shopping cart elements test_shopping_element_1 and test_shopping_element_2 and
+           products test_item_id_1, which is only available for pick up, and test_item_id_2, which is only available
+           for delivery;
     Parameters to test:
         1. Is validation of delivery method correct;
+        2. Is batched validation of delivery methods correct;
     Test scenario:
         1. Validate delivery method that is not available;
            Check if appropriate exceptions were raised;
-           Check if mocked methods were called with correct arguments;
+           Check if every lookup fetched single document by id;
+
+        2. Validate many shopping cart elements at once;
+           Compare received outcomes and sample ones;
+           Check if backend was queried once per collection;
     """
 
+    def setUp(self):
+        super(TestShoppingCartElementValidation, self).setUp()
+        self.backend: InMemoryBackend = InMemoryBackend()
+        for number, (delivery_offered, market_pick_offered) in enumerate(((False, True), (True, False)), start=1):
+            shopping_cart_element: SCElement = SCElement(item_id="test_item_id_{}".format(number))
+            shopping_cart_element._id = "test_shopping_element_{}".format(number)
+            product: Item = Item(deliveryOffered=delivery_offered, marketPickOffered=market_pick_offered)
+            product._id = "test_item_id_{}".format(number)
+            self.backend.add(shopping_cart_element, product)
+
     @gen_test
     async def test_delivery_method_is_not_available_validator(self):
-        async def get(*args, **kwargs):
-            if args[0] == "test_shopping_element_1":
-                return SCElement(item_id="test_item_id_1", deliveryOffered=False, marketPickOffered=True)
-            elif args[0] == "test_shopping_element_2":
-                return SCElement(item_id="test_item_id_2", deliveryOffered=True, marketPickOffered=False)
-            elif args[0] == "test_item_id_1":
-                return Item(deliveryOffered=False, marketPickOffered=True)
-            elif args[0] == "test_item_id_2":
-                return Item(deliveryOffered=True, marketPickOffered=False)
-
-        with patch(target="motorengine.queryset.QuerySet.get", side_effect=get) as get_mock:
+        with self.backend.patch():
             with self.assertRaises(DeliveryMethodIsNotAvailableException):
                 await DeliveryMethodIsNotAvailableValidator().validate_dictionary(
                     {"ID": "test_shopping_element_1", "delivery": {"method": "US Delivery"}})
@@ -42,7 +50,23 @@ class TestShoppingCartElementValidation(AsyncTestCase):
                 await DeliveryMethodIsNotAvailableValidator().validate_dictionary(
                     {"ID": "test_shopping_element_2", "delivery": {"method": "Pick Up"}})
 
-        self.assertEqual(get_mock.call_args_list[0][0][0], "test_shopping_element_1")
-        self.assertEqual(get_mock.call_args_list[1][0][0], "test_item_id_1")
-        self.assertEqual(get_mock.call_args_list[2][0][0], "test_shopping_element_2")
-        self.assertEqual(get_mock.call_args_list[3][0][0], "test_item_id_2")
+        statistics = self.backend.statistics()
+        self.assertEqual(statistics["sc_elements"]["queries"], {"id": 2, "index": 0, "scan": 0})
+        self.assertEqual(statistics["items"]["queries"], {"id": 2, "index": 0, "scan": 0})
+
+    @gen_test
+    async def test_validate_dictionary_many(self):
+        with self.backend.patch():
+            outcomes = await DeliveryMethodIsNotAvailableValidator().validate_dictionary_many(
+                [{"ID": "test_shopping_element_1", "delivery": {"method": "US Delivery"}},
+                 {"ID": "test_shopping_element_1", "delivery": {"method": "Pick Up"}},
+                 {"ID": "test_shopping_element_2", "delivery": {"method": "Pick Up"}},
+                 {"ID": "test_shopping_element_3", "delivery": {"method": "Pick Up"}}])
+
+        self.assertIsInstance(outcomes[0], DeliveryMethodIsNotAvailableException)
+        self.assertIsNone(outcomes[1])
+        self.assertIsInstance(outcomes[2], DeliveryMethodIsNotAvailableException)
+        self.assertIsInstance(outcomes[3], KeyError)
+        statistics = self.backend.statistics()
+        self.assertEqual(statistics["sc_elements"]["queries"], {"id": 1, "index": 0, "scan": 0})
+        self.assertEqual(statistics["items"]["queries"], {"id": 1, "index": 0, "scan": 0})
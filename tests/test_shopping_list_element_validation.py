@@ -1,6 +1,10 @@
+from tornado.testing import gen_test
+
 from tests.base_test_case import AsyncTestCase
-from models.validation.shopping_list_element_validation import NameValidator
+from models.validation.memory_backend import InMemoryBackend
+from models.validation.shopping_list_element_validation import NameValidator, ShoppingListValidator
 from models.shopping_list_entry import ShoppingListElement
+from models.items import Item
 from controller.ErrorHandler import InvalidCustomShoppingListElementNameException
 
 
@@ -11,9 +15,15 @@ class TestShoppingListElementValidation(AsyncTestCase):
     Preconditions: None.
     Parameters to test:
         1. Is validation of custom shopping list element correct;
+        2. Are stale entries of shopping list found by single query;
     Test scenario:
         1. Validate custom shopping list element name that is invalid;
            Compare received error and sample one;
+
+        2. Validate shopping list with custom entry, available product and blocked, draft, expired, not deliverable
+           and missing ones and entry with empty reference;
+           Compare received stale entries and their reasons with sample ones;
+           Check if products were fetched by single query;
     """
 
     def setUp(self):
@@ -24,3 +34,25 @@ class TestShoppingListElementValidation(AsyncTestCase):
         with self.assertRaises(InvalidCustomShoppingListElementNameException):
             NameValidator().validate(ShoppingListElement(
                 **{"is_custom": True, "name": "a" * 101, "subcategory_entry_id": "", "is_active": True}))
+
+    @gen_test
+    async def test_find_stale_entries(self):
+        backend: InMemoryBackend = InMemoryBackend()
+        for number, fields in enumerate(({}, {"is_enable": False}, {"draft": True}, {"validTill": 1612432399},
+                                         {"deliveryOffered": False, "marketPickOffered": False})):
+            product: Item = Item(**{"is_enable": True, "draft": False, "validTill": None, "deliveryOffered": True,
+                                    "marketPickOffered": True, **fields})
+            product._id = "test_item_id_{}".format(number)
+            backend.add(product)
+        shopping_list = [{"is_custom": True, "name": "Milk"}] + [
+            {"is_custom": False, "subcategory_entry_id": "test_item_id_{}".format(number)} for number in range(6)] + [
+            {"is_custom": False, "subcategory_entry_id": ""}]
+        shopping_list[1] = ShoppingListElement(is_custom=False, subcategory_entry_id="test_item_id_0")
+
+        with backend.patch():
+            stale_entries = await ShoppingListValidator().find_stale_entries(shopping_list)
+
+        self.assertEqual([(entry.position, entry.reasons) for entry in stale_entries],
+                         [(2, ["blocked"]), (3, ["draft"]), (4, ["expired"]), (5, ["not deliverable"]),
+                          (6, ["missing"]), (7, ["missing"])])
+        self.assertEqual(backend.statistics()["items"]["queries"], {"id": 1, "index": 0, "scan": 0})
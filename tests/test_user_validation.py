@@ -2,6 +2,7 @@ from tornado.testing import gen_test
 from mock import patch, MagicMock
 
 from tests.base_test_case import AsyncTestCase
+from models.validation.memory_backend import InMemoryBackend
 from models.validation.user_validation import EmailValidator, LoginValidator, BuyerCompanyNameValidator, \
     BlockedUserValidator
 from controller.ErrorHandler import EmailIsAlreadyInUseException, LoginIsAlreadyInUseException, \
@@ -21,6 +22,9 @@ class TestUserValidation(AsyncTestCase):
         3. Is validation of user whose buyer/company name that is in use correct;
         4. Is validation of user whose email is not verified correct;
         5. Is validation of user that is blocked correct;
+        6. Is validation of user presented in form of mapping correct;
+        7. Is batched validation of many users correct;
+        8. Is batched validator after validator without batched implementation queried once;
     Test scenario:
         1. Validate user whose email that is in use;
            Compare received error and sample one;
@@ -38,6 +42,17 @@ class TestUserValidation(AsyncTestCase):
            Check if mocked methods were called with correct arguments;
            Validate user that is blocked;
            Compare received error and sample one;
+
+        6. Validate user presented in form of mapping whose email is not verified;
+           Compare received error and sample one;
+
+        7. Validate users whose login is in use, whose email is in use, who has no login and who is valid at once;
+           Compare received outcomes and sample ones;
+           Check if every validator queried backend once;
+
+        8. Validate users whose login is in use and who are valid by login validator after blocked user validator;
+           Compare received outcomes and sample ones;
+           Check if backend was queried once;
     """
 
     @gen_test
@@ -71,3 +86,39 @@ class TestUserValidation(AsyncTestCase):
 
         with self.assertRaises(BlockedUserException):
             BlockedUserValidator().validate(user=User(is_enable=False))
+
+    def test_validate_mapping(self):
+        with self.assertRaises(NoVerifyEmailAddress):
+            EmailValidator(BlockedUserValidator()).validate_mapping({"is_enable": True, "email_conform": False})
+
+    @gen_test
+    async def test_validate_dictionary_many(self):
+        backend: InMemoryBackend = InMemoryBackend()
+        backend.add(User(login="test1", email="test1@example.com", title="Test 1"),
+                    User(login="test2", email="example@example.com", title="Test 2"))
+
+        with backend.patch():
+            outcomes = await LoginValidator(EmailValidator(BuyerCompanyNameValidator())).validate_dictionary_many(
+                [{"login": " Test1 ", "email": "a@b.com", "title": "A"},
+                 {"login": "test3", "email": "Example@example.com", "title": "B"},
+                 {"email": "c@d.com", "title": "C"},
+                 {"login": "test4", "email": "e@f.com", "title": "D"}])
+
+        self.assertIsInstance(outcomes[0], LoginIsAlreadyInUseException)
+        self.assertIsInstance(outcomes[1], EmailIsAlreadyInUseException)
+        self.assertIsInstance(outcomes[2], KeyError)
+        self.assertIsNone(outcomes[3])
+        self.assertEqual(backend.statistics()["users"]["queries"], {"id": 0, "index": 3, "scan": 0})
+
+    @gen_test
+    async def test_validate_dictionary_many_after_validator_without_batched_implementation(self):
+        backend: InMemoryBackend = InMemoryBackend()
+        backend.add(User(login="test1", email="test1@example.com", title="Test 1"))
+
+        with backend.patch():
+            outcomes = await BlockedUserValidator(LoginValidator()).validate_dictionary_many(
+                [{"login": "test1"}, {"login": "test2"}, {"login": "test3"}])
+
+        self.assertIsInstance(outcomes[0], LoginIsAlreadyInUseException)
+        self.assertEqual(outcomes[1:], [None, None])
+        self.assertEqual(backend.statistics()["users"]["queries"], {"id": 0, "index": 1, "scan": 0})
@@ -0,0 +1,122 @@
+from tornado.testing import gen_test
+
+from tests.base_test_case import AsyncTestCase
+from models.validation.validation_memo import ValidationMemo, payload_hash
+from models.validation.memory_backend import InMemoryBackend
+from models.validation.address_validation import NoPrimaryValidator, InvalidAddressLine1LengthValidator
+from models.validation.review_validation import BodyValidator, DuplicateBodyValidator
+from models.validation.product_availability import ProductAvailabilityIndex
+from models.validation.product_validation import ProductCodeAlreadyExistsValidator, BlockValidator, ExpireValidator
+from models.validation.exceptions import DuplicateReviewBodyException
+from controller.ErrorHandler import NoPrimaryAddressException, ProductCodeAlreadyExistsException, \
+    InactiveProductException
+from models.items import Item
+
+
+class TestValidationMemo(AsyncTestCase):
+    """
+    Summary: Memoizes validation outcomes of retried payloads.
+    Unit under test: models.validation.validation_memo.ValidationMemo.
+    Preconditions:
+        1. Serve lookups by models.validation.memory_backend.InMemoryBackend;
+    Parameters to test:
+        1. Is outcome of pure CPU chain replayed;
+        2. Is outcome of DB-backed chain expired;
+        3. Is chain with stateful validator not memoized;
+        4. Is outcome of time-dependent chain expired;
+        5. Is chain with availability index not memoized;
+        6. Is payload which is not JSON-native not memoized;
+    Test scenario:
+        1. Validate the same invalid addresses twice with different order of keys;
+           Compare received errors and sample ones;
+           Check if the second validation was a hit;
+
+        2. Validate the same product twice with zero TTL;
+           Compare received errors and sample ones;
+           Check if backend was queried twice;
+
+        3. Validate the same review twice by chain with duplicate body validator;
+           Compare received error and sample one;
+
+        4. Validate the same product twice by chain with expire validator and zero TTL;
+           Check if the second validation was not a hit;
+
+        5. Validate available product by chain with availability index, block product and validate it again;
+           Compare received error and sample one;
+
+        6. Hash payloads with tuple and with non-string key;
+           Check if TypeError was raised;
+           Validate the same payload with tuple twice;
+           Check if both validations were bypassed;
+    """
+
+    def test_pure_chain_outcome_is_replayed(self):
+        memo: ValidationMemo = ValidationMemo()
+
+        with self.assertRaises(NoPrimaryAddressException):
+            memo.validate(NoPrimaryValidator(InvalidAddressLine1LengthValidator()),
+                          [{"isPrimary": False, "address1": "Main street 1"}])
+        with self.assertRaises(NoPrimaryAddressException):
+            memo.validate(NoPrimaryValidator(InvalidAddressLine1LengthValidator()),
+                          [{"address1": "Main street 1", "isPrimary": False}])
+
+        self.assertEqual(memo.statistics()["hits"], 1)
+        self.assertEqual(memo.statistics()["misses"], 1)
+
+    @gen_test
+    async def test_db_backed_chain_outcome_expires(self):
+        backend: InMemoryBackend = InMemoryBackend()
+        backend.add(Item(productNo="OR0507162206", is_parent=True))
+
+        memo: ValidationMemo = ValidationMemo(db_backed_ttl=0)
+        with backend.patch():
+            for _ in range(2):
+                with self.assertRaises(ProductCodeAlreadyExistsException):
+                    await memo.validate_dictionary(ProductCodeAlreadyExistsValidator(), {"productNo": "OR0507162206"})
+
+        self.assertEqual(backend.statistics()["items"]["queries"]["index"], 2)
+        self.assertEqual(memo.statistics()["expired"], 1)
+
+    def test_stateful_chain_is_not_memoized(self):
+        memo: ValidationMemo = ValidationMemo()
+        validator: BodyValidator = BodyValidator(DuplicateBodyValidator())
+        review = {"item_id": "test_item_id", "body": "Nice item, arrived on time, works fine."}
+
+        memo.validate(validator, review)
+        with self.assertRaises(DuplicateReviewBodyException):
+            memo.validate(validator, review)
+
+    @gen_test
+    async def test_time_dependent_chain_outcome_expires(self):
+        memo: ValidationMemo = ValidationMemo(time_dependent_ttl=0)
+
+        for _ in range(2):
+            await memo.validate_dictionary(ExpireValidator(), {"_id": "test_item_id"})
+
+        self.assertEqual(memo.statistics()["hits"], 0)
+        self.assertEqual(memo.statistics()["expired"], 1)
+
+    def test_chain_with_availability_index_is_not_memoized(self):
+        memo: ValidationMemo = ValidationMemo()
+        availability_index: ProductAvailabilityIndex = ProductAvailabilityIndex()
+        availability_index.update_state(item_id="test_item_id", is_enable=True, draft=False, valid_till=None)
+        product = Item(_id="test_item_id", is_enable=True, draft=False)
+
+        memo.validate(BlockValidator(availability_index=availability_index), product)
+        availability_index.update_state(item_id="test_item_id", is_enable=False, draft=False, valid_till=None)
+        with self.assertRaises(InactiveProductException):
+            memo.validate(BlockValidator(availability_index=availability_index), product)
+        self.assertEqual(memo.statistics()["bypassed"], 2)
+
+    def test_payload_which_is_not_json_native_is_not_memoized(self):
+        memo: ValidationMemo = ValidationMemo()
+
+        with self.assertRaises(TypeError):
+            payload_hash([{"address1": ("Main street 1",)}])
+        with self.assertRaises(TypeError):
+            payload_hash({1: "Main street 1"})
+        for _ in range(2):
+            memo.validate(NoPrimaryValidator(), [{"isPrimary": True, "address1": ("Main street 1",)}])
+
+        self.assertEqual(memo.statistics()["bypassed"], 2)
+        self.assertEqual(memo.statistics()["size"], 0)
@@ -1,9 +1,17 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Mapping, FrozenSet, Callable, Set
 
 from models.users import User
+from models.validation.chain import DictionaryBatchValidationMixin
+from models.validation.database_limiter import database_limiter
+from models.validation.lookup_coalescing import lookup_coalescer
+from models.validation.queries import document_exists, existing_values
+from models.validation.records import UserRecord
 
 
-class UserValidator:
+class UserValidator(DictionaryBatchValidationMixin):
+    INPUT_FIELDS: Optional[FrozenSet[str]] = None
+    IS_DB_BACKED: bool = False
+
     def __init__(self, next_validator: Optional["UserValidator"] = None):
         self.next_validator: Optional[UserValidator] = next_validator
 
@@ -17,6 +25,16 @@ class UserValidator:
         if self.next_validator is not None:
             self.next_validator.validate(user)
 
+    def validate_mapping(self, user: Mapping) -> None:
+        """
+        Runs the same checks as validate method on user presented in form of mapping, e.g. request JSON or projected
+        DB document, without building User object.
+
+        :param user: User to validate.
+        """
+
+        self.validate(UserRecord.from_mapping(user))
+
     async def validate_dictionary(self, user: Dict[str, Any]) -> None:
         """
         Base implementation of validate dictionary method. Passes validation to the next validator if exists.
@@ -27,8 +45,37 @@ class UserValidator:
         if self.next_validator is not None:
             await self.next_validator.validate_dictionary(user)
 
+    async def validate_unique_dictionary_many(self, users: List[Dict], field: str, normalize: Callable[[Any], Any],
+                                              exception: Callable[[Dict], Exception]) -> List[Optional[Exception]]:
+        """
+        Batched check that value of given field is not in use, shared by validators of unique fields. Values of all
+        users are looked up by single query; users which passed are passed to the next validator.
+
+        :param users: Users presented in form of dictionary.
+        :param field: Field which value has to be unique, e.g. "login".
+        :param normalize: Function which normalizes value before lookup.
+        :param exception: Function which returns exception for user whose value is in use.
+        """
+
+        outcomes: List[Optional[Exception]] = [None] * len(users)
+        values: Dict[int, Any] = {}
+        for position, user in enumerate(users):
+            try:
+                values[position] = normalize(user[field])
+            except Exception as error:
+                outcomes[position] = error
+        used_values: Set[Any] = await database_limiter.run(
+            "users", existing_values, User, field, set(values.values())) if values else set()
+        for position, value in values.items():
+            if value in used_values:
+                outcomes[position] = exception(users[position])
+        return await self.validate_next_dictionary_many(users, outcomes)
+
 
 class LoginValidator(UserValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"login"})
+    IS_DB_BACKED: bool = True
+
     def validate(self, user: User) -> None:
         super().validate(user)
 
@@ -41,13 +88,22 @@ class LoginValidator(UserValidator):
 
         from controller.ErrorHandler import LoginIsAlreadyInUseException
 
-        if await User.objects.get(login=user["login"].lower().strip()):
+        if await lookup_coalescer.run("users", document_exists, User, login=user["login"].lower().strip()):
             raise LoginIsAlreadyInUseException
         else:
             await super().validate_dictionary(user)
 
+    async def validate_dictionary_many(self, users: List[Dict]) -> List[Optional[Exception]]:
+        from controller.ErrorHandler import LoginIsAlreadyInUseException
+
+        return await self.validate_unique_dictionary_many(users, "login", lambda login: login.lower().strip(),
+                                                          lambda user: LoginIsAlreadyInUseException())
+
 
 class EmailValidator(UserValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"email"})
+    IS_DB_BACKED: bool = True
+
     def validate(self, user: User) -> None:
         """
         Raises exception if user's email is not verified. Otherwise passes user to base validator.
@@ -71,13 +127,22 @@ class EmailValidator(UserValidator):
 
         from controller.ErrorHandler import EmailIsAlreadyInUseException
 
-        if await User.objects.get(email=user["email"].lower().strip()):
+        if await lookup_coalescer.run("users", document_exists, User, email=user["email"].lower().strip()):
             raise EmailIsAlreadyInUseException
         else:
             await super().validate_dictionary(user)
 
+    async def validate_dictionary_many(self, users: List[Dict]) -> List[Optional[Exception]]:
+        from controller.ErrorHandler import EmailIsAlreadyInUseException
+
+        return await self.validate_unique_dictionary_many(users, "email", lambda email: email.lower().strip(),
+                                                          lambda user: EmailIsAlreadyInUseException())
+
 
 class BuyerCompanyNameValidator(UserValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset({"title"})
+    IS_DB_BACKED: bool = True
+
     def validate(self, user: User) -> None:
         super().validate(user)
 
@@ -90,13 +155,21 @@ class BuyerCompanyNameValidator(UserValidator):
 
         from controller.ErrorHandler import BuyerCompanyNameIsAlreadyInUseException
 
-        if await User.objects.get(title=user["title"]):
+        if await lookup_coalescer.run("users", document_exists, User, title=user["title"]):
             raise BuyerCompanyNameIsAlreadyInUseException(user)
         else:
             await super().validate_dictionary(user)
 
+    async def validate_dictionary_many(self, users: List[Dict]) -> List[Optional[Exception]]:
+        from controller.ErrorHandler import BuyerCompanyNameIsAlreadyInUseException
+
+        return await self.validate_unique_dictionary_many(users, "title", lambda title: title,
+                                                          BuyerCompanyNameIsAlreadyInUseException)
+
 
 class BlockedUserValidator(UserValidator):
+    INPUT_FIELDS: FrozenSet[str] = frozenset()
+
     def validate(self, user: User) -> None:
         """
         Raises exception if user is blocked. Otherwise passes user to base validator.
@@ -0,0 +1,208 @@
+import json
+from collections import OrderedDict
+from hashlib import blake2b
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.validation.chain import unroll_chain
+from models.validation.exceptions import ValidationTimeoutException, ValidationOverloadedException
+
+
+def chain_fingerprint(validator: Any) -> str:
+    """
+    Returns fingerprint of chain which starts with given validator. Fingerprint changes if validators of chain, their
+    order or their limits change.
+
+    :param validator: The first validator of chain.
+    """
+
+    description: List[Tuple[str, List[Tuple[str, str]]]] = [
+        ("{}.{}".format(type(chain_validator).__module__, type(chain_validator).__qualname__),
+         sorted((name, repr(value)) for name, value in vars(type(chain_validator)).items() if name.isupper()))
+        for chain_validator in unroll_chain(validator)]
+    return blake2b(repr(description).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def is_json_native(payload: Any) -> bool:
+    """
+    Returns True if payload is made only of dictionaries with string keys, lists, strings, numbers, booleans and None,
+    i.e. if it is serialized to JSON without any conversion. Tuples and non-string keys are converted by json module,
+    so payloads with them are not JSON-native either.
+
+    :param payload: Payload to check.
+    """
+
+    if payload is None or isinstance(payload, (str, int, float)):
+        return True
+    if isinstance(payload, list):
+        return all(is_json_native(value) for value in payload)
+    if isinstance(payload, dict):
+        return all(isinstance(key, str) and is_json_native(value) for key, value in payload.items())
+    return False
+
+
+def payload_hash(payload: Any) -> str:
+    """
+    Returns stable hash of given payload which does not depend on order of dictionary keys. Raises TypeError if payload
+    is not JSON-native, since different payloads could be serialized the same way otherwise.
+
+    :param payload: Payload to hash.
+    """
+
+    if not is_json_native(payload):
+        raise TypeError("Payload of type {} is not JSON-native.".format(type(payload).__name__))
+    return blake2b(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8"),
+                   digest_size=16).hexdigest()
+
+
+def is_stateful(validator: Any) -> bool:
+    """
+    Returns True if outcome of given validator depends on state of the validator instance: validator is flagged by
+    IS_STATEFUL, e.g. DuplicateBodyValidator, or reads availability index, which chain fingerprint does not cover.
+
+    :param validator: Validator of chain.
+    """
+
+    return getattr(validator, "IS_STATEFUL", False) or getattr(validator, "availability_index", None) is not None
+
+
+class ValidationMemo:
+    """
+    Opt-in memo of validation outcomes keyed by hash of payload and fingerprint of chain. Outcomes of chains made of
+    pure CPU validators are kept until evicted; outcomes of chains with DB-backed or time-dependent validators, e.g.
+    ExpireValidator, expire after short TTL. Chains with stateful validators, e.g. DuplicateBodyValidator or validators
+    with availability index, and payloads which are not JSON-native are never memoized, as well as timeouts and load
+    shedding. The least recently used outcomes are evicted once memo is full.
+    """
+
+    TRANSIENT_EXCEPTIONS: Tuple[type, ...] = (ValidationTimeoutException, ValidationOverloadedException)
+
+    def __init__(self, max_size: int = 10000, db_backed_ttl: float = 5.0, time_dependent_ttl: float = 1.0):
+        self.max_size: int = max_size
+        self.db_backed_ttl: float = db_backed_ttl
+        self.time_dependent_ttl: float = time_dependent_ttl
+        self._outcomes: OrderedDict[Tuple[str, str], Tuple[Optional[Exception], Optional[float]]] = OrderedDict()
+        self._chains: Dict[Tuple[type, ...], Tuple[str, Optional[float]]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.expired: int = 0
+        self.evicted: int = 0
+        self.bypassed: int = 0
+
+    def _describe(self, validator: Any) -> Tuple[str, Optional[float], bool]:
+        """
+        Returns fingerprint of chain, TTL of its outcomes or None if they do not expire, and whether chain is stateful.
+        """
+
+        validators: List[Any] = unroll_chain(validator)
+        chain_types: Tuple[type, ...] = tuple(type(chain_validator) for chain_validator in validators)
+        description: Optional[Tuple[str, Optional[float]]] = self._chains.get(chain_types)
+        if description is None:
+            ttls: List[float] = []
+            if any(getattr(chain_validator, "IS_DB_BACKED", False) for chain_validator in validators):
+                ttls.append(self.db_backed_ttl)
+            if any(getattr(chain_validator, "IS_TIME_DEPENDENT", False) for chain_validator in validators):
+                ttls.append(self.time_dependent_ttl)
+            description = (chain_fingerprint(validator), min(ttls) if ttls else None)
+            self._chains[chain_types] = description
+        fingerprint, ttl = description
+        return fingerprint, ttl, any(is_stateful(chain_validator) for chain_validator in validators)
+
+    @staticmethod
+    def _key(fingerprint: str, payload: Any) -> Optional[Tuple[str, str]]:
+        try:
+            return fingerprint, payload_hash(payload)
+        except TypeError:
+            return None
+
+    def _lookup(self, key: Tuple[str, str]) -> Tuple[bool, Optional[Exception]]:
+        outcome: Optional[Tuple[Optional[Exception], Optional[float]]] = self._outcomes.get(key)
+        if outcome is None:
+            self.misses += 1
+            return False, None
+        exception, expires_at = outcome
+        if expires_at is not None and expires_at <= monotonic():
+            del self._outcomes[key]
+            self.expired += 1
+            self.misses += 1
+            return False, None
+        self._outcomes.move_to_end(key)
+        self.hits += 1
+        return True, exception
+
+    def _store(self, key: Tuple[str, str], exception: Optional[Exception], ttl: Optional[float]) -> None:
+        if isinstance(exception, self.TRANSIENT_EXCEPTIONS):
+            return
+        self._outcomes[key] = (exception, monotonic() + ttl if ttl is not None else None)
+        self._outcomes.move_to_end(key)
+        while len(self._outcomes) > self.max_size:
+            self._outcomes.popitem(last=False)
+            self.evicted += 1
+
+    def validate(self, validator: Any, payload: Any) -> None:
+        """
+        Validates payload by validate method of chain which starts with given validator, replaying memoized outcome
+        if there is one.
+
+        :param validator: The first validator of chain, e.g. AddressValidator or ReviewValidator chain.
+        :param payload: Payload to validate.
+        """
+
+        fingerprint, ttl, is_chain_stateful = self._describe(validator)
+        key: Optional[Tuple[str, str]] = None if is_chain_stateful else self._key(fingerprint, payload)
+        if key is None:
+            self.bypassed += 1
+            validator.validate(payload)
+            return
+
+        is_memoized, exception = self._lookup(key)
+        if not is_memoized:
+            try:
+                validator.validate(payload)
+            except Exception as validation_exception:
+                exception = validation_exception
+            self._store(key, exception, ttl)
+        if exception is not None:
+            raise exception.with_traceback(None)
+
+    async def validate_dictionary(self, validator: Any, payload: Any) -> None:
+        """
+        Validates payload by validate dictionary method of chain which starts with given validator, replaying
+        memoized outcome if there is one.
+
+        :param validator: The first validator of chain, e.g. ProductValidator or UserValidator chain.
+        :param payload: Payload to validate.
+        """
+
+        fingerprint, ttl, is_chain_stateful = self._describe(validator)
+        key: Optional[Tuple[str, str]] = None if is_chain_stateful else self._key(fingerprint, payload)
+        if key is None:
+            self.bypassed += 1
+            await validator.validate_dictionary(payload)
+            return
+
+        is_memoized, exception = self._lookup(key)
+        if not is_memoized:
+            try:
+                await validator.validate_dictionary(payload)
+            except Exception as validation_exception:
+                exception = validation_exception
+            self._store(key, exception, ttl)
+        if exception is not None:
+            raise exception.with_traceback(None)
+
+    def statistics(self) -> Dict[str, Any]:
+        """
+        Returns hit, miss, expiration and eviction counts and hit rate.
+        """
+
+        lookups: int = self.hits + self.misses
+        return {
+            "size": len(self._outcomes),
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "bypassed": self.bypassed,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }